@@ -0,0 +1,105 @@
+"""
+benchmarks.batch
+
+measure the per-row latency of the batch and vectorized paths with increasing batch sizes,
+run it from the repository root,
+
+    python benchmarks/batch.py [--batch-sizes 1 10 100 1000 10000] [--repeat 5] [--output batch.json]
+
+which prints nanoseconds per call and per row, and their throughput of each path and batch size as JSON,
+the vectorized path is skipped when NumPy is not installed
+"""
+import argparse
+import datetime
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import deloreans
+from deloreans import DateGranularity, OffsetGranularity
+from deloreans.parallel import get_many_ordinal
+
+from harness import get_environment, summarize, time_per_call
+
+try:
+    import numpy as np
+    from deloreans import vectorized
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+
+
+BATCH_SIZES = (1, 10, 100, 1000, 10000)
+FIRST_MONTH = datetime.date(2000, 1, 1)
+
+
+def make_rows(batch_size: int) -> Dict[str, List[datetime.date]]:
+    """
+    monthly date ranges of one to three months since 2000-01
+    """
+    start_dates: List[datetime.date] = []
+    end_dates: List[datetime.date] = []
+    for index in range(batch_size):
+        start_date = DateGranularity.MONTHLY.get_end_date(FIRST_MONTH, index % 240 + 1) + datetime.timedelta(days=1)
+        start_dates.append(start_date)
+        end_dates.append(DateGranularity.MONTHLY.get_end_date(start_date, index % 3 + 1))
+    return {'start_dates': start_dates, 'end_dates': end_dates}
+
+
+def get_paths(rows: Dict[str, List[datetime.date]]) -> Dict[str, Callable[[], Any]]:
+    start_dates = rows['start_dates']
+    end_dates = rows['end_dates']
+    comb = (DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)
+    plan = deloreans.compile(*comb)
+    start_ordinals = [start_date.toordinal() for start_date in start_dates]
+    end_ordinals = [end_date.toordinal() for end_date in end_dates]
+    date_ranges = list(zip(start_dates, end_dates))
+    requests = [date_range + comb for date_range in date_ranges]
+
+    paths: Dict[str, Callable[[], Any]] = {
+        'get': lambda: [deloreans.get(start_date, end_date, *comb) for start_date, end_date in date_ranges],
+        'plan': lambda: [plan(start_date, end_date) for start_date, end_date in date_ranges],
+        'get_many': lambda: deloreans.get_many(start_dates, end_dates, *comb),
+        'stream': lambda: list(deloreans.stream(requests)),
+        'validate_many': lambda: deloreans.validate_many(start_dates, end_dates, comb[0], comb[1], comb[2]),
+        'parallel.get_many_ordinal': lambda: get_many_ordinal(start_ordinals, end_ordinals, *comb, max_workers=1),
+    }
+    if HAS_NUMPY:
+        start_datetimes = np.array(start_dates, dtype='datetime64[D]')
+        end_datetimes = np.array(end_dates, dtype='datetime64[D]')
+        paths['vectorized.get'] = lambda: vectorized.get(start_datetimes, end_datetimes, *comb)
+    return paths
+
+
+def run(batch_sizes: Sequence[int], repeat: int, number: Optional[int] = None) -> List[Dict[str, Any]]:
+    report: List[Dict[str, Any]] = []
+    for batch_size in batch_sizes:
+        for path, call in get_paths(make_rows(batch_size)).items():
+            result: Dict[str, Any] = {'case': f'{path}/{batch_size}', 'path': path, 'batch_size': batch_size}
+            result.update(summarize(time_per_call(call, repeat, number)))
+            result['ns_per_row'] = round(result['ns_per_call'] / batch_size, 1)
+            result['rows_per_sec'] = round(result['calls_per_sec'] * batch_size, 1)
+            report.append(result)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='per-row latency of batch and vectorized paths on batch sizes')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=BATCH_SIZES, help='amounts of rows per batch')
+    parser.add_argument('--repeat', type=int, default=5, help='amount of repeats of each case')
+    parser.add_argument('--number', type=int, default=None, help='amount of calls per repeat, calibrated by default')
+    parser.add_argument('--output', default=None, help='path of JSON report, printed when not given')
+    args = parser.parse_args()
+
+    report = json.dumps(
+        {'environment': get_environment(), 'report': run(args.batch_sizes, args.repeat, args.number)},
+        indent=2,
+    )
+    if args.output is None:
+        print(report)
+        return
+    with open(args.output, 'w') as file:
+        file.write(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+"""
+benchmarks.compare
+
+save the latency of every case in 'benchmarks.latency' as a baseline,
+and compare a later run against it, run it from the repository root,
+
+    python benchmarks/compare.py save [--baseline benchmark_report/baseline.json] [--repeat 15]
+    python benchmarks/compare.py check [--baseline benchmark_report/baseline.json] [--threshold 0.1]
+
+each case records the median, p95 and min nanoseconds per call of repeated runs,
+and the bytes allocated per call
+
+a case regresses when its statistic (median-of-N by default, or min-of-N)
+is slower than the baseline by more than both the relative threshold and the noise of the baseline,
+which is the gap between its p95 and median, or when it allocates more than the relative threshold,
+regressed cases are measured again before being reported,
+so that a transient stall of the machine doesn't fail the check
+
+checking prints the comparison of each case as JSON, and exits with 1 when any case regresses
+"""
+import argparse
+import json
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+from harness import get_allocations, get_environment, get_percentile, time_per_call
+from latency import get_call, iter_cases
+
+
+DEFAULT_BASELINE = 'benchmark_report/baseline.json'
+DEFAULT_REPEAT = 15
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_RETRIES = 2
+STATISTICS = ('median', 'min')
+
+
+def measure(call: Callable[[], Any], repeat: int, number: Optional[int] = None) -> Dict[str, float]:
+    ns_per_call = time_per_call(call, repeat, number)
+    result = {
+        'median_ns': round(get_percentile(ns_per_call, 50), 1),
+        'p95_ns': round(get_percentile(ns_per_call, 95), 1),
+        'min_ns': round(min(ns_per_call), 1),
+    }
+    result.update(get_allocations(call))
+    return result
+
+
+def run(repeat: int, number: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+    return {case.name: measure(get_call(case), repeat, number) for case in iter_cases()}
+
+
+def get_regressions(
+    current: Dict[str, float],
+    baseline: Dict[str, float],
+    statistic: str,
+    threshold: float,
+) -> List[str]:
+    """
+    measurements of current run which are significantly worse than the baseline
+    """
+    regressions: List[str] = []
+    key = f'{statistic}_ns'
+    noise = baseline['p95_ns'] - baseline['median_ns']
+    slowdown = current[key] - baseline[key]
+    if slowdown > baseline[key] * threshold and slowdown > noise:
+        regressions.append(key)
+    # allocations are deterministic, which don't need a noise band
+    for key in ('alloc_bytes', 'peak_alloc_bytes'):
+        if current[key] > baseline[key] * (1 + threshold):
+            regressions.append(key)
+    return regressions
+
+
+def compare(
+    baseline: Dict[str, Dict[str, float]],
+    repeat: int,
+    statistic: str,
+    threshold: float,
+    retries: int,
+    number: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    calls = {case.name: get_call(case) for case in iter_cases()}
+    report: List[Dict[str, Any]] = []
+    for name, baseline_result in baseline.items():
+        call = calls.get(name)
+        if call is None:
+            # the case is removed since the baseline
+            report.append({'case': name, 'status': 'missing'})
+            continue
+        current = measure(call, repeat, number)
+        regressions = get_regressions(current, baseline_result, statistic, threshold)
+        for _ in range(retries):
+            if not regressions:
+                break
+            retried = measure(call, repeat, number)
+            current = {key: min(value, retried[key]) for key, value in current.items()}
+            regressions = get_regressions(current, baseline_result, statistic, threshold)
+
+        key = f'{statistic}_ns'
+        report.append({
+            'case': name,
+            'status': 'regressed' if regressions else 'ok',
+            'regressions': regressions,
+            'baseline_ns': baseline_result[key],
+            'current_ns': current[key],
+            'ratio': round(current[key] / baseline_result[key], 3),
+            'baseline_alloc_bytes': baseline_result['alloc_bytes'],
+            'current_alloc_bytes': current['alloc_bytes'],
+        })
+    return report
+
+
+def save(args: argparse.Namespace) -> int:
+    baseline = {
+        'environment': get_environment(),
+        'repeat': args.repeat,
+        'cases': run(args.repeat, args.number),
+    }
+    with open(args.baseline, 'w') as file:
+        json.dump(baseline, file, indent=2)
+    return 0
+
+
+def check(args: argparse.Namespace) -> int:
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    environment = get_environment()
+    if baseline['environment'] != environment:
+        print(
+            f'warning: baseline is measured on {baseline["environment"]}, but current is {environment}',
+            file=sys.stderr,
+        )
+
+    report = compare(baseline['cases'], args.repeat, args.statistic, args.threshold, args.retries, args.number)
+    regressed = [result['case'] for result in report if result['status'] == 'regressed']
+    print(json.dumps(
+        {
+            'statistic': args.statistic,
+            'threshold': args.threshold,
+            'regressed': regressed,
+            'report': report,
+        },
+        indent=2,
+    ))
+    return 1 if regressed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='baseline of deloreans.get latency and regression check against it')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+    for command, func, help_message in (
+        ('save', save, 'measure every case and save them as the baseline'),
+        ('check', check, 'measure every case and compare them with the baseline'),
+    ):
+        subparser = subparsers.add_parser(command, help=help_message)
+        subparser.set_defaults(func=func)
+        subparser.add_argument('--baseline', default=DEFAULT_BASELINE, help='path of baseline JSON')
+        subparser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='amount of repeats of each case')
+        subparser.add_argument('--number', type=int, default=None, help='amount of calls per repeat')
+
+    check_parser = subparsers.choices['check']
+    check_parser.add_argument('--statistic', choices=STATISTICS, default='median', help='statistic of repeats')
+    check_parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='relative slowdown tolerated, e.g. 0.1 is 10%%',
+    )
+    check_parser.add_argument(
+        '--retries',
+        type=int,
+        default=DEFAULT_RETRIES,
+        help='amount of measuring a regressed case again',
+    )
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+benchmarks.harness
+
+timing helpers shared by the benchmarks, built on 'timeit' with 'time.perf_counter',
+each measurement is repeated so that its summary is robust against noise of the machine
+"""
+import platform
+import statistics
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+
+# calibrate the amount of calls per repeat so that each repeat lasts at least this long
+MIN_REPEAT_SECONDS = 0.02
+
+
+def time_per_call(func: Callable[[], Any], repeat: int = 7, number: Optional[int] = None) -> List[float]:
+    """
+    nanoseconds per call of each repeat,
+    the amount of calls per repeat is calibrated when not given
+    """
+    timer = timeit.Timer(func)
+    if number is None:
+        number = calibrate(timer)
+    return [seconds / number * 1e9 for seconds in timer.repeat(repeat=repeat, number=number)]
+
+
+def calibrate(timer: timeit.Timer, min_seconds: float = MIN_REPEAT_SECONDS) -> int:
+    """
+    amount of calls lasting at least given seconds,
+    as same as 'timeit.Timer.autorange' with a shorter duration
+    """
+    number = 1
+    while timer.timeit(number) < min_seconds:
+        number *= 2
+    return number
+
+
+def summarize(ns_per_call: List[float]) -> Dict[str, Any]:
+    """
+    median nanoseconds per call and the throughput of it
+    """
+    median = statistics.median(ns_per_call)
+    return {
+        'ns_per_call': round(median, 1),
+        'calls_per_sec': round(1e9 / median, 1),
+        'repeat': len(ns_per_call),
+    }
+
+
+def get_percentile(values: List[float], percent: float) -> float:
+    """
+    percentile by the nearest rank, e.g. 95 for p95
+    """
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+def get_allocations(func: Callable[[], Any], number: int = 100) -> Dict[str, float]:
+    """
+    bytes allocated by tracemalloc per call,
+    'alloc_bytes' is the memory kept by the results, 'peak_alloc_bytes' includes temporary objects,
+    the first call is excluded which fills the caches
+    """
+    func()
+    holder: List[Any] = [None] * number
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        holder[0] = func()
+        _, peak = tracemalloc.get_traced_memory()
+        for index in range(1, number):
+            holder[index] = func()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        'alloc_bytes': round((after - before) / number, 1),
+        'peak_alloc_bytes': float(peak - before),
+    }
+
+
+def get_environment() -> Dict[str, str]:
+    """
+    environment which the results depend on, which should be identical when comparing them
+    """
+    return {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+    }
@@ -0,0 +1,126 @@
+"""
+benchmarks.latency
+
+measure the latency of 'deloreans.get' on every valid combination of granularities,
+with Monday and Sunday as the first weekday, and with short and multi-year date ranges,
+run it from the repository root,
+
+    python benchmarks/latency.py [--repeat 7] [--output latency.json]
+
+which prints nanoseconds per call and calls per second of each case as JSON
+"""
+import argparse
+import datetime
+import json
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+import deloreans
+from deloreans import DateGranularity, OffsetGranularity
+from deloreans.date_utils import VALID_GRAINS_COMB
+
+from harness import get_environment, summarize, time_per_call
+
+
+FIRSTWEEKDAYS = (0, 6)
+
+# amount of date periods in a short and in a multi-year date range
+RANGE_LENGTHS = {
+    DateGranularity.DAILY: {'short': 1, 'multi_year': 366 * 3},
+    DateGranularity.WEEKLY: {'short': 1, 'multi_year': 52 * 3},
+    DateGranularity.MONTHLY: {'short': 1, 'multi_year': 12 * 3},
+    DateGranularity.YEARLY: {'short': 1, 'multi_year': 3},
+}
+
+# given date ranges start early in the year, which have counterparts in the previous one
+ANCHOR_DATES = {
+    DateGranularity.DAILY: datetime.date(2024, 1, 15),
+    DateGranularity.WEEKLY: datetime.date(2024, 1, 15),
+    DateGranularity.MONTHLY: datetime.date(2024, 2, 1),
+    DateGranularity.YEARLY: datetime.date(2024, 1, 1),
+}
+
+OFFSET = -1
+
+
+class Case(NamedTuple):
+    date_granularity: DateGranularity
+    offset_granularity: OffsetGranularity
+    firstweekday: int
+    range_name: str
+    start_date: datetime.date
+    end_date: datetime.date
+
+    @property
+    def name(self) -> str:
+        return (
+            f'{self.date_granularity.name.lower()}/{self.offset_granularity.name.lower()}'
+            f'/fw{self.firstweekday}/{self.range_name}'
+        )
+
+
+def iter_cases() -> Iterator[Case]:
+    for date_granularity in DateGranularity:
+        for offset_granularity in sorted(VALID_GRAINS_COMB[date_granularity], key=list(OffsetGranularity).index):
+            for firstweekday in FIRSTWEEKDAYS:
+                start_date = get_start_date(date_granularity, firstweekday)
+                for range_name, length in RANGE_LENGTHS[date_granularity].items():
+                    yield Case(
+                        date_granularity,
+                        offset_granularity,
+                        firstweekday,
+                        range_name,
+                        start_date,
+                        date_granularity.get_end_date(start_date, length, firstweekday),
+                    )
+
+
+def get_start_date(date_granularity: DateGranularity, firstweekday: int) -> datetime.date:
+    anchor_date = ANCHOR_DATES[date_granularity]
+    if date_granularity is DateGranularity.WEEKLY:
+        return anchor_date - datetime.timedelta(days=(anchor_date.weekday() - firstweekday) % 7)
+    return anchor_date
+
+
+def get_call(case: Case) -> Callable[[], Any]:
+    get = deloreans.get
+    args = (
+        case.start_date,
+        case.end_date,
+        case.date_granularity,
+        OFFSET,
+        case.offset_granularity,
+        case.firstweekday,
+    )
+    return lambda: get(*args)
+
+
+def run(repeat: int, number: Optional[int] = None) -> List[Dict[str, Any]]:
+    report: List[Dict[str, Any]] = []
+    for case in iter_cases():
+        result = {
+            'case': case.name,
+            'start_date': case.start_date.isoformat(),
+            'end_date': case.end_date.isoformat(),
+        }
+        result.update(summarize(time_per_call(get_call(case), repeat, number)))
+        report.append(result)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='latency of deloreans.get on every combination of granularities')
+    parser.add_argument('--repeat', type=int, default=7, help='amount of repeats of each case')
+    parser.add_argument('--number', type=int, default=None, help='amount of calls per repeat, calibrated by default')
+    parser.add_argument('--output', default=None, help='path of JSON report, printed when not given')
+    args = parser.parse_args()
+
+    report = json.dumps({'environment': get_environment(), 'report': run(args.repeat, args.number)}, indent=2)
+    if args.output is None:
+        print(report)
+        return
+    with open(args.output, 'w') as file:
+        file.write(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+benchmarks.memory
+
+measure the per-object footprint of the request and result types by tracemalloc,
+run it from the repository root,
+
+    python benchmarks/memory.py [--amount 100000]
+
+which prints the average allocated bytes of each type as JSON
+"""
+import argparse
+import datetime
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from deloreans import ComparedRange, DateGranularity, OffsetGranularity
+from deloreans.app import DeLoreans
+from deloreans.date_utils import DatePeriodOffset, DateRange
+
+
+START_DATE = datetime.date(2024, 6, 1)
+END_DATE = datetime.date(2024, 6, 30)
+COMPARED_START_DATE = datetime.date(2023, 6, 1)
+COMPARED_END_DATE = datetime.date(2023, 6, 30)
+
+
+FACTORIES: Dict[str, Callable[[int], Any]] = {
+    'DateRange': lambda i: DateRange(START_DATE, END_DATE, DateGranularity.MONTHLY),
+    'DatePeriodOffset': lambda i: DatePeriodOffset(i, OffsetGranularity.YEARLY),
+    'DeLoreans': lambda i: DeLoreans(START_DATE, END_DATE, DateGranularity.MONTHLY, i, OffsetGranularity.YEARLY),
+    'ComparedRange': lambda i: ComparedRange(COMPARED_START_DATE, COMPARED_END_DATE),
+}
+
+
+def measure(factory: Callable[[int], Any], amount: int) -> float:
+    """
+    average allocated bytes of an object created by factory,
+    the same dates are shared so that only the object itself is counted
+    """
+    holder: List[Any] = [None] * amount
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for i in range(amount):
+            holder[i] = factory(i)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (after - before) / amount
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='per-object footprint of deloreans types')
+    parser.add_argument('--amount', type=int, default=100000, help='amount of objects per type')
+    args = parser.parse_args()
+    report = {name: round(measure(factory, args.amount), 1) for name, factory in FACTORIES.items()}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
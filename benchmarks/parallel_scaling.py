@@ -0,0 +1,68 @@
+"""
+benchmarks.parallel_scaling
+
+measure the throughput of 'deloreans.parallel' with increasing amount of workers,
+run it from the repository root,
+
+    python benchmarks/parallel_scaling.py [--rows 2000000] [--chunk-size 65536] [--max-workers 8]
+
+which prints seconds, rows per second and speedup against a single worker of each amount as JSON,
+the speedup is expected to be near-linear up to the amount of physical cores
+"""
+import argparse
+import datetime
+import json
+import os
+import time
+from typing import Any, Dict, List
+
+from deloreans import DateGranularity, OffsetGranularity
+from deloreans.parallel import DEFAULT_CHUNK_SIZE, get_many_ordinal
+
+
+def make_rows(amount: int) -> Dict[str, List[int]]:
+    """
+    weekly date ranges of one to eight weeks since 2000-01-03, which is Monday
+    """
+    first_monday = datetime.date(2000, 1, 3).toordinal()
+    start_ordinals = [first_monday + 7 * (index % 1000) for index in range(amount)]
+    end_ordinals = [start_ordinal + 7 * (index % 8 + 1) - 1 for index, start_ordinal in enumerate(start_ordinals)]
+    return {'start_ordinals': start_ordinals, 'end_ordinals': end_ordinals}
+
+
+def measure(rows: Dict[str, List[int]], max_workers: int, chunk_size: int) -> float:
+    started = time.perf_counter()
+    get_many_ordinal(
+        rows['start_ordinals'],
+        rows['end_ordinals'],
+        DateGranularity.WEEKLY,
+        -1,
+        OffsetGranularity.PERIODIC,
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+    )
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='scaling of deloreans.parallel on amount of workers')
+    parser.add_argument('--rows', type=int, default=2000000, help='amount of rows')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='amount of rows in each chunk')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1, help='maximum amount of workers')
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    report: List[Dict[str, Any]] = []
+    for max_workers in range(1, args.max_workers + 1):
+        seconds = measure(rows, max_workers, args.chunk_size)
+        report.append({
+            'workers': max_workers,
+            'seconds': round(seconds, 3),
+            'rows_per_second': round(args.rows / seconds),
+            'speedup': round(report[0]['seconds'] / seconds, 2) if report else 1.0,
+        })
+    print(json.dumps({'rows': args.rows, 'chunk_size': args.chunk_size, 'cpu_count': os.cpu_count(), 'report': report}, indent=2))  # NOQA
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,11 @@
-from .api import get  # NOQA
+from .api import compile, get, get_many, get_offsets, get_ordinal, stream  # NOQA
+from .batch import ComparisonBatch  # NOQA
+from .cache import CachedGet  # NOQA
+from .plan import ComparisonPlan  # NOQA
+from .validation import ErrorCode, validate_many  # NOQA
 from .date_utils.date_granularity import DateGranularity  # NOQA
+from .date_utils.calendar import Calendar  # NOQA
+from .date_utils.date_range import ComparedRange  # NOQA
 from .date_utils.offset_granularity import OffsetGranularity  # NOQA
+from .date_utils.overflow_policy import OverflowPolicy  # NOQA
+from .date_utils.period import Period  # NOQA
@@ -0,0 +1,247 @@
+"""
+deloreans.aio
+
+This module provides the DeLoreans API as coroutines for asyncio services,
+which yield to the event loop between micro-batches,
+or offload the computation to an executor when given
+"""
+import asyncio
+import datetime
+import weakref
+from concurrent.futures import Executor
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    overload,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    TypeVar,
+    Union,
+)
+
+from .api import (
+    _get_many_of_rows,
+    _normalize_request,
+    DEFAULT_BATCH_SIZE,
+    ERRORS_RAISE,
+    get,
+    validate_batch_size,
+    validate_errors,
+)
+from .cache import _make_key
+from .date_utils import _as_column, _strict_zip, ComparedRange, DateGranularity, OffsetGranularity
+from .date_utils.calendar import Calendar
+from .date_utils.overflow_policy import get_overflow_policy, OverflowPolicy
+
+if TYPE_CHECKING:
+    from .date_utils.overflow_policy import NonNullOverflowPolicy
+
+
+T = TypeVar('T')
+Request = Union[Sequence[Any], Mapping[str, Any]]
+
+
+# computations in flight of each event loop, keyed by their normalized arguments and the types of them
+_IN_FLIGHT: 'MutableMapping[asyncio.AbstractEventLoop, Dict[Any, asyncio.Future]]' = weakref.WeakKeyDictionary()
+
+
+@overload
+async def aget(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar] = ...,
+    overflow: 'NonNullOverflowPolicy' = ...,
+    executor: Optional[Executor] = ...,
+) -> ComparedRange:
+    ...
+
+
+@overload
+async def aget(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar] = ...,
+    overflow: Union[OverflowPolicy, str] = ...,
+    executor: Optional[Executor] = ...,
+) -> Optional[ComparedRange]:
+    ...
+
+
+async def aget(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar] = 0,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+    executor: Optional[Executor] = None,
+) -> Optional[ComparedRange]:
+    """
+    'deloreans.api.get' as a coroutine,
+    which runs in given executor when provided, otherwise in the event loop directly
+
+    awaiters on identical arguments share the computation in flight
+
+    Args:
+        executor (Executor | None): executor to run the computation, e.g. 'ProcessPoolExecutor'
+        others are as same as 'deloreans.api.get'
+    """
+    args = (start_date, end_date, date_granularity, offset, offset_granularity, firstweekday, overflow)
+    if executor is None:
+        return get(*args)
+    loop = asyncio.get_running_loop()
+    return await _coalesce(_make_key(*args), lambda: loop.run_in_executor(executor, get, *args))
+
+
+async def aget_many(
+    start_dates: Sequence[datetime.date],
+    end_dates: Sequence[datetime.date],
+    date_granularities: Union[DateGranularity, Sequence[DateGranularity]],
+    offsets: Union[int, Sequence[int]],
+    offset_granularities: Union[OffsetGranularity, Sequence[OffsetGranularity]],
+    firstweekdays: Union[int, Calendar, Sequence[Union[int, Calendar]]] = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    executor: Optional[Executor] = None,
+    errors: str = ERRORS_RAISE,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+) -> List[Optional[ComparedRange]]:
+    """
+    'deloreans.api.get_many' as a coroutine, which processes given rows by micro-batches
+
+    Args:
+        batch_size (int): amount of rows in each micro-batch
+        executor (Executor | None): executor to run each micro-batch, e.g. 'ProcessPoolExecutor'
+        others are as same as 'deloreans.api.get_many'
+    """
+    validate_batch_size(batch_size)
+    validate_errors(errors)
+    overflow = get_overflow_policy(overflow)
+    size = len(start_dates)
+    rows = _strict_zip(
+        start_dates,
+        end_dates,
+        _as_column(date_granularities, size),
+        _as_column(offsets, size),
+        _as_column(offset_granularities, size),
+        _as_column(firstweekdays, size),
+    )
+    results: List[Optional[ComparedRange]] = []
+    async for batch in _iter_batches(rows, batch_size):
+        results.extend(await _get_batch(batch, executor, errors, overflow))
+    return results
+
+
+async def astream(
+    requests: Union[Iterable[Request], AsyncIterable[Request]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    executor: Optional[Executor] = None,
+    errors: str = ERRORS_RAISE,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+) -> AsyncIterator[Optional[ComparedRange]]:
+    """
+    'deloreans.api.stream' as an asynchronous iterator,
+    requests are consumed from either an iterable or an asynchronous iterable
+
+    Args:
+        requests (Iterable | AsyncIterable): requests, each is the positional or keyword arguments of 'get'
+        batch_size (int): amount of requests in each micro-batch
+        executor (Executor | None): executor to run each micro-batch, e.g. 'ProcessPoolExecutor'
+        errors (str): handling of invalid requests, refer to 'deloreans.api.get_many'
+        overflow (OverflowPolicy | str): handling of the start date without counterpart in compared date period
+
+    Yields:
+        compared_date_range (ComparedRange | None): compared start and end dates of each request
+    """
+    validate_batch_size(batch_size)
+    validate_errors(errors)
+    overflow = get_overflow_policy(overflow)
+    async for batch in _iter_batches(requests, batch_size, _normalize_request):
+        for compared_date_range in await _get_batch(batch, executor, errors, overflow):
+            yield compared_date_range
+
+
+async def _iter_batches(
+    items: Union[Iterable[Any], AsyncIterable[Any]],
+    batch_size: int,
+    normalize: Callable[[Any], Tuple[Any, ...]] = tuple,
+) -> AsyncIterator[List[Tuple[Any, ...]]]:
+    if isinstance(items, AsyncIterable):
+        batch: List[Tuple[Any, ...]] = []
+        async for item in items:
+            batch.append(normalize(item))
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+        return
+
+    iterator = iter(items)
+    while True:
+        batch = [normalize(item) for item in islice(iterator, batch_size)]
+        if not batch:
+            return
+        yield batch
+
+
+async def _get_batch(
+    batch: List[Tuple[Any, ...]],
+    executor: Optional[Executor],
+    errors: str,
+    overflow: OverflowPolicy,
+) -> List[Optional[ComparedRange]]:
+    """
+    compare a micro-batch of normalized rows,
+    awaiters on an identical micro-batch share the computation in flight
+    """
+    if executor is None:
+        results = _get_many_of_rows(batch, errors, overflow)
+        # give way to the other tasks before the next micro-batch
+        await asyncio.sleep(0)
+        return results
+    loop = asyncio.get_running_loop()
+    key = (errors, overflow) + tuple(_make_key(*row) for row in batch)
+    return await _coalesce(key, lambda: loop.run_in_executor(executor, _get_many_of_rows, batch, errors, overflow))
+
+
+async def _coalesce(key: Any, compute: Callable[[], Awaitable[T]]) -> T:
+    """
+    await the computation in flight with the same key, or start a new one,
+    which is shielded so that cancelling one awaiter doesn't cancel the others
+    """
+    try:
+        hash(key)
+    except TypeError:
+        # unhashable arguments, which can't be shared
+        return await compute()
+
+    in_flight = _IN_FLIGHT.setdefault(asyncio.get_running_loop(), {})
+    future = in_flight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(compute())
+        in_flight[key] = future
+
+        def _discard(done: asyncio.Future) -> None:
+            if in_flight.get(key) is done:
+                del in_flight[key]
+
+        future.add_done_callback(_discard)
+    return await asyncio.shield(future)
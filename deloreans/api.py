@@ -4,10 +4,95 @@ deloreans.api
 This module implements the DeLoreans API
 """
 import datetime
-from typing import Tuple
+from itertools import islice
+from time import perf_counter_ns
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    overload,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
-from .app import DeLoreans
-from .date_utils import DateGranularity, OffsetGranularity
+from . import instrumentation, metrics
+from .app import (
+    DeLoreans,
+    get_compared_date_range,
+    get_compared_ordinal_range,
+    get_offset_ordinal_range,
+    get_stage_funcs,
+    measure_ordinal_range,
+    StageFuncs,
+)
+from .date_utils import _as_column, _strict_zip, ComparedRange, DateGranularity, DateRange, OffsetGranularity
+from .date_utils.calendar import Calendar, get_calendar
+from .date_utils.overflow_policy import get_overflow_policy, OverflowPolicy
+from .date_utils.date_range import (
+    validate_date_granularity_type,
+    validate_date_relativity,
+    validate_date_type,
+)
+from .date_utils.offset_granularity import (
+    validate_offset,
+    validate_offset_granularity_type,
+)
+from .date_utils.ordinal import (
+    validate_ordinal,
+    validate_ordinal_date_completion,
+    validate_ordinal_relativity,
+)
+from .exceptions import (
+    INVALID_BATCH_SIZE_ERROR_MSG,
+    INVALID_DATA_TYPE_TEMPLATE,
+    INVALID_ERRORS_TEMPLATE,
+)
+from .plan import ComparisonPlan
+from .validation import ErrorCode, validate_many
+
+if TYPE_CHECKING:
+    from .date_utils.overflow_policy import NonNullOverflowPolicy
+
+
+# amount of requests in each micro-batch when streaming
+DEFAULT_BATCH_SIZE = 1024
+
+
+# handling of invalid rows in a batch
+ERRORS_RAISE = 'raise'
+ERRORS_NULL = 'null'
+
+
+@overload
+def get(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar] = ...,
+    overflow: 'NonNullOverflowPolicy' = ...,
+) -> ComparedRange:
+    ...
+
+
+@overload
+def get(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar] = ...,
+    overflow: Union[OverflowPolicy, str] = ...,
+) -> Optional[ComparedRange]:
+    ...
 
 
 def get(
@@ -16,8 +101,9 @@ def get(
     date_granularity: DateGranularity,
     offset: int,
     offset_granularity: OffsetGranularity,
-    firstweekday: int = 0,
-) -> Tuple[datetime.date, datetime.date]:
+    firstweekday: Union[int, Calendar] = 0,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+) -> Optional[ComparedRange]:
     """
     provide compared date range according to given parameters
 
@@ -27,12 +113,31 @@ def get(
         date_granularity (DateGranularity): granularity of date range, e.g. daily, weekly
         offset (int): away from given date range, to the future when positive
         offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
-        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+        firstweekday (int | Calendar): define the start date's weekday of week, 0 is Monday, 6 is Sunday,
+                                       or the calendar of it, whose cached week boundaries are reused
+        overflow (OverflowPolicy | str): handling of the start date without counterpart in compared date period,
+                                         'raise', 'clamp' to the last period, 'rollover' or 'null'
 
     Returns:
         compared_start_date (datetime.date): start date of compared date range
         compared_end_date (datetime.date): end date of compared date range
+        or None when it doesn't exist and overflow policy is null
     """
+    if (
+        instrumentation._tracer is not None
+        or instrumentation._slow_call_log is not None
+        or metrics._metrics is not None
+    ):
+        return _get_instrumented(
+            start_date,
+            end_date,
+            date_granularity,
+            offset,
+            offset_granularity,
+            firstweekday,
+            overflow,
+        )
+
     component = DeLoreans(
         start_date,
         end_date,
@@ -41,4 +146,560 @@ def get(
         offset_granularity,
         firstweekday,
     )
-    return component.get()
+    return component.get(overflow)
+
+
+def _get_instrumented(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar],
+    overflow: Union[OverflowPolicy, str],
+) -> Optional[ComparedRange]:
+    """
+    'get' reporting to the registered tracer, the enabled slow call log and counters,
+    refer to 'deloreans.instrumentation' and 'deloreans.metrics'
+    """
+    tracer = instrumentation._tracer
+    slow_call_log = instrumentation._slow_call_log
+    traces: List[instrumentation.Trace] = []
+    started = perf_counter_ns()
+    try:
+        component = DeLoreans(
+            start_date,
+            end_date,
+            date_granularity,
+            offset,
+            offset_granularity,
+            firstweekday,
+        )
+        if slow_call_log is not None:
+            # the trace is kept for the stage breakdown of slow call
+            compared_date_range = component.get_traced(overflow, perf_counter_ns() - started, traces.append)
+        elif tracer is not None:
+            compared_date_range = component.get_traced(overflow, perf_counter_ns() - started, tracer)
+        else:
+            compared_date_range = component.get(overflow)
+    except Exception as err:
+        registry = metrics._metrics
+        if registry is not None:
+            registry.record_error(
+                date_granularity,
+                offset_granularity,
+                err,
+                _get_error_code(
+                    [start_date],
+                    [end_date],
+                    [date_granularity],
+                    [offset],
+                    [offset_granularity],
+                    [firstweekday],
+                ),
+            )
+        raise
+    duration_ns = perf_counter_ns() - started
+
+    registry = metrics._metrics
+    if registry is not None:
+        if compared_date_range is None:
+            registry.record_overflow(date_granularity, offset_granularity)
+        else:
+            registry.record_call(date_granularity, offset_granularity, duration_ns)
+    if slow_call_log is not None:
+        trace = traces[0]
+        if tracer is not None:
+            tracer(trace)
+        if duration_ns > slow_call_log.threshold_ns:
+            slow_call_log.log(
+                'get',
+                {
+                    'start_date': start_date,
+                    'end_date': end_date,
+                    'date_granularity': date_granularity,
+                    'offset': offset,
+                    'offset_granularity': offset_granularity,
+                    'firstweekday': firstweekday,
+                    'overflow': overflow,
+                },
+                date_granularity,
+                offset_granularity,
+                duration_ns,
+                durations=trace.durations,
+            )
+    return compared_date_range
+
+
+def get_ordinal(
+    start_ordinal: int,
+    end_ordinal: int,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar] = 0,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+) -> Optional[Tuple[int, int]]:
+    """
+    provide compared date range according to given parameters,
+    dates are represented by proleptic Gregorian ordinals (see 'datetime.date.toordinal')
+
+    Args:
+        start_ordinal (int): ordinal of start date of date range
+        end_ordinal (int): ordinal of end date of date range
+        date_granularity (DateGranularity): granularity of date range, e.g. daily, weekly
+        offset (int): away from given date range, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int | Calendar): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+        overflow (OverflowPolicy | str): handling of the start date without counterpart in compared date period
+
+    Returns:
+        compared_start_ordinal (int): ordinal of start date of compared date range
+        compared_end_ordinal (int): ordinal of end date of compared date range
+        or None when it doesn't exist and overflow policy is null
+    """
+    overflow = get_overflow_policy(overflow)
+    calendar = get_calendar(firstweekday)
+    validate_ordinal(start_ordinal)
+    validate_ordinal(end_ordinal)
+    validate_ordinal_relativity(start_ordinal, end_ordinal)
+    validate_date_granularity_type(date_granularity)
+    validate_ordinal_date_completion(start_ordinal, end_ordinal, date_granularity, calendar.firstweekday)
+    validate_offset(offset)
+    validate_offset_granularity_type(offset_granularity)
+    stage_funcs = get_stage_funcs(date_granularity, offset_granularity)
+
+    compared_ordinal_range = get_compared_ordinal_range(
+        start_ordinal,
+        end_ordinal,
+        date_granularity,
+        offset,
+        offset_granularity,
+        calendar,
+        stage_funcs,
+        overflow,
+    )
+    if compared_ordinal_range is None:
+        return None
+    compared_start_ordinal, compared_end_ordinal = compared_ordinal_range
+    validate_ordinal(compared_start_ordinal)
+    validate_ordinal(compared_end_ordinal)
+    return compared_start_ordinal, compared_end_ordinal
+
+
+def get_offsets(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offsets: Iterable[int],
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar] = 0,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.NULL,
+) -> Iterator[Optional[ComparedRange]]:
+    """
+    provide compared date ranges of given date range with each of offsets,
+    e.g. same period in each of the last N years with 'range(-1, -N - 1, -1)'
+
+    the given date range is validated, and its index and length are computed once,
+    then the compared date ranges are provided in the order of offsets
+
+    Args:
+        start_date (datetime.date): start date of date range
+        end_date (datetime.date): end date of date range
+        date_granularity (DateGranularity): granularity of date range, e.g. daily, weekly
+        offsets (Iterable[int]): each is away from given date range, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int | Calendar): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+        overflow (OverflowPolicy | str): handling of the start date without counterpart in compared date period,
+                                         which is null by default so that one offset doesn't abort the others
+
+    Yields:
+        compared_date_range (ComparedRange | None): compared start and end dates,
+                                                    None when no start date as same as the given one
+                                                    in compared date period and overflow policy is null
+    """
+    overflow = get_overflow_policy(overflow)
+    calendar = get_calendar(firstweekday)
+    date_range = DateRange(
+        start_date,
+        end_date,
+        date_granularity,
+        calendar.firstweekday,
+    )
+    validate_offset_granularity_type(offset_granularity)
+    stage_funcs = get_stage_funcs(date_granularity, offset_granularity)
+    return _iter_offsets(
+        date_range.start_date.toordinal(),
+        date_range.end_date.toordinal(),
+        date_granularity,
+        offsets,
+        offset_granularity,
+        calendar,
+        stage_funcs,
+        overflow,
+    )
+
+
+def _iter_offsets(
+    start_ordinal: int,
+    end_ordinal: int,
+    date_granularity: DateGranularity,
+    offsets: Iterable[int],
+    offset_granularity: OffsetGranularity,
+    calendar: Calendar,
+    stage_funcs: StageFuncs,
+    overflow: OverflowPolicy,
+) -> Iterator[Optional[ComparedRange]]:
+    """
+    compared date ranges of given offsets, the stages independent of offset are measured once
+    """
+    start_period_index, given_date_range_length = measure_ordinal_range(
+        start_ordinal,
+        end_ordinal,
+        date_granularity,
+        calendar,
+        stage_funcs,
+    )
+    for offset in offsets:
+        validate_offset(offset)
+        compared_ordinal_range = get_offset_ordinal_range(
+            start_ordinal,
+            start_period_index,
+            given_date_range_length,
+            date_granularity,
+            offset,
+            offset_granularity,
+            calendar,
+            stage_funcs,
+            overflow,
+        )
+        if compared_ordinal_range is None:
+            yield None
+            continue
+        compared_start_ordinal, compared_end_ordinal = compared_ordinal_range
+        yield ComparedRange(
+            datetime.date.fromordinal(compared_start_ordinal),
+            datetime.date.fromordinal(compared_end_ordinal),
+        )
+
+
+def compile(
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar] = 0,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+) -> ComparisonPlan:
+    """
+    validate the parameters except date range once,
+    and provide a reusable plan which is called with date range
+
+    Args:
+        date_granularity (DateGranularity): granularity of date range, e.g. daily, weekly
+        offset (int): away from given date range, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int | Calendar): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+        overflow (OverflowPolicy | str): handling of the start date without counterpart in compared date period
+
+    Returns:
+        plan (ComparisonPlan): callable as 'plan(start_date, end_date)',
+                               which provides the same compared date range as 'get'
+    """
+    return ComparisonPlan(
+        date_granularity,
+        offset,
+        offset_granularity,
+        firstweekday,
+        overflow,
+    )
+
+
+def get_many(
+    start_dates: Sequence[datetime.date],
+    end_dates: Sequence[datetime.date],
+    date_granularities: Union[DateGranularity, Sequence[DateGranularity]],
+    offsets: Union[int, Sequence[int]],
+    offset_granularities: Union[OffsetGranularity, Sequence[OffsetGranularity]],
+    firstweekdays: Union[int, Calendar, Sequence[Union[int, Calendar]]] = 0,
+    errors: str = ERRORS_RAISE,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+) -> List[Optional[ComparedRange]]:
+    """
+    provide compared date ranges of a batch, in the order of given rows
+
+    rows are grouped by (date_granularity, offset_granularity, firstweekday),
+    so that validation on the group and resolution of stage functions happen once per group,
+    and identical rows are only computed once
+
+    Args:
+        start_dates (Sequence[datetime.date]): start dates of date ranges
+        end_dates (Sequence[datetime.date]): end dates of date ranges
+        date_granularities (DateGranularity | Sequence[DateGranularity]): granularities of date ranges,
+                                                                          single one is applied to all rows
+        offsets (int | Sequence[int]): offsets away from date ranges, single one is applied to all rows
+        offset_granularities (OffsetGranularity | Sequence[OffsetGranularity]): granularities of offset periods,
+                                                                                single one is applied to all rows
+        firstweekdays (int | Calendar | Sequence[int | Calendar]): start weekdays of week, or calendars of them,
+                                                                   single one is applied to all rows
+        errors (str): 'raise' on the first invalid row,
+                      or 'null' to provide None for invalid rows and rows without compared date range,
+                      which are flagged by 'deloreans.validate_many' without raising
+        overflow (OverflowPolicy | str): handling of the start date without counterpart in compared date period,
+                                         applied to all rows
+
+    Returns:
+        compared_date_ranges (List[ComparedRange | None]): compared start and end dates of each row
+    """
+    validate_errors(errors)
+    overflow = get_overflow_policy(overflow)
+    size = len(start_dates)
+    error_codes = None
+    if errors == ERRORS_NULL:
+        error_codes = validate_many(
+            start_dates,
+            end_dates,
+            date_granularities,
+            offsets,
+            offset_granularities,
+            firstweekdays,
+        )
+    columns = _strict_zip(
+        start_dates,
+        end_dates,
+        _as_column(date_granularities, size),
+        _as_column(offsets, size),
+        _as_column(offset_granularities, size),
+        _as_column(firstweekdays, size),
+    )
+
+    started = perf_counter_ns()
+    try:
+        results = _get_many_of_columns(columns, error_codes, overflow)
+    except Exception as err:
+        registry = metrics._metrics
+        if registry is not None:
+            # the combination is only known when it is shared by all rows
+            registry.record_error(
+                date_granularities,
+                offset_granularities,
+                err,
+                _get_error_code(
+                    start_dates,
+                    end_dates,
+                    date_granularities,
+                    offsets,
+                    offset_granularities,
+                    firstweekdays,
+                ),
+            )
+        raise
+    registry = metrics._metrics
+    if registry is not None:
+        registry.record_batch(
+            _as_column(date_granularities, size),
+            _as_column(offset_granularities, size),
+            results,
+            error_codes,
+        )
+    instrumentation._log_slow_batch(
+        'get_many',
+        {
+            'start_dates': start_dates,
+            'end_dates': end_dates,
+            'date_granularities': date_granularities,
+            'offsets': offsets,
+            'offset_granularities': offset_granularities,
+            'firstweekdays': firstweekdays,
+            'errors': errors,
+            'overflow': overflow,
+        },
+        date_granularities,
+        offset_granularities,
+        started,
+        size,
+    )
+    return results
+
+
+def _get_error_code(
+    start_dates: Sequence[datetime.date],
+    end_dates: Sequence[datetime.date],
+    date_granularities: Union[DateGranularity, Sequence[DateGranularity]],
+    offsets: Union[int, Sequence[int]],
+    offset_granularities: Union[OffsetGranularity, Sequence[OffsetGranularity]],
+    firstweekdays: Union[int, Calendar, Sequence[Union[int, Calendar]]],
+) -> ErrorCode:
+    """
+    error code of the first invalid row of a failed call, which is the reason counted by 'deloreans.metrics',
+    'ErrorCode.OK' when all rows are valid, or the arguments can't even be validated
+    """
+    try:
+        error_codes = validate_many(
+            start_dates,
+            end_dates,
+            date_granularities,
+            offsets,
+            offset_granularities,
+            firstweekdays,
+        )
+    except Exception:
+        return ErrorCode.OK
+    return ErrorCode(next((error_code for error_code in error_codes if error_code), ErrorCode.OK))
+
+
+def _get_many_of_columns(
+    columns: Iterable[Tuple[Any, ...]],
+    error_codes: Optional[Sequence[int]],
+    overflow: OverflowPolicy,
+) -> List[Optional[ComparedRange]]:
+    """
+    compared date ranges of rows in 'get_many',
+    rows are only validated when they aren't flagged by error codes
+    """
+    groups: Dict[Tuple[Any, ...], Tuple[StageFuncs, Calendar]] = {}
+    computed: Dict[Tuple[Tuple[type, ...], Tuple[Any, ...]], Optional[ComparedRange]] = {}
+    results: List[Optional[ComparedRange]] = []
+    for index, row in enumerate(columns):
+        if error_codes is not None and error_codes[index]:
+            results.append(None)
+            continue
+        # types are involved since invalid '-1.0' is equal to valid '-1'
+        row_key = (tuple(map(type, row)), row)
+        try:
+            compared_date_range = computed[row_key]
+        except KeyError:
+            start_date, end_date, date_granularity, offset, offset_granularity, firstweekday = row
+            group_key = (
+                type(date_granularity), date_granularity,
+                type(offset_granularity), offset_granularity,
+                type(firstweekday), firstweekday,
+            )
+            group = groups.get(group_key)
+            if group is None:
+                calendar = get_calendar(firstweekday)
+                validate_date_granularity_type(date_granularity)
+                validate_offset_granularity_type(offset_granularity)
+                group = groups[group_key] = (get_stage_funcs(date_granularity, offset_granularity), calendar)
+            stage_funcs, calendar = group
+
+            if error_codes is None:
+                validate_date_type(start_date)
+                validate_date_type(end_date)
+                validate_date_relativity(start_date, end_date)
+                validate_ordinal_date_completion(
+                    start_date.toordinal(),
+                    end_date.toordinal(),
+                    date_granularity,
+                    calendar.firstweekday,
+                )
+                validate_offset(offset)
+            try:
+                compared_date_range = get_compared_date_range(
+                    start_date,
+                    end_date,
+                    date_granularity,
+                    offset,
+                    offset_granularity,
+                    calendar,
+                    stage_funcs,
+                    overflow,
+                )
+            except (ValueError, OverflowError):
+                # no compared date range, or it is out of the range of 'datetime.date'
+                if error_codes is None:
+                    raise
+                compared_date_range = None
+            computed[row_key] = compared_date_range
+        results.append(compared_date_range)
+    return results
+
+
+def stream(
+    requests: Iterable[Union[Sequence[Any], Mapping[str, Any]]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    errors: str = ERRORS_RAISE,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+) -> Iterator[Optional[ComparedRange]]:
+    """
+    lazily provide compared date ranges of given requests in the same order,
+    which are consumed and processed by micro-batches with 'get_many',
+    so that the memory is bounded by the batch size whatever the amount of requests
+
+    Args:
+        requests (Iterable[Sequence | Mapping]): any iterable of requests,
+                                                 each is the positional or keyword arguments of 'get'
+        batch_size (int): amount of requests in each micro-batch
+        errors (str): handling of invalid requests, refer to 'get_many'
+        overflow (OverflowPolicy | str): handling of the start date without counterpart in compared date period
+
+    Yields:
+        compared_date_range (ComparedRange | None): compared start and end dates of each request
+    """
+    validate_batch_size(batch_size)
+    validate_errors(errors)
+    overflow = get_overflow_policy(overflow)
+    iterator = iter(requests)
+    while True:
+        batch = [_normalize_request(request) for request in islice(iterator, batch_size)]
+        if not batch:
+            return
+        yield from _get_many_of_rows(batch, errors, overflow)
+
+
+def validate_errors(errors: str) -> None:
+    if errors not in (ERRORS_RAISE, ERRORS_NULL):
+        raise ValueError(INVALID_ERRORS_TEMPLATE.format(errors=errors, options=(ERRORS_RAISE, ERRORS_NULL)))
+
+
+def validate_batch_size(batch_size: int) -> None:
+    if not isinstance(batch_size, int):
+        raise TypeError(
+            INVALID_DATA_TYPE_TEMPLATE.format(
+                input_args=batch_size,
+                input_dtype=type(batch_size),
+                dtype=int,
+            )
+        )
+    if batch_size < 1:
+        raise ValueError(INVALID_BATCH_SIZE_ERROR_MSG)
+
+
+def _get_many_of_rows(
+    batch: List[Tuple[Any, ...]],
+    errors: str = ERRORS_RAISE,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+) -> List[Optional[ComparedRange]]:
+    """
+    'get_many' on rows of normalized arguments
+    """
+    start_dates, end_dates, date_granularities, offsets, offset_granularities, firstweekdays = zip(*batch)
+    return get_many(
+        start_dates,
+        end_dates,
+        date_granularities,
+        offsets,
+        offset_granularities,
+        firstweekdays,
+        errors,
+        overflow,
+    )
+
+
+def _normalize_request(request: Union[Sequence[Any], Mapping[str, Any]]) -> Tuple[Any, ...]:
+    """
+    arguments of 'get' in a request, as a tuple of positional ones
+    """
+    if isinstance(request, Mapping):
+        return _get_arguments(**request)
+    return _get_arguments(*request)
+
+
+def _get_arguments(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar] = 0,
+) -> Tuple[Any, ...]:
+    return start_date, end_date, date_granularity, offset, offset_granularity, firstweekday
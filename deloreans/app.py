@@ -4,16 +4,23 @@ deloreans.app
 This module provides a component 'DeLoreans' on core logic
 """
 import datetime
-from typing import Tuple
+from time import perf_counter_ns
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, overload, Tuple, TYPE_CHECKING, Union
 
+from . import instrumentation
 from .date_utils import (
-    common as common_date_utils,
+    ComparedRange,
     DateGranularity,
     DateRange,
     DatePeriodOffset,
     OffsetGranularity,
     VALID_GRAINS_COMB,
 )
+from .date_utils import ordinal as ordinal_date_utils
+from .date_utils.immutable import _Immutable
+from .date_utils.calendar import Calendar, get_calendar
+from .date_utils.overflow_policy import get_overflow_policy, OverflowPolicy
 from .date_utils.common import (
     GET_BASE_INDEX_FUNC_TEMPLATE,
     GET_COMPARED_LOCATED_PERIOD_FUNC_TEMPLATE,
@@ -22,12 +29,319 @@ from .date_utils.common import (
 from .exceptions import (
     IndexOverflowError,
     START_DATE_OVERFLOW_ERROR_MSG,
+    StartDateOverflowError,
     UNREGISTERED_DATE_GRANULARITY_TEMPLATE,
     UNREGISTERED_GRANULARITY_COMBO_TEMPLATE,
 )
 
+if TYPE_CHECKING:
+    from .date_utils.overflow_policy import NonNullOverflowPolicy
 
-class DeLoreans:
+
+# stage functions of core logic, in the order of
+# (get start period index, get compared located period start date, get compared start date)
+StageFuncs = Tuple[
+    Callable[[int, Calendar], int],
+    Callable[[int, int, Calendar], int],
+    Callable[[int, int, Calendar, OverflowPolicy], Optional[int]],
+]
+
+
+def validate_grain_comb(
+    date_granularity: DateGranularity,
+    offset_granularity: OffsetGranularity,
+) -> None:
+    if date_granularity not in VALID_GRAINS_COMB:
+        raise ValueError(
+            UNREGISTERED_DATE_GRANULARITY_TEMPLATE.format(
+                date_granularity=date_granularity,
+            )
+        )
+    valid_offset_granularity = VALID_GRAINS_COMB[date_granularity]
+    if offset_granularity not in valid_offset_granularity:
+        raise ValueError(
+            UNREGISTERED_GRANULARITY_COMBO_TEMPLATE.format(
+                offset_granularity=offset_granularity,
+                date_granularity=date_granularity,
+            )
+        )
+
+
+def register_stage_funcs(
+    module: ModuleType,
+) -> Dict[Tuple[DateGranularity, OffsetGranularity], Tuple[Any, Any, Any]]:
+    """
+    resolve the stage functions from given module for every valid granularity combination,
+    the function names are declared by the templates in 'common' module
+
+    when offset granularity is periodic,
+    given date range itself is the location so that the date granularity is used
+    """
+    registry: Dict[Tuple[DateGranularity, OffsetGranularity], Tuple[Any, Any, Any]] = {}
+    for date_granularity, valid_offset_granularity in VALID_GRAINS_COMB.items():
+        date_grain_name = date_granularity.name.lower()
+        for offset_granularity in valid_offset_granularity:
+            if offset_granularity == OffsetGranularity.PERIODIC:
+                offset_grain_name = date_grain_name
+            else:
+                offset_grain_name = offset_granularity.name.lower()
+
+            names = {
+                'date_granularity_name': date_grain_name,
+                'offset_granularity_name': offset_grain_name,
+            }
+            try:
+                registry[(date_granularity, offset_granularity)] = (
+                    getattr(module, GET_BASE_INDEX_FUNC_TEMPLATE.format(**names)),
+                    getattr(module, GET_COMPARED_LOCATED_PERIOD_FUNC_TEMPLATE.format(**names)),
+                    getattr(module, GET_DATE_WITH_INDEX_FUNC_TEMPLATE.format(**names)),
+                )
+            except AttributeError:
+                raise NotImplementedError(
+                    UNREGISTERED_GRANULARITY_COMBO_TEMPLATE.format(
+                        offset_granularity=offset_granularity,
+                        date_granularity=date_granularity,
+                    )
+                )
+    return registry
+
+
+# integer kernels resolved at import time, so that an unimplemented combination fails on registration
+STAGE_FUNCS_REGISTRY: Dict[Tuple[DateGranularity, OffsetGranularity], StageFuncs] = \
+    register_stage_funcs(ordinal_date_utils)
+
+
+def get_stage_funcs(
+    date_granularity: DateGranularity,
+    offset_granularity: OffsetGranularity,
+) -> StageFuncs:
+    """
+    look up the stage functions of granularity combination,
+    raise the same error as 'validate_grain_comb' when the combination is unsupported
+    """
+    try:
+        return STAGE_FUNCS_REGISTRY[(date_granularity, offset_granularity)]
+    except (KeyError, TypeError):
+        validate_grain_comb(date_granularity, offset_granularity)
+        raise
+
+
+def get_compared_ordinal_range(
+    start_ordinal: int,
+    end_ordinal: int,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    calendar: Calendar,
+    stage_funcs: StageFuncs,
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+    timestamps: Optional[List[int]] = None,
+) -> Optional[Tuple[int, int]]:
+    """
+    core logic on validated parameters with resolved stage functions,
+    dates are represented by proleptic Gregorian ordinals,
+    refer to 'DeLoreans.get' for the detailed steps
+
+    None when there is no start date as same as the given one in compared date period
+    and overflow policy is null
+
+    Args:
+        timestamps (List[int] | None): 'perf_counter_ns' is appended after each stage when given,
+                                       refer to 'get_traced_compared_date_range'
+    """
+    start_period_index, given_date_range_length = measure_ordinal_range(
+        start_ordinal,
+        end_ordinal,
+        date_granularity,
+        calendar,
+        stage_funcs,
+        timestamps,
+    )
+    return get_offset_ordinal_range(
+        start_ordinal,
+        start_period_index,
+        given_date_range_length,
+        date_granularity,
+        offset,
+        offset_granularity,
+        calendar,
+        stage_funcs,
+        overflow,
+        timestamps,
+    )
+
+
+def measure_ordinal_range(
+    start_ordinal: int,
+    end_ordinal: int,
+    date_granularity: DateGranularity,
+    calendar: Calendar,
+    stage_funcs: StageFuncs,
+    timestamps: Optional[List[int]] = None,
+) -> Tuple[int, int]:
+    """
+    stages of 'get_compared_ordinal_range' independent of offset,
+    which are the index of the start period in offset-granularity-unit date period,
+    and the length of given date range
+    """
+    start_period_index = stage_funcs[0](start_ordinal, calendar)
+    if timestamps is not None:
+        timestamps.append(perf_counter_ns())
+    given_date_range_length = ordinal_date_utils.DATE_GRANULARITY_FUNCS[date_granularity][2](
+        start_ordinal,
+        end_ordinal,
+        calendar.firstweekday,
+    )
+    if timestamps is not None:
+        timestamps.append(perf_counter_ns())
+    return start_period_index, given_date_range_length
+
+
+def get_offset_ordinal_range(
+    start_ordinal: int,
+    start_period_index: int,
+    given_date_range_length: int,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    calendar: Calendar,
+    stage_funcs: StageFuncs,
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+    timestamps: Optional[List[int]] = None,
+) -> Optional[Tuple[int, int]]:
+    """
+    stages of 'get_compared_ordinal_range' on the offset,
+    with the ones measured by 'measure_ordinal_range', which are shared among offsets
+    """
+    _, get_located_period_start_date, get_date_with_index = stage_funcs
+    if offset_granularity is OffsetGranularity.PERIODIC:
+        offset = int(offset * given_date_range_length)
+    base_start_ordinal = get_located_period_start_date(start_ordinal, offset, calendar)
+    if timestamps is not None:
+        timestamps.append(perf_counter_ns())
+    try:
+        compared_start_ordinal = get_date_with_index(
+            base_start_ordinal,
+            start_period_index,
+            calendar,
+            overflow,
+        )
+    except IndexOverflowError:
+        raise StartDateOverflowError(START_DATE_OVERFLOW_ERROR_MSG)
+    if timestamps is not None:
+        timestamps.append(perf_counter_ns())
+    if compared_start_ordinal is None:
+        return None
+
+    get_end_date = ordinal_date_utils.DATE_GRANULARITY_FUNCS[date_granularity][3]
+    return compared_start_ordinal, get_end_date(compared_start_ordinal, given_date_range_length)
+
+
+def get_compared_date_range(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    calendar: Calendar,
+    stage_funcs: StageFuncs,
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+    timestamps: Optional[List[int]] = None,
+) -> Optional[ComparedRange]:
+    """
+    'get_compared_ordinal_range' on dates,
+    which are only converted from and to ordinals here
+    """
+    start_ordinal = start_date.toordinal()
+    end_ordinal = end_date.toordinal()
+    if timestamps is not None:
+        timestamps.append(perf_counter_ns())
+    compared_ordinal_range = get_compared_ordinal_range(
+        start_ordinal,
+        end_ordinal,
+        date_granularity,
+        offset,
+        offset_granularity,
+        calendar,
+        stage_funcs,
+        overflow,
+        timestamps,
+    )
+    if compared_ordinal_range is None:
+        return None
+    compared_start_ordinal, compared_end_ordinal = compared_ordinal_range
+    return ComparedRange(
+        datetime.date.fromordinal(compared_start_ordinal),
+        datetime.date.fromordinal(compared_end_ordinal),
+    )
+
+
+def get_traced_compared_date_range(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    calendar: Calendar,
+    stage_funcs: StageFuncs,
+    overflow: Union[OverflowPolicy, str],
+    validation_ns: int = 0,
+    tracer: Optional[instrumentation.Tracer] = None,
+) -> Optional[ComparedRange]:
+    """
+    'get_compared_date_range' timing each stage, whose trace is passed to given tracer,
+    or the registered one when not given, refer to 'deloreans.instrumentation'
+
+    Args:
+        validation_ns (int): duration of validating the parameters before,
+                             which is added with the one of validating overflow policy
+        tracer (Callable[[Trace], None] | None): callback on the trace
+    """
+    started = perf_counter_ns()
+    timestamps = [started]
+    compared_date_range = get_compared_date_range(
+        start_date,
+        end_date,
+        date_granularity,
+        offset,
+        offset_granularity,
+        calendar,
+        stage_funcs,
+        get_overflow_policy(overflow),
+        timestamps,
+    )
+    ended = perf_counter_ns()
+    _, validated, indexed, measured, located, compared = timestamps
+
+    if tracer is None:
+        tracer = instrumentation.get_tracer()
+    if tracer is not None:
+        tracer(instrumentation.Trace(
+            date_granularity,
+            offset_granularity,
+            {
+                instrumentation.STAGE_VALIDATION: validation_ns + validated - started,
+                instrumentation.STAGE_START_PERIOD_INDEX: indexed - validated,
+                instrumentation.STAGE_DATE_RANGE_LENGTH: measured - indexed,
+                instrumentation.STAGE_COMPARED_LOCATED_PERIOD_START_DATE: located - measured,
+                instrumentation.STAGE_COMPARED_START_DATE: compared - located,
+                instrumentation.STAGE_END_DATE: ended - compared,
+            },
+        ))
+    return compared_date_range
+
+
+class DeLoreans(_Immutable):
+    """
+    immutable comparison on a date range,
+    which is equal to another one with the same parameters
+    """
+
+    __slots__ = ('_date_range', '_date_period_offset', '_calendar', '_stage_funcs')
+    _date_range: DateRange
+    _date_period_offset: DatePeriodOffset
+    _calendar: Calendar
+    _stage_funcs: StageFuncs
 
     def __init__(
         self,
@@ -36,113 +350,58 @@ class DeLoreans:
         date_granularity: DateGranularity,
         offset: int,
         offset_granularity: OffsetGranularity,
-        firstweekday: int = 0,
+        firstweekday: Union[int, Calendar] = 0,
     ) -> None:
-        self._date_range = DateRange(
+        calendar = get_calendar(firstweekday)
+        date_range = DateRange(
             start_date,
             end_date,
             date_granularity,
-            firstweekday,
+            calendar.firstweekday,
         )
-        self._date_period_offset = DatePeriodOffset(offset, offset_granularity)
-        self._validate_grain_comb()
-        self._date_grain_name = date_granularity.name.lower()
-        self._offset_grain_name = offset_granularity.name.lower()
-
-    def _validate_grain_comb(self) -> None:
-        date_granularity = self._date_range.date_granularity
-        offset_granularity = self._date_period_offset.offset_granularity
-        if date_granularity not in VALID_GRAINS_COMB:
-            raise ValueError(
-                UNREGISTERED_DATE_GRANULARITY_TEMPLATE.format(
-                    date_granularity=date_granularity,
-                )
-            )
-        valid_offset_granularity = VALID_GRAINS_COMB[date_granularity]
-        if offset_granularity not in valid_offset_granularity:
-            raise ValueError(
-                UNREGISTERED_GRANULARITY_COMBO_TEMPLATE.format(
-                    offset_granularity=offset_granularity,
-                    date_granularity=date_granularity,
-                )
-            )
+        date_period_offset = DatePeriodOffset(offset, offset_granularity)
+        object.__setattr__(self, '_date_range', date_range)
+        object.__setattr__(self, '_date_period_offset', date_period_offset)
+        object.__setattr__(self, '_calendar', calendar)
+        object.__setattr__(self, '_stage_funcs', get_stage_funcs(date_granularity, offset_granularity))
 
-    def _get_start_period_index(self) -> int:
-        if self._date_period_offset.offset_granularity == OffsetGranularity.PERIODIC:
-            offset_grain_name = self._date_grain_name
-        else:
-            offset_grain_name = self._offset_grain_name
-
-        try:
-            func = getattr(
-                common_date_utils,
-                GET_BASE_INDEX_FUNC_TEMPLATE.format(
-                    date_granularity_name=self._date_grain_name,
-                    offset_granularity_name=offset_grain_name,
-                )
-            )
-        except AttributeError:
-            raise NotImplementedError
-        return func(
-            self._date_range.start_date,
-            firstweekday=self._date_range.firstweekday,
-        )
+    @property
+    def date_range(self) -> DateRange:
+        return self._date_range
 
-    def _get_compared_located_period_start_date(self) -> datetime.date:
-        if self._date_period_offset.offset_granularity == OffsetGranularity.PERIODIC:
-            offset_grain_name = self._date_grain_name
-            given_date_range_length = self._date_range.date_granularity.get_date_range_length(
-                self._date_range.start_date,
-                self._date_range.end_date,
-            )
-            offset = int(self._date_period_offset.offset * given_date_range_length)
-        else:
-            offset_grain_name = self._offset_grain_name
-            offset = self._date_period_offset.offset
-
-        try:
-            func = getattr(
-                common_date_utils,
-                GET_COMPARED_LOCATED_PERIOD_FUNC_TEMPLATE.format(
-                    date_granularity_name=self._date_grain_name,
-                    offset_granularity_name=offset_grain_name,
-                )
-            )
-        except AttributeError:
-            raise NotImplementedError
-        return func(
+    @property
+    def date_period_offset(self) -> DatePeriodOffset:
+        return self._date_period_offset
+
+    @property
+    def calendar(self) -> Calendar:
+        return self._calendar
+
+    def _key(self) -> Tuple[Any, ...]:
+        return self._date_range, self._date_period_offset
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (
             self._date_range.start_date,
-            offset,
-            firstweekday=self._date_range.firstweekday,
+            self._date_range.end_date,
+            self._date_range.date_granularity,
+            self._date_period_offset.offset,
+            self._date_period_offset.offset_granularity,
+            self._calendar,
         )
 
-    def _get_compared_start_date(
-        self,
-        located_period_start_date: datetime.date,
-        period_index: int,
-    ) -> datetime.date:
-        if self._date_period_offset.offset_granularity == OffsetGranularity.PERIODIC:
-            offset_grain_name = self._date_grain_name
-        else:
-            offset_grain_name = self._offset_grain_name
-
-        try:
-            func = getattr(
-                common_date_utils,
-                GET_DATE_WITH_INDEX_FUNC_TEMPLATE.format(
-                    date_granularity_name=self._date_grain_name,
-                    offset_granularity_name=offset_grain_name,
-                )
-            )
-        except AttributeError:
-            raise NotImplementedError
-        return func(
-            located_period_start_date,
-            period_index,
-            firstweekday=self._date_range.firstweekday,
-        )
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._date_range!r}, {self._date_period_offset!r})'
 
-    def get(self) -> Tuple[datetime.date, datetime.date]:
+    @overload
+    def get(self, overflow: 'NonNullOverflowPolicy' = ...) -> ComparedRange:
+        ...
+
+    @overload
+    def get(self, overflow: Union[OverflowPolicy, str] = ...) -> Optional[ComparedRange]:
+        ...
+
+    def get(self, overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE) -> Optional[ComparedRange]:
         """
         1. get the start date of compared date range
            1.1 get the index of given date range's start period in offset-granularity-unit date period
@@ -153,27 +412,42 @@ class DeLoreans:
            2.1 get the length of given date range
            2.2 get the end date away from compared date range's start date with above length
                as compared date range's end date
-        """
-        start_period_index = self._get_start_period_index()
-        base_start_date = self._get_compared_located_period_start_date()
-        try:
-            compared_start_date = self._get_compared_start_date(
-                base_start_date,
-                start_period_index,
-            )
-        except IndexOverflowError:
-            raise ValueError(START_DATE_OVERFLOW_ERROR_MSG)
 
-        date_granularity = self._date_range.date_granularity
-        given_date_range_length = date_granularity.get_date_range_length(
+        when there is no start date as same as the given one in compared date period,
+        it is handled by overflow policy, e.g. raise, clamp, rollover or null
+        """
+        if instrumentation._tracer is not None:
+            return self.get_traced(overflow)
+        return get_compared_date_range(
             self._date_range.start_date,
             self._date_range.end_date,
-            self._date_range.firstweekday,
-        )
-        compared_end_date = date_granularity.get_end_date(
-            compared_start_date,
-            given_date_range_length,
-            self._date_range.firstweekday
+            self._date_range.date_granularity,
+            self._date_period_offset.offset,
+            self._date_period_offset.offset_granularity,
+            self._calendar,
+            self._stage_funcs,
+            get_overflow_policy(overflow),
         )
 
-        return compared_start_date, compared_end_date
+    def get_traced(
+        self,
+        overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+        validation_ns: int = 0,
+        tracer: Optional[instrumentation.Tracer] = None,
+    ) -> Optional[ComparedRange]:
+        """
+        'get' timing each stage for given tracer, or the registered one when not given,
+        refer to 'deloreans.instrumentation'
+        """
+        return get_traced_compared_date_range(
+            self._date_range.start_date,
+            self._date_range.end_date,
+            self._date_range.date_granularity,
+            self._date_period_offset.offset,
+            self._date_period_offset.offset_granularity,
+            self._calendar,
+            self._stage_funcs,
+            overflow,
+            validation_ns,
+            tracer,
+        )
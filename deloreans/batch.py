@@ -0,0 +1,548 @@
+"""
+deloreans.batch
+
+This module provides 'ComparisonBatch', a struct-of-arrays container of compared date ranges,
+where each column is a contiguous 'array.array' of raw machine values instead of a list of Python objects,
+
+    start ordinals, end ordinals, compared start ordinals, compared end ordinals and statuses
+
+columns are exposed as memoryviews for zero-copy handoff, e.g. 'numpy.frombuffer(batch.start_ordinals, numpy.int32)',
+and 'datetime.date' is only created on element access
+"""
+import datetime
+from array import array
+from time import perf_counter_ns
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union, overload
+
+from . import instrumentation
+from .api import ERRORS_NULL, ERRORS_RAISE, validate_errors
+from .app import get_compared_ordinal_range, get_stage_funcs, StageFuncs
+from .columns import NULL_ORDINAL, ORDINAL_TYPECODE, pack_column, pack_dates, validate_ordinal_column
+from .date_utils import _as_column, _strict_zip, ComparedRange, DateGranularity, OffsetGranularity
+from .date_utils.calendar import Calendar, get_calendar
+from .date_utils.date_range import validate_date_granularity_type
+from .date_utils.immutable import _Immutable
+from .date_utils.offset_granularity import validate_offset, validate_offset_granularity_type
+from .date_utils.overflow_policy import get_overflow_policy, OverflowPolicy
+from .date_utils.ordinal import (
+    MAX_ORDINAL,
+    MIN_ORDINAL,
+    validate_ordinal,
+    validate_ordinal_date_completion,
+    validate_ordinal_relativity,
+)
+from .exceptions import (
+    INCONSISTENT_COLUMN_LENGTH_TEMPLATE,
+    INVALID_BATCH_COLUMN_TEMPLATE,
+
+)
+from .validation import ERROR_CODE_TYPECODE, ErrorCode, get_combo_error_code, get_ordinal_row_error_code
+
+
+# name and typecode of each column, in the order of constructor's arguments
+COLUMNS = (
+    ('start_ordinals', ORDINAL_TYPECODE),
+    ('end_ordinals', ORDINAL_TYPECODE),
+    ('compared_start_ordinals', ORDINAL_TYPECODE),
+    ('compared_end_ordinals', ORDINAL_TYPECODE),
+    ('statuses', ERROR_CODE_TYPECODE),
+)
+COLUMN_NAMES = tuple(name for name, _ in COLUMNS)
+
+
+# stage functions and calendar of a valid granularity combination, or error code of an invalid one
+Group = Union[Tuple[StageFuncs, Calendar], ErrorCode]
+
+
+class ComparisonBatch(_Immutable):
+    """
+    immutable batch of compared date ranges stored as columns,
+    dates are proleptic Gregorian ordinals of 4 bytes and statuses are 'ErrorCode' of 1 byte,
+    which is about 17 bytes per row instead of the Python objects of dates and tuples
+
+    element access provides the same value as 'deloreans.api.get_many' does,
+    i.e. 'ComparedRange' of the row, or None when the row is invalid or has no compared date range,
+    while slicing, sorting and filtering provide another batch without creating any 'datetime.date'
+
+    Args:
+        start_ordinals (Iterable[int]): start ordinals of given date ranges
+        end_ordinals (Iterable[int]): end ordinals of given date ranges
+        compared_start_ordinals (Iterable[int]): start ordinals of compared date ranges, 'NULL_ORDINAL' when absent
+        compared_end_ordinals (Iterable[int]): end ordinals of compared date ranges, 'NULL_ORDINAL' when absent
+        statuses (Iterable[int] | None): 'ErrorCode' of each row, all rows are 'ErrorCode.OK' when None
+
+    every column is copied into the batch, so the batch never shares memory with given columns
+    """
+
+    __slots__ = (
+        '_start_ordinals',
+        '_end_ordinals',
+        '_compared_start_ordinals',
+        '_compared_end_ordinals',
+        '_statuses',
+    )
+    _start_ordinals: 'array[int]'
+    _end_ordinals: 'array[int]'
+    _compared_start_ordinals: 'array[int]'
+    _compared_end_ordinals: 'array[int]'
+    _statuses: 'array[int]'
+
+    def __init__(
+        self,
+        start_ordinals: Iterable[int],
+        end_ordinals: Iterable[int],
+        compared_start_ordinals: Iterable[int],
+        compared_end_ordinals: Iterable[int],
+        statuses: Optional[Iterable[int]] = None,
+    ) -> None:
+        columns = [
+            _copy_ordinals(column)
+            for column in (start_ordinals, end_ordinals, compared_start_ordinals, compared_end_ordinals)
+        ]
+        size = len(columns[0])
+        columns.append(array(ERROR_CODE_TYPECODE, bytes(size)) if statuses is None else _copy_statuses(statuses))
+        for column in columns:
+            if len(column) != size:
+                raise ValueError(INCONSISTENT_COLUMN_LENGTH_TEMPLATE.format(length=len(column), size=size))
+        for name, column in zip(COLUMN_NAMES, columns):
+            object.__setattr__(self, f'_{name}', column)
+
+    @classmethod
+    def from_dates(
+        cls,
+        start_dates: Sequence[datetime.date],
+        end_dates: Sequence[datetime.date],
+        date_granularities: Union[DateGranularity, Sequence[DateGranularity]],
+        offsets: Union[int, Sequence[int]],
+        offset_granularities: Union[OffsetGranularity, Sequence[OffsetGranularity]],
+        firstweekdays: Union[int, Calendar, Sequence[Union[int, Calendar]]] = 0,
+        errors: str = ERRORS_RAISE,
+        overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+    ) -> 'ComparisonBatch':
+        """
+        compare a batch with the same arguments as 'deloreans.api.get_many',
+        while compared date ranges are kept as columns of ordinals
+
+        with errors='null', invalid rows are flagged in statuses instead of raising,
+        and the compared ordinals of invalid rows and rows without compared date range are 'NULL_ORDINAL'
+        """
+        started = perf_counter_ns()
+        validate_errors(errors)
+        overflow = get_overflow_policy(overflow)
+        size = len(start_dates)
+        _validate_length(end_dates, size)
+        statuses = array(ERROR_CODE_TYPECODE, bytes(size))
+        if errors == ERRORS_NULL:
+            start_ordinals = _pack_nullable_dates(start_dates, statuses)
+            end_ordinals = _pack_nullable_dates(end_dates, statuses)
+        else:
+            start_ordinals = pack_dates(start_dates)
+            end_ordinals = pack_dates(end_dates)
+        batch = _compare(
+            start_ordinals,
+            end_ordinals,
+            date_granularities,
+            offsets,
+            offset_granularities,
+            firstweekdays,
+            statuses,
+            errors == ERRORS_RAISE,
+            overflow,
+        )
+        instrumentation._log_slow_batch(
+            'ComparisonBatch.from_dates',
+            {
+                'start_dates': start_dates,
+                'end_dates': end_dates,
+                'date_granularities': date_granularities,
+                'offsets': offsets,
+                'offset_granularities': offset_granularities,
+                'firstweekdays': firstweekdays,
+                'errors': errors,
+                'overflow': overflow,
+            },
+            date_granularities,
+            offset_granularities,
+            started,
+            size,
+        )
+        return batch
+
+    @classmethod
+    def from_ordinals(
+        cls,
+        start_ordinals: Sequence[int],
+        end_ordinals: Sequence[int],
+        date_granularities: Union[DateGranularity, Sequence[DateGranularity]],
+        offsets: Union[int, Sequence[int]],
+        offset_granularities: Union[OffsetGranularity, Sequence[OffsetGranularity]],
+        firstweekdays: Union[int, Calendar, Sequence[Union[int, Calendar]]] = 0,
+        errors: str = ERRORS_RAISE,
+        overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+    ) -> 'ComparisonBatch':
+        """
+        as same as 'from_dates' while dates are represented by proleptic Gregorian ordinals,
+        so that no 'datetime.date' is ever created
+        """
+        started = perf_counter_ns()
+        validate_errors(errors)
+        overflow = get_overflow_policy(overflow)
+        size = len(start_ordinals)
+        _validate_length(end_ordinals, size)
+        statuses = array(ERROR_CODE_TYPECODE, bytes(size))
+        if errors == ERRORS_NULL:
+            start_column = _pack_nullable_ordinals(start_ordinals, statuses)
+            end_column = _pack_nullable_ordinals(end_ordinals, statuses)
+        else:
+            start_column = pack_column(ORDINAL_TYPECODE, start_ordinals, validate_ordinal)
+            end_column = pack_column(ORDINAL_TYPECODE, end_ordinals, validate_ordinal)
+        batch = _compare(
+            start_column,
+            end_column,
+            date_granularities,
+            offsets,
+            offset_granularities,
+            firstweekdays,
+            statuses,
+            errors == ERRORS_RAISE,
+            overflow,
+        )
+        instrumentation._log_slow_batch(
+            'ComparisonBatch.from_ordinals',
+            {
+                'start_ordinals': start_ordinals,
+                'end_ordinals': end_ordinals,
+                'date_granularities': date_granularities,
+                'offsets': offsets,
+                'offset_granularities': offset_granularities,
+                'firstweekdays': firstweekdays,
+                'errors': errors,
+                'overflow': overflow,
+            },
+            date_granularities,
+            offset_granularities,
+            started,
+            size,
+        )
+        return batch
+
+    @property
+    def start_ordinals(self) -> memoryview:
+        return _as_readonly(self._start_ordinals)
+
+    @property
+    def end_ordinals(self) -> memoryview:
+        return _as_readonly(self._end_ordinals)
+
+    @property
+    def compared_start_ordinals(self) -> memoryview:
+        return _as_readonly(self._compared_start_ordinals)
+
+    @property
+    def compared_end_ordinals(self) -> memoryview:
+        return _as_readonly(self._compared_end_ordinals)
+
+    @property
+    def statuses(self) -> memoryview:
+        return _as_readonly(self._statuses)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        bytes of the columns
+        """
+        return sum(column.itemsize * len(column) for column in self._key())
+
+    def _key(self) -> Tuple['array[int]', ...]:
+        return (
+            self._start_ordinals,
+            self._end_ordinals,
+            self._compared_start_ordinals,
+            self._compared_end_ordinals,
+            self._statuses,
+        )
+
+    def __len__(self) -> int:
+        return len(self._start_ordinals)
+
+    @overload
+    def __getitem__(self, index: int) -> Optional[ComparedRange]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'ComparisonBatch':
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return self.__class__(*(column[index] for column in self._key()))
+        compared_start_ordinal = self._compared_start_ordinals[index]
+        if compared_start_ordinal == NULL_ORDINAL:
+            return None
+        return ComparedRange(
+            datetime.date.fromordinal(compared_start_ordinal),
+            datetime.date.fromordinal(self._compared_end_ordinals[index]),
+        )
+
+    def __iter__(self) -> Iterator[Optional[ComparedRange]]:
+        fromordinal = datetime.date.fromordinal
+        for compared_start_ordinal, compared_end_ordinal in zip(
+            self._compared_start_ordinals,
+            self._compared_end_ordinals,
+        ):
+            if compared_start_ordinal == NULL_ORDINAL:
+                yield None
+            else:
+                yield ComparedRange(fromordinal(compared_start_ordinal), fromordinal(compared_end_ordinal))
+
+    def take(self, indexes: Iterable[int]) -> 'ComparisonBatch':
+        """
+        batch of the rows at given indexes, in the given order
+        """
+        indexes = list(indexes)
+        return self.__class__(
+            *(array(column.typecode, [column[index] for index in indexes]) for column in self._key())
+        )
+
+    def filter(self, mask: Iterable[Any]) -> 'ComparisonBatch':
+        """
+        batch of the rows whose mask is truthy, mask should be as long as the batch
+
+            batch.filter(status == ErrorCode.OK for status in batch.statuses)
+        """
+        return self.take(index for index, keep in _strict_zip(range(len(self)), mask) if keep)
+
+    def sorted_by(self, column_name: str = 'start_ordinals', reverse: bool = False) -> 'ComparisonBatch':
+        """
+        batch of the rows stably sorted by the values of given column
+
+        Args:
+            column_name (str): one of 'COLUMN_NAMES'
+            reverse (bool): in descending order when True
+        """
+        if column_name not in COLUMN_NAMES:
+            raise ValueError(INVALID_BATCH_COLUMN_TEMPLATE.format(column_name=column_name, options=COLUMN_NAMES))
+        column = getattr(self, f'_{column_name}')
+        return self.take(sorted(range(len(self)), key=column.__getitem__, reverse=reverse))
+
+    # columns are too large to be hashed
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(<{len(self)} rows>)'
+
+
+def _compare(
+    start_ordinals: 'array[int]',
+    end_ordinals: 'array[int]',
+    date_granularities: Union[DateGranularity, Sequence[DateGranularity]],
+    offsets: Union[int, Sequence[int]],
+    offset_granularities: Union[OffsetGranularity, Sequence[OffsetGranularity]],
+    firstweekdays: Union[int, Calendar, Sequence[Union[int, Calendar]]],
+    statuses: 'array[int]',
+    is_raised: bool,
+    overflow: OverflowPolicy,
+) -> ComparisonBatch:
+    """
+    compare packed columns in the process,
+    invalid rows raise when 'is_raised' is True, otherwise they are flagged in statuses,
+    where the rows already flagged while packing are skipped
+    """
+    size = len(start_ordinals)
+    groups: Dict[Tuple[Any, ...], Group] = {}
+    compared_start_ordinals = array(ORDINAL_TYPECODE)
+    compared_end_ordinals = array(ORDINAL_TYPECODE)
+    for index, (start_ordinal, end_ordinal, date_granularity, offset, offset_granularity, firstweekday) in enumerate(
+        _strict_zip(
+            start_ordinals,
+            end_ordinals,
+            _as_column(date_granularities, size),
+            _as_column(offsets, size),
+            _as_column(offset_granularities, size),
+            _as_column(firstweekdays, size),
+        )
+    ):
+        compared_ordinal_range = None
+        if not statuses[index]:
+            # types are involved since invalid '0.0' is equal to valid '0'
+            combo = (date_granularity, offset_granularity, type(firstweekday), firstweekday)
+            try:
+                group = groups.get(combo)
+            except TypeError:
+                # unhashable, which is never a valid combination
+                group = _resolve_group(date_granularity, offset_granularity, firstweekday, is_raised)
+            if group is None:
+                group = groups[combo] = _resolve_group(
+                    date_granularity,
+                    offset_granularity,
+                    firstweekday,
+                    is_raised,
+                )
+            if isinstance(group, ErrorCode):
+                statuses[index] = group
+            else:
+                stage_funcs, calendar = group
+                if is_raised:
+                    validate_ordinal(start_ordinal)
+                    validate_ordinal(end_ordinal)
+                    validate_ordinal_relativity(start_ordinal, end_ordinal)
+                    validate_ordinal_date_completion(
+                        start_ordinal,
+                        end_ordinal,
+                        date_granularity,
+                        calendar.firstweekday,
+                    )
+                    validate_offset(offset)
+                    error_code = ErrorCode.OK
+                else:
+                    error_code = get_ordinal_row_error_code(
+                        start_ordinal,
+                        end_ordinal,
+                        date_granularity,
+                        offset,
+                        calendar.firstweekday,
+                    )
+                if error_code is not ErrorCode.OK:
+                    statuses[index] = error_code
+                else:
+                    compared_ordinal_range = _get_compared_ordinal_range(
+                        start_ordinal,
+                        end_ordinal,
+                        date_granularity,
+                        offset,
+                        offset_granularity,
+                        calendar,
+                        stage_funcs,
+                        overflow,
+                        is_raised,
+                    )
+        if compared_ordinal_range is None:
+            compared_start_ordinals.append(NULL_ORDINAL)
+            compared_end_ordinals.append(NULL_ORDINAL)
+        else:
+            compared_start_ordinals.append(compared_ordinal_range[0])
+            compared_end_ordinals.append(compared_ordinal_range[1])
+    return ComparisonBatch(start_ordinals, end_ordinals, compared_start_ordinals, compared_end_ordinals, statuses)
+
+
+def _resolve_group(
+    date_granularity: DateGranularity,
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar],
+    is_raised: bool,
+) -> Group:
+    """
+    validate a granularity combination once,
+    which is flagged by error code instead of raising when 'is_raised' is False
+    """
+    if not is_raised:
+        error_code = get_combo_error_code(
+            date_granularity,
+            offset_granularity,
+            firstweekday.firstweekday if isinstance(firstweekday, Calendar) else firstweekday,
+        )
+        if error_code is not ErrorCode.OK:
+            return error_code
+    calendar = get_calendar(firstweekday)
+    validate_date_granularity_type(date_granularity)
+    validate_offset_granularity_type(offset_granularity)
+    return get_stage_funcs(date_granularity, offset_granularity), calendar
+
+
+def _get_compared_ordinal_range(
+    start_ordinal: int,
+    end_ordinal: int,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    calendar: Calendar,
+    stage_funcs: StageFuncs,
+    overflow: OverflowPolicy,
+    is_raised: bool,
+) -> Optional[Tuple[int, int]]:
+    """
+    compared ordinal range of a valid row, which should be in the range of 'datetime.date',
+    None instead of raising when there is no compared date range and 'is_raised' is False
+    """
+    try:
+        compared_ordinal_range = get_compared_ordinal_range(
+            start_ordinal,
+            end_ordinal,
+            date_granularity,
+            offset,
+            offset_granularity,
+            calendar,
+            stage_funcs,
+            overflow,
+        )
+        if compared_ordinal_range is not None:
+            validate_ordinal(compared_ordinal_range[0])
+            validate_ordinal(compared_ordinal_range[1])
+    except (ValueError, OverflowError):
+        if is_raised:
+            raise
+        return None
+    return compared_ordinal_range
+
+
+def _copy_ordinals(column: Iterable[int]) -> 'array[int]':
+    """
+    copy ordinals into a new column, every ordinal should be 'NULL_ORDINAL' or stand for a valid 'datetime.date'
+    """
+    copied = pack_column(ORDINAL_TYPECODE, column, validate_ordinal)
+    validate_ordinal_column(copied)
+    return copied
+
+
+def _copy_statuses(column: Iterable[int]) -> 'array[int]':
+    """
+    copy statuses into a new column, every status should be 'ErrorCode'
+    """
+    copied = pack_column(ERROR_CODE_TYPECODE, column, ErrorCode)
+    for status in set(copied):
+        ErrorCode(status)
+    return copied
+
+
+def _as_readonly(column: 'array[int]') -> memoryview:
+    view = memoryview(column)
+    # 'memoryview.toreadonly' is new in python 3.8
+    if hasattr(view, 'toreadonly'):
+        return view.toreadonly()
+    return view
+
+
+def _validate_length(column: Sequence[Any], size: int) -> None:
+    if len(column) != size:
+        raise ValueError(INCONSISTENT_COLUMN_LENGTH_TEMPLATE.format(length=len(column), size=size))
+
+
+def _pack_nullable_dates(dates: Sequence[datetime.date], statuses: 'array[int]') -> 'array[int]':
+    """
+    pack dates into ordinals, the rows of invalid dates are 'NULL_ORDINAL' and flagged in statuses
+    """
+    column = array(ORDINAL_TYPECODE)
+    for index, a_date in enumerate(dates):
+        if isinstance(a_date, datetime.date):
+            column.append(a_date.toordinal())
+        else:
+            column.append(NULL_ORDINAL)
+            statuses[index] = ErrorCode.INVALID_TYPE
+    return column
+
+
+def _pack_nullable_ordinals(ordinals: Sequence[int], statuses: 'array[int]') -> 'array[int]':
+    """
+    pack ordinals, the rows of invalid ordinals are 'NULL_ORDINAL' and flagged in statuses
+    """
+    column = array(ORDINAL_TYPECODE)
+    for index, ordinal in enumerate(ordinals):
+        if not isinstance(ordinal, int):
+            column.append(NULL_ORDINAL)
+            statuses[index] = ErrorCode.INVALID_TYPE
+        elif not MIN_ORDINAL <= ordinal <= MAX_ORDINAL:
+            column.append(NULL_ORDINAL)
+            statuses[index] = ErrorCode.INVALID_DATE_RANGE
+        else:
+            column.append(ordinal)
+    return column
@@ -0,0 +1,187 @@
+"""
+deloreans.cache
+
+This module provides an opt-in memoization layer on the DeLoreans API
+"""
+import datetime
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional, overload, Tuple, TYPE_CHECKING, Union
+
+from . import metrics
+from .api import get
+from .date_utils import ComparedRange, DateGranularity, OffsetGranularity
+from .date_utils.calendar import Calendar
+from .date_utils.overflow_policy import get_overflow_policy, OverflowPolicy
+from .exceptions import INVALID_DATA_TYPE_TEMPLATE, INVALID_CACHE_SIZE_ERROR_MSG
+
+if TYPE_CHECKING:
+    from .date_utils.overflow_policy import NonNullOverflowPolicy
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+def _make_key(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar] = 0,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+) -> Tuple[Any, ...]:
+    """
+    normalize the arguments of 'deloreans.api.get' whether they are positional or keyword,
+    the type of dates is involved since 'datetime.datetime' is also accepted,
+    and the ones of offset and first weekday since invalid '-1.0' is equal to valid '-1'
+    """
+    try:
+        overflow = get_overflow_policy(overflow)
+    except ValueError:
+        # kept as it is, so that the call raises
+        pass
+    return (
+        type(start_date),
+        start_date,
+        type(end_date),
+        end_date,
+        date_granularity,
+        type(offset),
+        offset,
+        offset_granularity,
+        type(firstweekday),
+        firstweekday,
+        overflow,
+    )
+
+
+def _copy_error(error: BaseException) -> BaseException:
+    """
+    copy of given error without traceback, cause and context, so that the frames of the call aren't kept by cache,
+    which is created without '__init__' since its signature may not match the arguments of error,
+    or the error itself when its type can't be created so
+    """
+    try:
+        copied = error.__class__.__new__(error.__class__, *error.args)
+        copied.__dict__.update(error.__dict__)
+    except Exception:
+        return error
+    return copied
+
+
+class CachedGet:
+    """
+    'deloreans.api.get' with a bounded least-recently-used cache of results
+
+    invalid arguments are cached as well,
+    so that the same error is raised again without validation
+
+    Args:
+        maxsize (int | None): maximum amount of cached arguments, unbounded when None
+    """
+
+    def __init__(self, maxsize: Optional[int] = 1024) -> None:
+        if maxsize is not None:
+            if not isinstance(maxsize, int):
+                raise TypeError(
+                    INVALID_DATA_TYPE_TEMPLATE.format(
+                        input_args=maxsize,
+                        input_dtype=type(maxsize),
+                        dtype=int,
+                    )
+                )
+            if maxsize < 1:
+                raise ValueError(INVALID_CACHE_SIZE_ERROR_MSG)
+        self._maxsize = maxsize
+        self._cache: 'OrderedDict[Tuple[Any, ...], Tuple[bool, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @overload
+    def __call__(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        date_granularity: DateGranularity,
+        offset: int,
+        offset_granularity: OffsetGranularity,
+        firstweekday: Union[int, Calendar] = ...,
+        overflow: 'NonNullOverflowPolicy' = ...,
+    ) -> ComparedRange:
+        ...
+
+    @overload
+    def __call__(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        date_granularity: DateGranularity,
+        offset: int,
+        offset_granularity: OffsetGranularity,
+        firstweekday: Union[int, Calendar] = ...,
+        overflow: Union[OverflowPolicy, str] = ...,
+    ) -> Optional[ComparedRange]:
+        ...
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Optional[ComparedRange]:
+        """
+        same arguments and returns as 'deloreans.api.get'
+        """
+        try:
+            key = _make_key(*args, **kwargs)
+            hash(key)
+        except TypeError:
+            # not even a valid call, or unhashable arguments which can't be cached
+            return get(*args, **kwargs)
+
+        entry: Optional[Tuple[bool, Any]]
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        registry = metrics._metrics
+        if registry is not None:
+            registry.record_cache(entry is not None)
+
+        if entry is not None:
+            is_success: bool = entry[0]
+            result: Any = entry[1]
+            if is_success:
+                return result
+            # raise a copy instead of the cached instance, whose traceback would keep growing
+            raise _copy_error(result).with_traceback(None)
+
+        try:
+            result = get(*args, **kwargs)
+        except (TypeError, ValueError) as err:
+            # the original error is raised with its traceback, while its copy is cached
+            self._store(key, (False, _copy_error(err)))
+            raise
+        self._store(key, (True, result))
+        return result
+
+    def _store(self, key: Tuple[Any, ...], entry: Tuple[bool, Any]) -> None:
+        with self._lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            if self._maxsize is not None and len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,367 @@
+"""
+deloreans.cli
+
+This module provides the command-line tool, which appends compared date range to each row of CSV or JSON Lines,
+
+    python -m deloreans [INPUT] [--format csv|jsonl] [--workers N] [--errors skip|null|fail] \\
+        [--date-granularity monthly] [--offset -1] [--offset-granularity yearly] [--start-date-column start] ...
+
+rows are read from the file or stdin, processed by micro-batches and streamed to stdout in the given order,
+at most two micro-batches per worker are in flight so that the memory is bounded whatever the amount of rows
+
+arguments of 'deloreans.get' are read from the columns of their names by default,
+and the ones without column, or with empty value, are the given defaults
+"""
+import argparse
+import csv
+import datetime
+import io
+import json
+import sys
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .api import DEFAULT_BATCH_SIZE, ERRORS_NULL, get, validate_batch_size
+from .batch import ComparisonBatch
+from .date_utils import DateGranularity, OffsetGranularity
+from .date_utils.overflow_policy import get_overflow_policy, OverflowPolicy
+from .exceptions import (
+    INVALID_ROW_TEMPLATE,
+    INVALID_VALUE_TEMPLATE,
+    MISSING_VALUE_TEMPLATE,
+)
+from .parallel import _map_chunks, validate_max_workers
+from .validation import ErrorCode
+
+
+FORMAT_CSV = 'csv'
+FORMAT_JSONL = 'jsonl'
+JSONL_SUFFIXES = ('.jsonl', '.ndjson')
+
+# handling of invalid rows, 'null' provides empty compared date range as same as 'deloreans.api.get_many'
+ERRORS_SKIP = 'skip'
+ERRORS_FAIL = 'fail'
+ERRORS = (ERRORS_SKIP, ERRORS_NULL, ERRORS_FAIL)
+
+# arguments of 'deloreans.get', which are the default column names as well
+ARGUMENTS = ('start_date', 'end_date', 'date_granularity', 'offset', 'offset_granularity', 'firstweekday')
+COMPARED_START_DATE = 'compared_start_date'
+COMPARED_END_DATE = 'compared_end_date'
+
+
+class Options(NamedTuple):
+    """
+    options of processing rows, which are sent to workers
+
+    keys of CSV are indexes of columns, where None is the argument without column, and names of JSON Lines
+    """
+    is_csv: bool
+    argument_keys: Tuple[Any, ...]
+    defaults: Tuple[Any, ...]
+    compared_keys: Tuple[Any, Any]
+    width: int
+    errors: str
+    overflow: OverflowPolicy
+
+
+def parse_date(value: Any) -> datetime.date:
+    if not isinstance(value, str):
+        raise ValueError(INVALID_VALUE_TEMPLATE.format(value=value, expected='ISO date string'))
+    return datetime.date.fromisoformat(value)
+
+
+def parse_int(value: Any) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if not isinstance(value, str):
+        raise ValueError(INVALID_VALUE_TEMPLATE.format(value=value, expected='integer'))
+    return int(value)
+
+
+def parse_date_granularity(value: Any) -> DateGranularity:
+    return _parse_name(DateGranularity, value)
+
+
+def parse_offset_granularity(value: Any) -> OffsetGranularity:
+    return _parse_name(OffsetGranularity, value)
+
+
+def _parse_name(enum: Any, value: Any) -> Any:
+    try:
+        return enum[value.upper()]
+    except (AttributeError, KeyError):
+        raise ValueError(
+            INVALID_VALUE_TEMPLATE.format(value=value, expected=[item.name.lower() for item in enum])
+        )
+
+
+PARSERS: Tuple[Callable[[Any], Any], ...] = (
+    parse_date,
+    parse_date,
+    parse_date_granularity,
+    parse_int,
+    parse_offset_granularity,
+    parse_int,
+)
+
+
+def process_batch(records: List[Any], first_row: int, options: Options) -> str:
+    """
+    append compared date range to each record of a micro-batch,
+    which is a list of CSV fields or a line of JSON Lines, and serialize them as output text
+
+    blank lines of JSON Lines are dropped while they are still counted in the numbers of rows,
+    and the lines which aren't JSON objects are invalid, which are passed through unchanged when errors is 'null'
+
+    Args:
+        records (List[Any]): records of the micro-batch
+        first_row (int): number of the first record, counted from 1
+        options (Options): options of processing
+
+    Returns:
+        text (str): serialized records, the invalid ones are omitted when errors is 'skip'
+    """
+    row_numbers = []
+    lines = []
+    rows = []
+    arguments = []
+    parse_errors: List[Optional[str]] = []
+    for row_number, record in enumerate(records, first_row):
+        if not options.is_csv and not record.strip():
+            continue
+        row, row_arguments, parse_error = _parse_record(record, options)
+        row_numbers.append(row_number)
+        lines.append(record)
+        rows.append(row)
+        arguments.append(row_arguments)
+        parse_errors.append(parse_error)
+    if not rows:
+        return ''
+
+    start_dates, end_dates, date_granularities, offsets, offset_granularities, firstweekdays = zip(*arguments)
+    batch = ComparisonBatch.from_dates(
+        start_dates,
+        end_dates,
+        date_granularities,
+        offsets,
+        offset_granularities,
+        firstweekdays,
+        ERRORS_NULL,
+        options.overflow,
+    )
+
+    stream = io.StringIO()
+    writer = csv.writer(stream, lineterminator='\n') if options.is_csv else None
+    compared_start_key, compared_end_key = options.compared_keys
+    statuses = batch.statuses
+    for index, (row, parse_error, compared_date_range) in enumerate(zip(rows, parse_errors, batch)):
+        is_invalid = parse_error is not None or statuses[index] != ErrorCode.OK or (
+            compared_date_range is None and options.overflow is not OverflowPolicy.NULL
+        )
+        if is_invalid:
+            if options.errors == ERRORS_FAIL:
+                raise ValueError(
+                    INVALID_ROW_TEMPLATE.format(
+                        row=row_numbers[index],
+                        error=parse_error or _describe_error(arguments[index], options.overflow, statuses[index]),
+                    )
+                )
+            if options.errors == ERRORS_SKIP:
+                continue
+            compared_date_range = None
+
+        if row is None:
+            # not a JSON object, where compared date range can't be appended
+            stream.write(lines[index].rstrip('\r\n'))
+            stream.write('\n')
+            continue
+        if compared_date_range is None:
+            compared_start_date = compared_end_date = None
+        else:
+            compared_start_date = compared_date_range.start.isoformat()
+            compared_end_date = compared_date_range.end.isoformat()
+        if writer is not None:
+            row[compared_start_key] = compared_start_date or ''
+            row[compared_end_key] = compared_end_date or ''
+            writer.writerow(row)
+        else:
+            row[compared_start_key] = compared_start_date
+            row[compared_end_key] = compared_end_date
+            stream.write(json.dumps(row))
+            stream.write('\n')
+    return stream.getvalue()
+
+
+def _parse_record(record: Any, options: Options) -> Tuple[Any, Tuple[Any, ...], Optional[str]]:
+    """
+    output row, arguments of 'deloreans.get' and the error of parsing a record,
+    the argument which fails to be parsed is None, so that the row is flagged as invalid in the batch,
+    and the output row is None when the line of JSON Lines isn't a JSON object
+    """
+    if options.is_csv:
+        row: Any = list(record) + [''] * max(options.width - len(record), 0)
+    else:
+        try:
+            row = json.loads(record)
+        except ValueError as err:
+            return None, (None,) * len(ARGUMENTS), str(err)
+        if not isinstance(row, dict):
+            return None, (None,) * len(ARGUMENTS), INVALID_VALUE_TEMPLATE.format(value=row, expected='JSON object')
+
+    arguments = []
+    parse_error = None
+    for name, key, default, parse in zip(ARGUMENTS, options.argument_keys, options.defaults, PARSERS):
+        value = None
+        if options.is_csv:
+            if key is not None and key < len(record):
+                value = record[key]
+        else:
+            value = row.get(key)
+        if value is None or value == '':
+            if default is None and parse_error is None:
+                parse_error = MISSING_VALUE_TEMPLATE.format(name=name)
+            arguments.append(default)
+            continue
+        try:
+            arguments.append(parse(value))
+        except ValueError as err:
+            arguments.append(None)
+            if parse_error is None:
+                parse_error = f'{name}: {err}'
+    return row, tuple(arguments), parse_error
+
+
+def _describe_error(arguments: Tuple[Any, ...], overflow: OverflowPolicy, status: int) -> str:
+    """
+    message of the error raised by 'deloreans.get' on the arguments of an invalid row
+    """
+    start_date, end_date, date_granularity, offset, offset_granularity, firstweekday = arguments
+    try:
+        get(start_date, end_date, date_granularity, offset, offset_granularity, firstweekday, overflow)
+    except Exception as err:
+        return str(err).strip()
+    return ErrorCode(status).name
+
+
+def iter_batches(
+    records: Iterable[Any],
+    batch_size: int,
+    options: Options,
+) -> Iterator[Tuple[List[Any], int, Options]]:
+    """
+    arguments of 'process_batch' on each micro-batch of records
+    """
+    iterator = iter(records)
+    first_row = 1
+    while True:
+        records = list(islice(iterator, batch_size))
+        if not records:
+            return
+        yield records, first_row, options
+        first_row += len(records)
+
+
+def get_options(
+    header: Optional[Sequence[str]],
+    columns: Sequence[str],
+    defaults: Sequence[Any],
+    compared_columns: Tuple[str, str],
+    errors: str,
+    overflow: OverflowPolicy,
+) -> Options:
+    """
+    options of processing rows, CSV is given by its header while JSON Lines is not
+    """
+    if header is None:
+        return Options(False, tuple(columns), tuple(defaults), compared_columns, 0, errors, overflow)
+
+    output_header = get_output_header(header, compared_columns)
+    return Options(
+        True,
+        tuple(header.index(column) if column in header else None for column in columns),
+        tuple(defaults),
+        (output_header.index(compared_columns[0]), output_header.index(compared_columns[1])),
+        len(output_header),
+        errors,
+        overflow,
+    )
+
+
+def get_output_header(header: Sequence[str], compared_columns: Tuple[str, str]) -> List[str]:
+    """
+    header of CSV with compared columns, which are appended unless they exist
+    """
+    output_header = list(header)
+    output_header.extend(column for column in compared_columns if column not in header)
+    return output_header
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m deloreans',
+        description='append compared date range to each row of CSV or JSON Lines',
+    )
+    parser.add_argument('input', nargs='?', default='-', help="input file, or '-' for stdin")
+    parser.add_argument('--output', default='-', help="output file, or '-' for stdout")
+    parser.add_argument(
+        '--format',
+        choices=(FORMAT_CSV, FORMAT_JSONL),
+        help=f"format of input and output, inferred from the suffix of input file and '{FORMAT_CSV}' by default",
+    )
+    for name in ARGUMENTS:
+        parser.add_argument(f"--{name.replace('_', '-')}-column", default=name, help=f'column of {name}')
+    parser.add_argument('--date-granularity', help='date granularity of rows without it')
+    parser.add_argument('--offset', help='offset of rows without it')
+    parser.add_argument('--offset-granularity', help='offset granularity of rows without it')
+    parser.add_argument('--firstweekday', default='0', help='first weekday of rows without it, 0 is Monday')
+    parser.add_argument('--compared-start-date-column', default=COMPARED_START_DATE)
+    parser.add_argument('--compared-end-date-column', default=COMPARED_END_DATE)
+    parser.add_argument('--errors', choices=ERRORS, default=ERRORS_FAIL, help='handling of invalid rows')
+    parser.add_argument('--overflow', choices=[item.value for item in OverflowPolicy], default='raise')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='amount of rows in micro-batch')
+    parser.add_argument('--workers', type=int, default=1, help='amount of worker processes')
+    args = parser.parse_args(argv)
+
+    defaults: List[Any] = [None, None]
+    for name, parse in zip(ARGUMENTS[2:], PARSERS[2:]):
+        value = getattr(args, name)
+        try:
+            defaults.append(None if value is None else parse(value))
+        except ValueError as err:
+            parser.error(f"argument --{name.replace('_', '-')}: {err}")
+    try:
+        validate_batch_size(args.batch_size)
+        validate_max_workers(args.workers)
+    except (TypeError, ValueError) as err:
+        parser.error(str(err).strip())
+    overflow = get_overflow_policy(args.overflow)
+    columns = [getattr(args, f'{name}_column') for name in ARGUMENTS]
+    compared_columns = (args.compared_start_date_column, args.compared_end_date_column)
+    file_format = args.format or (FORMAT_JSONL if args.input.endswith(JSONL_SUFFIXES) else FORMAT_CSV)
+
+    input_file = sys.stdin if args.input == '-' else open(args.input, newline='')
+    output_file = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+    try:
+        records: Iterable[Any]
+        if file_format == FORMAT_CSV:
+            reader = csv.reader(input_file)
+            header = next(reader, None)
+            if header is None:
+                return
+            options = get_options(header, columns, defaults, compared_columns, args.errors, overflow)
+            csv.writer(output_file, lineterminator='\n').writerow(get_output_header(header, compared_columns))
+            records = reader
+        else:
+            options = get_options(None, columns, defaults, compared_columns, args.errors, overflow)
+            records = input_file
+
+        for text in _map_chunks(process_batch, iter_batches(records, args.batch_size, options), args.workers):
+            output_file.write(text)
+            output_file.flush()
+    except ValueError as err:
+        parser.exit(1, f'{parser.prog}: error: {str(err).strip()}\n')
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
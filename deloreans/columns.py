@@ -0,0 +1,84 @@
+"""
+deloreans.columns
+
+This module provides the packing of integer columns shared by 'deloreans.batch' and 'deloreans.parallel',
+where columns are packed as raw machine values by 'array.array'
+"""
+import datetime
+from array import array
+from typing import Any, Iterable, List, Optional, Sequence
+
+from .date_utils.date_range import validate_date_type
+from .date_utils.ordinal import MAX_ORDINAL, validate_ordinal
+
+
+# ordinals of 'datetime.date' are less than 2 ** 31
+ORDINAL_TYPECODE = 'i'
+# ordinal of the row without date range, which is right before the ordinal of 'datetime.date.min'
+NULL_ORDINAL = 0
+
+
+def pack_dates(dates: Sequence[datetime.date], is_raised: bool = True) -> 'array[int]':
+    """
+    pack dates into ordinals, invalid dates raise when 'is_raised' is True,
+    otherwise they are packed as 'NULL_ORDINAL'
+    """
+    try:
+        return array(ORDINAL_TYPECODE, [a_date.toordinal() for a_date in dates])
+    except AttributeError:
+        if not is_raised:
+            return array(
+                ORDINAL_TYPECODE,
+                [a_date.toordinal() if isinstance(a_date, datetime.date) else NULL_ORDINAL for a_date in dates],
+            )
+        for a_date in dates:
+            validate_date_type(a_date)
+        raise
+
+
+def pack_column(
+    typecode: str,
+    values: Iterable[int],
+    validate: Any,
+    invalid_rows: Optional[List[int]] = None,
+) -> 'array[int]':
+    """
+    pack integers into a new 'array.array',
+    raise the same error as given validator when any value can't be packed,
+    unless the indexes of such values are collected into given list, which are packed as 'NULL_ORDINAL'
+
+    values of other 'array.array' or memoryview of the same typecode are copied as raw bytes without validation
+    """
+    if isinstance(values, array) and values.typecode == typecode:
+        return array(typecode, values.tobytes())
+    if isinstance(values, memoryview) and values.format == typecode:
+        return array(typecode, values.tobytes())
+    values = list(values)
+    try:
+        column = array(typecode, values)
+    except (TypeError, OverflowError):
+        if invalid_rows is None:
+            for value in values:
+                validate(value)
+            raise
+        column = array(typecode)
+        for index, value in enumerate(values):
+            try:
+                validate(value)
+                column.append(value)
+            except (TypeError, ValueError, OverflowError):
+                column.append(NULL_ORDINAL)
+                invalid_rows.append(index)
+    return column
+
+
+def validate_ordinal_column(column: 'array[int]') -> None:
+    """
+    every ordinal of packed column should be 'NULL_ORDINAL' or stand for a valid 'datetime.date',
+    which is checked by the bounds of the column first since 'NULL_ORDINAL' is right before the valid ordinals
+    """
+    if column and NULL_ORDINAL <= min(column) and max(column) <= MAX_ORDINAL:
+        return
+    for ordinal in column:
+        if ordinal != NULL_ORDINAL:
+            validate_ordinal(ordinal)
@@ -6,8 +6,11 @@ This module provides components on date-related parameters management
 from typing import Any, Iterable, List
 
 from .date_granularity import DateGranularity
-from .date_range import DateRange  # NOQA
+from .date_range import ComparedRange, DateRange  # NOQA
+from .calendar import Calendar  # NOQA
 from .offset_granularity import DatePeriodOffset, OffsetGranularity  # NOQA
+from .overflow_policy import OverflowPolicy  # NOQA
+from .period import Period  # NOQA
 
 
 def _strict_zip(*iterables: Iterable) -> Iterable:
@@ -46,6 +49,15 @@ def _strict_zip(*iterables: Iterable) -> Iterable:
             raise ValueError(msg)
 
 
+def _as_column(value: Any, size: int) -> Iterable[Any]:
+    """
+    broadcast single value to a column with given size
+    """
+    if isinstance(value, str) or not isinstance(value, Iterable):
+        return [value] * size
+    return value
+
+
 # Commonly, finer date range can offset with rougher offset granularity
 # Here is the collection of valid combinations
 # Please register the valid offset granularity when support new date granularity
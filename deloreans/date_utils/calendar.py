@@ -0,0 +1,95 @@
+from functools import lru_cache, partial
+from typing import Any, Callable, Tuple, Union
+
+from .date_range import validate_firstweekday
+from .immutable import _Immutable
+from .ordinal import build_week_calendar, WeekCalendar
+from ..exceptions import (
+    INVALID_CACHE_SIZE_ERROR_MSG,
+    INVALID_DATA_TYPE_TEMPLATE,
+)
+
+
+# week calendars kept by each calendar, which is enough for about five centuries
+WEEK_CALENDAR_CACHE_SIZE = 512
+
+
+class Calendar(_Immutable):
+    """
+    immutable conventions of weeks, which is passed positionally to the stage functions,
+    and owns the week calendars of years built for its first weekday
+
+    calendars are equal when their conventions are, whatever is cached
+
+    Args:
+        firstweekday (int): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+        cache_size (int): maximum amount of years whose week calendars are kept
+    """
+
+    # 'firstweekday' is a public slot instead of a property,
+    # since it is read on every call of the weekly stage functions
+    __slots__ = ('firstweekday', '_cache_size', '_week_calendars')
+    firstweekday: int
+    _cache_size: int
+    _week_calendars: Callable[[int], WeekCalendar]
+
+    def __init__(self, firstweekday: int = 0, cache_size: int = WEEK_CALENDAR_CACHE_SIZE) -> None:
+        validate_firstweekday(firstweekday)
+        if not isinstance(cache_size, int):
+            raise TypeError(
+                INVALID_DATA_TYPE_TEMPLATE.format(
+                    input_args=cache_size,
+                    input_dtype=type(cache_size),
+                    dtype=int,
+                )
+            )
+        if cache_size < 1:
+            raise ValueError(INVALID_CACHE_SIZE_ERROR_MSG)
+        object.__setattr__(self, 'firstweekday', firstweekday)
+        object.__setattr__(self, '_cache_size', cache_size)
+        object.__setattr__(
+            self,
+            '_week_calendars',
+            lru_cache(maxsize=cache_size)(partial(build_week_calendar, firstweekday)),
+        )
+
+    def get_week_calendar(self, year: int) -> WeekCalendar:
+        """
+        boundaries of the weeks in given year, which are built once and kept
+        """
+        return self._week_calendars(year)
+
+    def cache_info(self) -> Any:
+        return self._week_calendars.cache_info()  # type: ignore
+
+    def cache_clear(self) -> None:
+        self._week_calendars.cache_clear()  # type: ignore
+
+    def _key(self) -> Tuple[int]:
+        return (self.firstweekday,)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (self.firstweekday, self._cache_size)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(firstweekday={self.firstweekday})'
+
+
+# shared calendar of each first weekday, which is used when an integer first weekday is given
+CALENDARS = tuple(Calendar(firstweekday) for firstweekday in range(7))
+
+
+def get_calendar(firstweekday: Union[int, Calendar]) -> Calendar:
+    """
+    given calendar itself, or the shared calendar of given first weekday
+
+    Args:
+        firstweekday (int | Calendar): first weekday from 0 (Mon) to 6 (Sun), or a calendar
+
+    Returns:
+        calendar (Calendar)
+    """
+    if isinstance(firstweekday, Calendar):
+        return firstweekday
+    validate_firstweekday(firstweekday)
+    return CALENDARS[firstweekday]
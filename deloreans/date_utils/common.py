@@ -1,6 +1,5 @@
 import datetime
 from datetime import timedelta
-from typing import Any
 
 from ..exceptions import IndexOverflowError
 
@@ -106,9 +105,8 @@ def get_start_daily_of_daily(a_date: datetime.date) -> datetime.date:
 
 def get_start_daily_of_weekly(
     a_date: datetime.date,
-    **kwargs: Any,
+    firstweekday: int = 0,
 ) -> datetime.date:
-    firstweekday: int = kwargs.get('firstweekday', 0)
     return get_weekly_start_date(a_date, firstweekday)
 
 
@@ -122,17 +120,15 @@ def get_start_daily_of_yearly(a_date: datetime.date) -> datetime.date:
 
 def get_start_weekly_of_weekly(
     a_date: datetime.date,
-    **kwargs: Any,
+    firstweekday: int = 0,
 ) -> datetime.date:
-    firstweekday: int = kwargs.get('firstweekday', 0)
     return get_weekly_start_date(a_date, firstweekday)
 
 
 def get_start_weekly_of_monthly(
     a_date: datetime.date,
-    **kwargs: Any,
+    firstweekday: int = 0,
 ) -> datetime.date:
-    firstweekday: int = kwargs.get('firstweekday', 0)
     week_anchor_date = get_week_anchor_date(a_date, firstweekday)
     return get_start_weekly_of_month(
         week_anchor_date.year,
@@ -143,12 +139,11 @@ def get_start_weekly_of_monthly(
 
 def get_start_weekly_of_yearly(
     a_date: datetime.date,
-    **kwargs: Any,
+    firstweekday: int = 0,
 ) -> datetime.date:
     """
     special case that the month is January
     """
-    firstweekday: int = kwargs.get('firstweekday', 0)
     week_anchor_date = get_week_anchor_date(a_date, firstweekday)
     return get_start_weekly_of_month(
         week_anchor_date.year,
@@ -203,23 +198,22 @@ GET_BASE_INDEX_FUNC_TEMPLATE = \
 
 def get_daily_index_of_daily(
     a_date: datetime.date,  # NOQA
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> int:
     return 0
 
 
 def get_daily_index_of_weekly(
     a_date: datetime.date,
-    **kwargs: Any,
+    firstweekday: int = 0,
 ) -> int:
-    firstweekday: int = kwargs.get('firstweekday', 0)
     start_date = get_start_daily_of_weekly(a_date, firstweekday=firstweekday)
     return (a_date - start_date).days
 
 
 def get_daily_index_of_monthly(
     a_date: datetime.date,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> int:
     start_date = get_start_daily_of_monthly(a_date)
     return (a_date - start_date).days
@@ -227,7 +221,7 @@ def get_daily_index_of_monthly(
 
 def get_daily_index_of_yearly(
     a_date: datetime.date,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> int:
     start_date = get_start_daily_of_yearly(a_date)
     return (a_date - start_date).days
@@ -235,16 +229,15 @@ def get_daily_index_of_yearly(
 
 def get_weekly_index_of_weekly(
     a_date: datetime.date,  # NOQA
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> int:
     return 0
 
 
 def get_weekly_index_of_monthly(
     a_date: datetime.date,
-    **kwargs: Any,
+    firstweekday: int = 0,
 ) -> int:
-    firstweekday: int = kwargs.get('firstweekday', 0)
     located_start_date = get_start_weekly_of_monthly(
         a_date,
         firstweekday=firstweekday,
@@ -255,9 +248,8 @@ def get_weekly_index_of_monthly(
 
 def get_weekly_index_of_yearly(
     a_date: datetime.date,
-    **kwargs: Any,
+    firstweekday: int = 0,
 ) -> int:
-    firstweekday: int = kwargs.get('firstweekday', 0)
     located_start_date = get_start_weekly_of_yearly(
         a_date,
         firstweekday=firstweekday,
@@ -268,14 +260,14 @@ def get_weekly_index_of_yearly(
 
 def get_monthly_index_of_monthly(
     a_date: datetime.date,  # NOQA
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> int:
     return 0
 
 
 def get_monthly_index_of_yearly(
     a_date: datetime.date,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> int:
     located_start_date = get_start_monthly_of_yearly(a_date)
     return a_date.month - located_start_date.month
@@ -283,7 +275,7 @@ def get_monthly_index_of_yearly(
 
 def get_yearly_index_of_yearly(
     a_date: datetime.date,  # NOQA
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> int:
     return 0
 
@@ -324,7 +316,7 @@ GET_COMPARED_LOCATED_PERIOD_FUNC_TEMPLATE = \
 def get_compared_start_daily_located_daily(
     a_date: datetime.date,
     offset: int,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> datetime.date:
     return a_date + timedelta(days=offset)
 
@@ -332,9 +324,8 @@ def get_compared_start_daily_located_daily(
 def get_compared_start_daily_located_weekly(
     a_date: datetime.date,
     offset: int,
-    **kwargs: Any,
+    firstweekday: int = 0,
 ) -> datetime.date:
-    firstweekday: int = kwargs.get('firstweekday', 0)
     return get_start_daily_of_weekly(
         a_date,
         firstweekday=firstweekday,
@@ -344,7 +335,7 @@ def get_compared_start_daily_located_weekly(
 def get_compared_start_daily_located_monthly(
     a_date: datetime.date,
     offset: int,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> datetime.date:
     located_start_date = get_start_daily_of_monthly(a_date)
     located_year, located_month = located_start_date.year, located_start_date.month
@@ -361,7 +352,7 @@ def get_compared_start_daily_located_monthly(
 def get_compared_start_daily_located_yearly(
     a_date: datetime.date,
     offset: int,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> datetime.date:
     located_start_date = get_start_daily_of_yearly(a_date)
     return datetime.date(located_start_date.year + offset, 1, 1)
@@ -370,9 +361,8 @@ def get_compared_start_daily_located_yearly(
 def get_compared_start_weekly_located_weekly(
     a_date: datetime.date,
     offset: int,
-    **kwargs: Any,
+    firstweekday: int = 0,
 ) -> datetime.date:
-    firstweekday: int = kwargs.get('firstweekday', 0)
     located_start_date = get_start_weekly_of_weekly(
         a_date,
         firstweekday=firstweekday,
@@ -383,9 +373,8 @@ def get_compared_start_weekly_located_weekly(
 def get_compared_start_weekly_located_monthly(
     a_date: datetime.date,
     offset: int,
-    **kwargs: Any,
+    firstweekday: int = 0,
 ) -> datetime.date:
-    firstweekday: int = kwargs.get('firstweekday', 0)
     week_anchor_date = get_week_anchor_date(a_date, firstweekday)
     compared_month_start_date = get_compared_start_daily_located_monthly(
         week_anchor_date,
@@ -402,9 +391,8 @@ def get_compared_start_weekly_located_monthly(
 def get_compared_start_weekly_located_yearly(
     a_date: datetime.date,
     offset: int,
-    **kwargs: Any,
+    firstweekday: int = 0,
 ) -> datetime.date:
-    firstweekday: int = kwargs.get('firstweekday', 0)
     week_anchor_date = get_week_anchor_date(a_date, firstweekday)
     compared_year_start_date = get_compared_start_daily_located_yearly(
         week_anchor_date,
@@ -421,7 +409,7 @@ def get_compared_start_weekly_located_yearly(
 def get_compared_start_monthly_located_monthly(
     a_date: datetime.date,
     offset: int,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> datetime.date:
     located_start_date = get_start_monthly_of_monthly(a_date)
     return get_compared_start_daily_located_monthly(located_start_date, offset)
@@ -430,7 +418,7 @@ def get_compared_start_monthly_located_monthly(
 def get_compared_start_monthly_located_yearly(
     a_date: datetime.date,
     offset: int,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> datetime.date:
     """
     special case that the month is January
@@ -442,7 +430,7 @@ def get_compared_start_monthly_located_yearly(
 def get_compared_start_yearly_located_yearly(
     a_date: datetime.date,
     offset: int,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> datetime.date:
     located_start_date = get_start_yearly_of_yearly(a_date)
     return datetime.date(located_start_date.year + offset, 1, 1)
@@ -478,7 +466,7 @@ GET_DATE_WITH_INDEX_FUNC_TEMPLATE = \
 def get_daily_with_index_in_daily(
     a_date: datetime.date,
     index: int,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> datetime.date:
     if index != 0:
         raise IndexOverflowError
@@ -488,12 +476,11 @@ def get_daily_with_index_in_daily(
 def get_daily_with_index_in_weekly(
     a_date: datetime.date,
     index: int,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> datetime.date:
     # since one week only has 7 days
     if not 0 <= index < 7:
         raise IndexOverflowError
-    firstweekday: int = kwargs.get('firstweekday', 0)
     week_start_date = get_weekly_start_date(a_date, firstweekday=firstweekday)
     return week_start_date + timedelta(days=index)
 
@@ -501,7 +488,7 @@ def get_daily_with_index_in_weekly(
 def get_daily_with_index_in_monthly(
     a_date: datetime.date,
     index: int,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> datetime.date:
     next_month_total_months = (a_date.year * 12 + a_date.month) + 1
     exceeded_year = next_month_total_months // 12
@@ -525,7 +512,7 @@ def get_daily_with_index_in_monthly(
 def get_daily_with_index_in_yearly(
     a_date: datetime.date,
     index: int,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> datetime.date:
     year_start_date = datetime.date(a_date.year, 1, 1)
     year_end_date = datetime.date(a_date.year, 12, 31)
@@ -540,20 +527,18 @@ def get_daily_with_index_in_yearly(
 def get_weekly_with_index_in_weekly(
     a_date: datetime.date,
     index: int,
-    **kwargs: Any,
+    firstweekday: int = 0,
 ) -> datetime.date:
     if index != 0:
         raise IndexOverflowError
-    firstweekday: int = kwargs.get('firstweekday', 0)
     return get_weekly_start_date(a_date, firstweekday=firstweekday)
 
 
 def get_weekly_with_index_in_monthly(
     a_date: datetime.date,
     index: int,
-    **kwargs: Any,
+    firstweekday: int = 0,
 ) -> datetime.date:
-    firstweekday: int = kwargs.get('firstweekday', 0)
     anchor_date = get_week_anchor_date(
         a_date,
         firstweekday=firstweekday,
@@ -582,9 +567,8 @@ def get_weekly_with_index_in_monthly(
 def get_weekly_with_index_in_yearly(
     a_date: datetime.date,
     index: int,
-    **kwargs: Any,
+    firstweekday: int = 0,
 ) -> datetime.date:
-    firstweekday: int = kwargs.get('firstweekday', 0)
     anchor_date = get_week_anchor_date(
         a_date,
         firstweekday=firstweekday,
@@ -607,7 +591,7 @@ def get_weekly_with_index_in_yearly(
 def get_monthly_with_index_in_monthly(
     a_date: datetime.date,
     index: int,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> datetime.date:
     if index != 0:
         raise IndexOverflowError
@@ -617,7 +601,7 @@ def get_monthly_with_index_in_monthly(
 def get_monthly_with_index_in_yearly(
     a_date: datetime.date,
     index: int,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> datetime.date:
     year_start_date = datetime.date(a_date.year, 1, 1)
     if not 0 <= index < 12:
@@ -628,7 +612,7 @@ def get_monthly_with_index_in_yearly(
 def get_yearly_with_index_in_yearly(
     a_date: datetime.date,
     index: int,
-    **kwargs: Any,  # NOQA
+    firstweekday: int = 0,  # NOQA
 ) -> datetime.date:
     if index != 0:
         raise IndexOverflowError
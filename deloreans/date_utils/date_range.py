@@ -1,6 +1,9 @@
 import datetime
+from typing import NamedTuple
 
 from .date_granularity import DateGranularity
+from .immutable import _Immutable
+from .ordinal import validate_ordinal_date_completion
 from ..exceptions import (
     INVALID_DATA_TYPE_TEMPLATE,
     INVALID_DATE_RANGE_TEMPLATE,
@@ -8,7 +11,82 @@ from ..exceptions import (
 )
 
 
-class DateRange:
+def validate_date_type(a_date: datetime.date) -> None:
+    """
+    date parameters should be datetime.date
+    """
+    if not isinstance(a_date, datetime.date):
+        raise TypeError(
+            INVALID_DATA_TYPE_TEMPLATE.format(
+                input_args=a_date,
+                input_dtype=type(a_date),
+                dtype=datetime.date,
+            )
+        )
+
+
+def validate_date_relativity(
+    start_date: datetime.date,
+    end_date: datetime.date,
+) -> None:
+    """
+    end date should be equal or greater than start date
+    """
+    if end_date < start_date:
+        raise ValueError(
+            INVALID_DATE_RANGE_TEMPLATE.format(
+                end_date=end_date,
+                start_date=start_date,
+            )
+        )
+
+
+def validate_date_granularity_type(date_granularity: DateGranularity) -> None:
+    """
+    date granularity should be defined enum
+    """
+    if not isinstance(date_granularity, DateGranularity):
+        raise TypeError(
+            INVALID_DATA_TYPE_TEMPLATE.format(
+                input_args=date_granularity,
+                input_dtype=type(date_granularity),
+                dtype=DateGranularity,
+            )
+        )
+
+
+def validate_firstweekday(firstweekday: int) -> None:
+    if not isinstance(firstweekday, int):
+        raise TypeError(
+            INVALID_DATA_TYPE_TEMPLATE.format(
+                input_args=firstweekday,
+                input_dtype=type(firstweekday),
+                dtype=int,
+            )
+        )
+    if not 0 <= firstweekday < 7:
+        raise ValueError(INVALID_WEEKDAY_ERROR_MSG)
+
+
+class ComparedRange(NamedTuple):
+    """
+    compared date range, which is a plain pair of start and end dates
+    so that it is unpacked and compared as same as a tuple
+    """
+    start: datetime.date
+    end: datetime.date
+
+
+class DateRange(_Immutable):
+    """
+    immutable date range, which is equal to another one with the same parameters
+    """
+
+    __slots__ = ('_start_date', '_end_date', '_date_granularity', '_firstweekday')
+    _start_date: datetime.date
+    _end_date: datetime.date
+    _date_granularity: DateGranularity
+    _firstweekday: int
 
     def __init__(
         self,
@@ -17,19 +95,21 @@ class DateRange:
         date_granularity: DateGranularity,
         firstweekday: int = 0,
     ):
-        self._start_date = start_date
-        self._end_date = end_date
-        self._date_granularity = date_granularity
-        self._firstweekday = firstweekday
-        self._validate_firstweekday()
-        self._validate_date_type()
-        self._validate_date_relativity()
-        self._validate_date_granularity_type()
-        self._date_granularity.validate_date_completion(
-            self._start_date,
-            self._end_date,
-            self._firstweekday,
+        validate_firstweekday(firstweekday)
+        validate_date_type(start_date)
+        validate_date_type(end_date)
+        validate_date_relativity(start_date, end_date)
+        validate_date_granularity_type(date_granularity)
+        validate_ordinal_date_completion(
+            start_date.toordinal(),
+            end_date.toordinal(),
+            date_granularity,
+            firstweekday,
         )
+        object.__setattr__(self, '_start_date', start_date)
+        object.__setattr__(self, '_end_date', end_date)
+        object.__setattr__(self, '_date_granularity', date_granularity)
+        object.__setattr__(self, '_firstweekday', firstweekday)
 
     @property
     def start_date(self) -> datetime.date:
@@ -47,53 +127,8 @@ class DateRange:
     def firstweekday(self) -> int:
         return self._firstweekday
 
-    def _validate_date_type(self) -> None:
-        """
-        date parameters should be datetime.date
-        """
-        for a_date in (self._start_date, self._end_date):
-            if not isinstance(a_date, datetime.date):
-                raise TypeError(
-                    INVALID_DATA_TYPE_TEMPLATE.format(
-                        input_args=a_date,
-                        input_dtype=type(a_date),
-                        dtype=datetime.date,
-                    )
-                )
-
-    def _validate_date_relativity(self) -> None:
-        """
-        end date should be equal or greater than start date
-        """
-        if self._end_date < self._start_date:
-            raise ValueError(
-                INVALID_DATE_RANGE_TEMPLATE.format(
-                    end_date=self._end_date,
-                    start_date=self._start_date,
-                )
-            )
-
-    def _validate_date_granularity_type(self) -> None:
-        """
-        date granularity should be defined enum
-        """
-        if not isinstance(self._date_granularity, DateGranularity):
-            raise TypeError(
-                INVALID_DATA_TYPE_TEMPLATE.format(
-                    input_args=self._date_granularity,
-                    input_dtype=type(self._date_granularity),
-                    dtype=DateGranularity,
-                )
-            )
-
-    def _validate_firstweekday(self):
-        if not isinstance(self._firstweekday, int):
-            raise TypeError(
-                INVALID_DATA_TYPE_TEMPLATE.format(
-                    input_args=self._firstweekday,
-                    input_dtype=type(self._firstweekday),
-                    dtype=int,
-                )
-            )
-        if not 0 <= self._firstweekday < 7:
-            raise ValueError(INVALID_WEEKDAY_ERROR_MSG)
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}({self._start_date!r}, {self._end_date!r}, '
+            f'{self._date_granularity}, firstweekday={self._firstweekday})'
+        )
@@ -0,0 +1,38 @@
+from typing import Any, NoReturn, Tuple
+
+from ..exceptions import IMMUTABLE_ATTRIBUTE_TEMPLATE
+
+
+class _Immutable:
+    """
+    mixin of slotted value types, whose attributes are only set by 'object.__setattr__' on initialization
+
+    instances are equal and hashed by '_key', which is the values of '__slots__' by default,
+    and pickled by calling the class with it, so the classes override '_key' unless the slots are their arguments
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def _key(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise AttributeError(
+            IMMUTABLE_ATTRIBUTE_TEMPLATE.format(class_name=self.__class__.__name__, attribute=name)
+        )
+
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(
+            IMMUTABLE_ATTRIBUTE_TEMPLATE.format(class_name=self.__class__.__name__, attribute=name)
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, self._key()
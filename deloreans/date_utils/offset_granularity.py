@@ -1,5 +1,6 @@
 from enum import Enum
 
+from .immutable import _Immutable
 from ..exceptions import INVALID_DATA_TYPE_TEMPLATE
 
 
@@ -14,17 +15,49 @@ class OffsetGranularity(Enum):
     PERIODIC = 'periodic'
 
 
-class DatePeriodOffset:
+def validate_offset(offset: int) -> None:
+    if not isinstance(offset, int):
+        raise TypeError(
+            INVALID_DATA_TYPE_TEMPLATE.format(
+                input_args=offset,
+                input_dtype=type(offset),
+                dtype=int,
+            )
+        )
+
+
+def validate_offset_granularity_type(offset_granularity: OffsetGranularity) -> None:
+    """
+    offset granularity should be defined enum
+    """
+    if not isinstance(offset_granularity, OffsetGranularity):
+        raise TypeError(
+            INVALID_DATA_TYPE_TEMPLATE.format(
+                input_args=offset_granularity,
+                input_dtype=type(offset_granularity),
+                dtype=OffsetGranularity,
+            )
+        )
+
+
+class DatePeriodOffset(_Immutable):
+    """
+    immutable offset, which is equal to another one with the same parameters
+    """
+
+    __slots__ = ('_offset', '_offset_granularity')
+    _offset: int
+    _offset_granularity: OffsetGranularity
 
     def __init__(
         self,
         offset: int,
         offset_granularity: OffsetGranularity,
     ) -> None:
-        self._offset = offset
-        self._offset_granularity = offset_granularity
-        self._validate_offset()
-        self._validate_offset_granularity_type()
+        validate_offset(offset)
+        validate_offset_granularity_type(offset_granularity)
+        object.__setattr__(self, '_offset', offset)
+        object.__setattr__(self, '_offset_granularity', offset_granularity)
 
     @property
     def offset(self) -> int:
@@ -34,26 +67,5 @@ class DatePeriodOffset:
     def offset_granularity(self) -> OffsetGranularity:
         return self._offset_granularity
 
-    def _validate_offset(self) -> None:
-        if not isinstance(self._offset, int):
-            raise TypeError(
-                INVALID_DATA_TYPE_TEMPLATE.format(
-                    input_args=self._offset,
-                    input_dtype=type(self._offset),
-                    dtype=int,
-
-                )
-            )
-
-    def _validate_offset_granularity_type(self) -> None:
-        """
-        offset granularity should be defined enum
-        """
-        if not isinstance(self._offset_granularity, OffsetGranularity):
-            raise TypeError(
-                INVALID_DATA_TYPE_TEMPLATE.format(
-                    input_args=self._offset_granularity,
-                    input_dtype=type(self._offset_granularity),
-                    dtype=OffsetGranularity,
-                )
-            )
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._offset}, {self._offset_granularity})'
@@ -0,0 +1,706 @@
+"""
+Integer kernels of the functions in 'common' module
+
+Dates are represented by proleptic Gregorian ordinals (see 'datetime.date.toordinal'),
+year and month are computed with closed-form arithmetic,
+so that no intermediate 'datetime.date' or 'datetime.timedelta' is built
+
+Stage functions take the 'Calendar' positionally, which owns the week calendars of its first weekday
+"""
+import datetime
+from typing import Callable, Dict, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from .date_granularity import DateGranularity
+from .overflow_policy import OverflowPolicy
+from ..exceptions import (
+    IndexOverflowError,
+    INVALID_DATA_TYPE_TEMPLATE,
+    INVALID_DATE_RANGE_TEMPLATE,
+    ORDINAL_OUT_OF_RANGE_TEMPLATE,
+    PARTIAL_DATE_RANGE_TEMPLATE,
+)
+
+if TYPE_CHECKING:
+    from .calendar import Calendar
+
+
+MIN_ORDINAL = datetime.date.min.toordinal()
+MAX_ORDINAL = datetime.date.max.toordinal()
+
+# cumulative days before each month (1-based) in a non-leap year
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def is_leap_year(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def get_weekday(ordinal: int) -> int:
+    """
+    0 is Monday, 6 is Sunday, as same as 'datetime.date.weekday'
+    """
+    return (ordinal + 6) % 7
+
+
+def get_year_start_ordinal(year: int) -> int:
+    previous_year = year - 1
+    return previous_year * 365 + previous_year // 4 - previous_year // 100 + previous_year // 400 + 1
+
+
+def get_days_in_month(year: int, month: int) -> int:
+    if month == 2 and is_leap_year(year):
+        return 29
+    return _DAYS_IN_MONTH[month]
+
+
+def get_month_start_ordinal(year: int, month: int) -> int:
+    days_before_month = _DAYS_BEFORE_MONTH[month]
+    if month > 2 and is_leap_year(year):
+        days_before_month += 1
+    return get_year_start_ordinal(year) + days_before_month
+
+
+def get_total_month_start_ordinal(total_months: int) -> int:
+    """
+    start of the month represented by 'year * 12 + month - 1'
+    """
+    year, month_index = divmod(total_months, 12)
+    return get_month_start_ordinal(year, month_index + 1)
+
+
+def get_year_month_day(ordinal: int) -> Tuple[int, int, int]:
+    """
+    refer to: https://howardhinnant.github.io/date_algorithms.html#civil_from_days
+    with the day counted from 0000-03-01 instead of 1970-01-01
+    """
+    days = ordinal + 305
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    if shifted_month < 10:
+        month = shifted_month + 3
+        year = year_of_era + era * 400
+    else:
+        month = shifted_month - 9
+        year = year_of_era + era * 400 + 1
+    return year, month, day
+
+
+def get_year_month(ordinal: int) -> Tuple[int, int]:
+    year, month, _ = get_year_month_day(ordinal)
+    return year, month
+
+
+def get_year(ordinal: int) -> int:
+    return get_year_month_day(ordinal)[0]
+
+
+def get_total_months(ordinal: int) -> int:
+    year, month, _ = get_year_month_day(ordinal)
+    return year * 12 + month - 1
+
+
+def get_weekly_start_date(
+    ordinal: int,
+    firstweekday: int = 0,
+) -> int:
+    return ordinal - (ordinal + 6 - firstweekday) % 7
+
+
+def get_week_anchor_date(
+    ordinal: int,
+    firstweekday: int = 0,
+) -> int:
+    """
+    The fourth day of week determine the year and month that week located
+    """
+    return ordinal - (ordinal + 6 - firstweekday) % 7 + 3
+
+
+def get_weeks_offset(
+    base_ordinal: int,
+    compared_ordinal: int,
+    firstweekday: int = 0,
+) -> int:
+    base_week_anchor_date = get_week_anchor_date(base_ordinal, firstweekday)
+    compared_week_anchor_date = get_week_anchor_date(compared_ordinal, firstweekday)
+    return (compared_week_anchor_date - base_week_anchor_date + 1) // 7
+
+
+def get_start_weekly_of_month(
+    year: int,
+    month: int,
+    firstweekday: int = 0,
+) -> int:
+    """
+    get the start week of a month,
+    which is represented by week's start date
+    """
+    daily_start_date = get_month_start_ordinal(year, month)
+    week_start_date = get_weekly_start_date(daily_start_date, firstweekday)
+
+    # the week represented by anchor date is in previous month
+    # so that the first week should be the next one
+    if daily_start_date > week_start_date + 3:
+        return week_start_date + 7
+    return week_start_date
+
+
+# ==========================================================================================================
+#
+#   Week calendar of a year with given first weekday
+#
+#   Weeks are allocated to the month and year which their anchor date located,
+#   so that the boundaries are fixed for each (firstweekday, year).
+#   They are built lazily and kept by the 'Calendar' of the first weekday,
+#   then weekly functions only need lookups instead of recomputing anchors
+#
+# ==========================================================================================================
+
+
+class WeekCalendar(NamedTuple):
+    """
+    month_start_weeks: start date of each month's start week,
+                       with the one of next year's January at last
+    month_week_counts: amount of weeks of each month
+    week_count: amount of weeks of the year, 52 or 53
+    """
+    month_start_weeks: Tuple[int, ...]
+    month_week_counts: Tuple[int, ...]
+    week_count: int
+
+
+def build_week_calendar(firstweekday: int, year: int) -> WeekCalendar:
+    month_start_weeks = tuple(
+        get_start_weekly_of_month(year, month, firstweekday)
+        for month in range(1, 13)
+    ) + (get_start_weekly_of_month(year + 1, 1, firstweekday),)
+    month_week_counts = tuple(
+        (month_start_weeks[i + 1] - month_start_weeks[i]) // 7
+        for i in range(12)
+    )
+    return WeekCalendar(
+        month_start_weeks,
+        month_week_counts,
+        (month_start_weeks[12] - month_start_weeks[0]) // 7,
+    )
+
+
+def get_start_weekly_of_total_months(
+    total_months: int,
+    calendar: 'Calendar',
+) -> int:
+    year, month_index = divmod(total_months, 12)
+    return calendar.get_week_calendar(year).month_start_weeks[month_index]
+
+
+# =================================================================================================
+#
+#   Series of functions which provide period's index of a unit date period
+#
+#   Integer kernels of the same name functions in 'common' module
+#
+# =================================================================================================
+
+
+def get_daily_index_of_daily(ordinal: int, calendar: 'Calendar') -> int:
+    return 0
+
+
+def get_daily_index_of_weekly(ordinal: int, calendar: 'Calendar') -> int:
+    return (ordinal + 6 - calendar.firstweekday) % 7
+
+
+def get_daily_index_of_monthly(ordinal: int, calendar: 'Calendar') -> int:
+    return get_year_month_day(ordinal)[2] - 1
+
+
+def get_daily_index_of_yearly(ordinal: int, calendar: 'Calendar') -> int:
+    return ordinal - get_year_start_ordinal(get_year(ordinal))
+
+
+def get_weekly_index_of_weekly(ordinal: int, calendar: 'Calendar') -> int:
+    return 0
+
+
+def get_weekly_index_of_monthly(ordinal: int, calendar: 'Calendar') -> int:
+    week_start_date = get_weekly_start_date(ordinal, calendar.firstweekday)
+    year, month = get_year_month(week_start_date + 3)
+    month_start_week_date = calendar.get_week_calendar(year).month_start_weeks[month - 1]
+    return (week_start_date - month_start_week_date) // 7
+
+
+def get_weekly_index_of_yearly(ordinal: int, calendar: 'Calendar') -> int:
+    week_start_date = get_weekly_start_date(ordinal, calendar.firstweekday)
+    year = get_year(week_start_date + 3)
+    year_start_week_date = calendar.get_week_calendar(year).month_start_weeks[0]
+    return (week_start_date - year_start_week_date) // 7
+
+
+def get_monthly_index_of_monthly(ordinal: int, calendar: 'Calendar') -> int:
+    return 0
+
+
+def get_monthly_index_of_yearly(ordinal: int, calendar: 'Calendar') -> int:
+    return get_year_month_day(ordinal)[1] - 1
+
+
+def get_yearly_index_of_yearly(ordinal: int, calendar: 'Calendar') -> int:
+    return 0
+
+
+# =================================================================================================
+#
+#   Series of functions which provide unit date period which compared start period located
+#
+#   Integer kernels of the same name functions in 'common' module
+#
+# =================================================================================================
+
+
+def get_compared_start_daily_located_daily(
+    ordinal: int,
+    offset: int,
+    calendar: 'Calendar',
+) -> int:
+    return ordinal + offset
+
+
+def get_compared_start_daily_located_weekly(
+    ordinal: int,
+    offset: int,
+    calendar: 'Calendar',
+) -> int:
+    return get_weekly_start_date(ordinal, calendar.firstweekday) + offset * 7
+
+
+def get_compared_start_daily_located_monthly(
+    ordinal: int,
+    offset: int,
+    calendar: 'Calendar',
+) -> int:
+    return get_total_month_start_ordinal(get_total_months(ordinal) + offset)
+
+
+def get_compared_start_daily_located_yearly(
+    ordinal: int,
+    offset: int,
+    calendar: 'Calendar',
+) -> int:
+    return get_year_start_ordinal(get_year(ordinal) + offset)
+
+
+def get_compared_start_weekly_located_weekly(
+    ordinal: int,
+    offset: int,
+    calendar: 'Calendar',
+) -> int:
+    return get_weekly_start_date(ordinal, calendar.firstweekday) + offset * 7
+
+
+def get_compared_start_weekly_located_monthly(
+    ordinal: int,
+    offset: int,
+    calendar: 'Calendar',
+) -> int:
+    total_months = get_total_months(get_week_anchor_date(ordinal, calendar.firstweekday))
+    return get_start_weekly_of_total_months(total_months + offset, calendar)
+
+
+def get_compared_start_weekly_located_yearly(
+    ordinal: int,
+    offset: int,
+    calendar: 'Calendar',
+) -> int:
+    year = get_year(get_week_anchor_date(ordinal, calendar.firstweekday))
+    return calendar.get_week_calendar(year + offset).month_start_weeks[0]
+
+
+def get_compared_start_monthly_located_monthly(
+    ordinal: int,
+    offset: int,
+    calendar: 'Calendar',
+) -> int:
+    return get_total_month_start_ordinal(get_total_months(ordinal) + offset)
+
+
+def get_compared_start_monthly_located_yearly(
+    ordinal: int,
+    offset: int,
+    calendar: 'Calendar',
+) -> int:
+    return get_year_start_ordinal(get_year(ordinal) + offset)
+
+
+def get_compared_start_yearly_located_yearly(
+    ordinal: int,
+    offset: int,
+    calendar: 'Calendar',
+) -> int:
+    return get_year_start_ordinal(get_year(ordinal) + offset)
+
+
+# =================================================================================================
+#
+#   Series of functions which provide date period with index in located unit date period
+#
+#   Integer kernels of the same name functions in 'common' module,
+#   the capacity of located unit date period is computed instead of building the exceeded one,
+#   and the index beyond it is handled by overflow policy
+#
+# =================================================================================================
+
+
+def resolve_overflow_index(
+    index: int,
+    capacity: int,
+    overflow: OverflowPolicy,
+) -> Optional[int]:
+    """
+    index beyond the capacity of located unit date period according to overflow policy,
+    None when there is no compared date period
+    """
+    if overflow is OverflowPolicy.CLAMP:
+        return min(max(index, 0), capacity - 1)
+    if overflow is OverflowPolicy.ROLLOVER:
+        return index
+    if overflow is OverflowPolicy.NULL:
+        return None
+    raise IndexOverflowError
+
+
+def get_daily_with_index_in_daily(
+    ordinal: int,
+    index: int,
+    calendar: 'Calendar',
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Optional[int]:
+    if index != 0:
+        resolved_index = resolve_overflow_index(index, 1, overflow)
+        if resolved_index is None:
+            return None
+        index = resolved_index
+    return ordinal + index
+
+
+def get_daily_with_index_in_weekly(
+    ordinal: int,
+    index: int,
+    calendar: 'Calendar',
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Optional[int]:
+    # since one week only has 7 days
+    if not 0 <= index < 7:
+        resolved_index = resolve_overflow_index(index, 7, overflow)
+        if resolved_index is None:
+            return None
+        index = resolved_index
+    return get_weekly_start_date(ordinal, calendar.firstweekday) + index
+
+
+def get_daily_with_index_in_monthly(
+    ordinal: int,
+    index: int,
+    calendar: 'Calendar',
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Optional[int]:
+    year, month, day = get_year_month_day(ordinal)
+    capacity = get_days_in_month(year, month)
+    if not 0 <= index < capacity:
+        resolved_index = resolve_overflow_index(index, capacity, overflow)
+        if resolved_index is None:
+            return None
+        index = resolved_index
+    return ordinal - day + 1 + index
+
+
+def get_daily_with_index_in_yearly(
+    ordinal: int,
+    index: int,
+    calendar: 'Calendar',
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Optional[int]:
+    year = get_year(ordinal)
+    capacity = 366 if is_leap_year(year) else 365
+    if not 0 <= index < capacity:
+        resolved_index = resolve_overflow_index(index, capacity, overflow)
+        if resolved_index is None:
+            return None
+        index = resolved_index
+    return get_year_start_ordinal(year) + index
+
+
+def get_weekly_with_index_in_weekly(
+    ordinal: int,
+    index: int,
+    calendar: 'Calendar',
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Optional[int]:
+    if index != 0:
+        resolved_index = resolve_overflow_index(index, 1, overflow)
+        if resolved_index is None:
+            return None
+        index = resolved_index
+    return get_weekly_start_date(ordinal, calendar.firstweekday) + index * 7
+
+
+def get_weekly_with_index_in_monthly(
+    ordinal: int,
+    index: int,
+    calendar: 'Calendar',
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Optional[int]:
+    year, month = get_year_month(get_week_anchor_date(ordinal, calendar.firstweekday))
+    week_calendar = calendar.get_week_calendar(year)
+
+    # each month has different amount of weeks
+    capacity = week_calendar.month_week_counts[month - 1]
+    if not 0 <= index < capacity:
+        resolved_index = resolve_overflow_index(index, capacity, overflow)
+        if resolved_index is None:
+            return None
+        index = resolved_index
+    return week_calendar.month_start_weeks[month - 1] + index * 7
+
+
+def get_weekly_with_index_in_yearly(
+    ordinal: int,
+    index: int,
+    calendar: 'Calendar',
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Optional[int]:
+    year = get_year(get_week_anchor_date(ordinal, calendar.firstweekday))
+    week_calendar = calendar.get_week_calendar(year)
+
+    # each year has 52 or 53 weeks
+    capacity = week_calendar.week_count
+    if not 0 <= index < capacity:
+        resolved_index = resolve_overflow_index(index, capacity, overflow)
+        if resolved_index is None:
+            return None
+        index = resolved_index
+    return week_calendar.month_start_weeks[0] + index * 7
+
+
+def get_monthly_with_index_in_monthly(
+    ordinal: int,
+    index: int,
+    calendar: 'Calendar',
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Optional[int]:
+    if index != 0:
+        resolved_index = resolve_overflow_index(index, 1, overflow)
+        if resolved_index is None:
+            return None
+        return get_total_month_start_ordinal(get_total_months(ordinal) + resolved_index)
+    return ordinal - get_year_month_day(ordinal)[2] + 1
+
+
+def get_monthly_with_index_in_yearly(
+    ordinal: int,
+    index: int,
+    calendar: 'Calendar',
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Optional[int]:
+    if not 0 <= index < 12:
+        resolved_index = resolve_overflow_index(index, 12, overflow)
+        if resolved_index is None:
+            return None
+        index = resolved_index
+    return get_total_month_start_ordinal(get_year(ordinal) * 12 + index)
+
+
+def get_yearly_with_index_in_yearly(
+    ordinal: int,
+    index: int,
+    calendar: 'Calendar',
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Optional[int]:
+    if index != 0:
+        resolved_index = resolve_overflow_index(index, 1, overflow)
+        if resolved_index is None:
+            return None
+        index = resolved_index
+    return get_year_start_ordinal(get_year(ordinal) + index)
+
+
+# =================================================================================================
+#
+#   Date granularity related functions
+#
+#   Integer kernels of the methods of 'DateGranularity'
+#
+# =================================================================================================
+
+
+def _is_daily_start_date(ordinal: int, firstweekday: int = 0) -> bool:
+    return True
+
+
+def _is_daily_end_date(ordinal: int, firstweekday: int = 0) -> bool:
+    return True
+
+
+def _is_weekly_start_date(ordinal: int, firstweekday: int = 0) -> bool:
+    return get_weekday(ordinal) == firstweekday
+
+
+def _is_weekly_end_date(ordinal: int, firstweekday: int = 0) -> bool:
+    return get_weekday(ordinal + 1) == firstweekday
+
+
+def _is_monthly_start_date(ordinal: int, firstweekday: int = 0) -> bool:
+    return get_year_month_day(ordinal)[2] == 1
+
+
+def _is_monthly_end_date(ordinal: int, firstweekday: int = 0) -> bool:
+    return get_year_month_day(ordinal + 1)[2] == 1
+
+
+def _is_yearly_start_date(ordinal: int, firstweekday: int = 0) -> bool:
+    return get_year_start_ordinal(get_year(ordinal)) == ordinal
+
+
+def _is_yearly_end_date(ordinal: int, firstweekday: int = 0) -> bool:
+    return get_year_start_ordinal(get_year(ordinal + 1)) == ordinal + 1
+
+
+def _get_daily_date_range_length(
+    start_ordinal: int,
+    end_ordinal: int,
+    firstweekday: int = 0,
+) -> int:
+    return end_ordinal - start_ordinal + 1
+
+
+def _get_weekly_date_range_length(
+    start_ordinal: int,
+    end_ordinal: int,
+    firstweekday: int = 0,
+) -> int:
+    return get_weeks_offset(start_ordinal, end_ordinal, firstweekday) + 1
+
+
+def _get_monthly_date_range_length(
+    start_ordinal: int,
+    end_ordinal: int,
+    firstweekday: int = 0,
+) -> int:
+    return get_total_months(end_ordinal) - get_total_months(start_ordinal) + 1
+
+
+def _get_yearly_date_range_length(
+    start_ordinal: int,
+    end_ordinal: int,
+    firstweekday: int = 0,
+) -> int:
+    return get_year(end_ordinal) - get_year(start_ordinal) + 1
+
+
+def _get_daily_end_date(start_ordinal: int, date_range_length: int) -> int:
+    return start_ordinal + date_range_length - 1
+
+
+def _get_weekly_end_date(start_ordinal: int, date_range_length: int) -> int:
+    return start_ordinal + date_range_length * 7 - 1
+
+
+def _get_monthly_end_date(start_ordinal: int, date_range_length: int) -> int:
+    return get_total_month_start_ordinal(get_total_months(start_ordinal) + date_range_length) - 1
+
+
+def _get_yearly_end_date(start_ordinal: int, date_range_length: int) -> int:
+    return get_year_start_ordinal(get_year(start_ordinal) + date_range_length) - 1
+
+
+DateGranularityFuncs = Tuple[
+    Callable[[int, int], bool],
+    Callable[[int, int], bool],
+    Callable[[int, int, int], int],
+    Callable[[int, int], int],
+]
+
+
+# (is start date, is end date, get date range length, get end date) of each date granularity
+DATE_GRANULARITY_FUNCS: Dict[DateGranularity, DateGranularityFuncs] = {
+    DateGranularity.DAILY: (
+        _is_daily_start_date,
+        _is_daily_end_date,
+        _get_daily_date_range_length,
+        _get_daily_end_date,
+    ),
+    DateGranularity.WEEKLY: (
+        _is_weekly_start_date,
+        _is_weekly_end_date,
+        _get_weekly_date_range_length,
+        _get_weekly_end_date,
+    ),
+    DateGranularity.MONTHLY: (
+        _is_monthly_start_date,
+        _is_monthly_end_date,
+        _get_monthly_date_range_length,
+        _get_monthly_end_date,
+    ),
+    DateGranularity.YEARLY: (
+        _is_yearly_start_date,
+        _is_yearly_end_date,
+        _get_yearly_date_range_length,
+        _get_yearly_end_date,
+    ),
+}
+
+
+def validate_ordinal(ordinal: int) -> None:
+    """
+    ordinal should be integer which stands for a valid 'datetime.date'
+    """
+    if not isinstance(ordinal, int):
+        raise TypeError(
+            INVALID_DATA_TYPE_TEMPLATE.format(
+                input_args=ordinal,
+                input_dtype=type(ordinal),
+                dtype=int,
+            )
+        )
+    if not MIN_ORDINAL <= ordinal <= MAX_ORDINAL:
+        raise ValueError(ORDINAL_OUT_OF_RANGE_TEMPLATE.format(ordinal=ordinal))
+
+
+def validate_ordinal_relativity(
+    start_ordinal: int,
+    end_ordinal: int,
+) -> None:
+    """
+    end date should be equal or greater than start date
+    """
+    if end_ordinal < start_ordinal:
+        raise ValueError(
+            INVALID_DATE_RANGE_TEMPLATE.format(
+                end_date=datetime.date.fromordinal(end_ordinal),
+                start_date=datetime.date.fromordinal(start_ordinal),
+            )
+        )
+
+
+def validate_ordinal_date_completion(
+    start_ordinal: int,
+    end_ordinal: int,
+    date_granularity: DateGranularity,
+    firstweekday: int = 0,
+) -> None:
+    """
+    given date range should be full periods of date granularity
+    """
+    is_start_date, is_end_date, _, _ = DATE_GRANULARITY_FUNCS[date_granularity]
+    if not (is_start_date(start_ordinal, firstweekday) and is_end_date(end_ordinal, firstweekday)):
+        raise ValueError(
+            PARTIAL_DATE_RANGE_TEMPLATE.format(
+                start_date=datetime.date.fromordinal(start_ordinal),
+                end_date=datetime.date.fromordinal(end_ordinal),
+                date_granularity_name=date_granularity.name.lower(),
+            )
+        )
@@ -0,0 +1,54 @@
+import sys
+from enum import Enum
+from typing import TYPE_CHECKING, Union
+
+from ..exceptions import INVALID_OVERFLOW_POLICY_TEMPLATE
+
+if TYPE_CHECKING:
+    if sys.version_info >= (3, 8):
+        from typing import Literal
+    else:
+        from typing_extensions import Literal
+
+
+class OverflowPolicy(Enum):
+    """
+    handling of the start date which has no counterpart in compared date period,
+    e.g. the 31st in a 30-day month, or week 53 in a 52-week year
+    """
+    # raise ValueError
+    RAISE = 'raise'
+    # the last date period of compared one instead
+    CLAMP = 'clamp'
+    # count the exceeded periods into the following ones
+    ROLLOVER = 'rollover'
+    # no compared date range, which is None
+    NULL = 'null'
+
+
+if TYPE_CHECKING:
+    # policies except null, with which a compared date range is always provided,
+    # only for overloads of return type since 'Literal' isn't in 'typing' of Python 3.7
+    NonNullOverflowPolicy = Literal[
+        OverflowPolicy.RAISE,
+        OverflowPolicy.CLAMP,
+        OverflowPolicy.ROLLOVER,
+        'raise',
+        'clamp',
+        'rollover',
+    ]
+
+
+def get_overflow_policy(overflow: Union[OverflowPolicy, str]) -> OverflowPolicy:
+    """
+    overflow policy of given member or its value, e.g. 'clamp'
+    """
+    try:
+        return OverflowPolicy(overflow)
+    except ValueError:
+        raise ValueError(
+            INVALID_OVERFLOW_POLICY_TEMPLATE.format(
+                overflow=overflow,
+                options=tuple(policy.value for policy in OverflowPolicy),
+            )
+        ) from None
@@ -0,0 +1,272 @@
+import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .date_granularity import DateGranularity
+from .date_range import DateRange, validate_date_granularity_type, validate_date_type, validate_firstweekday
+from .immutable import _Immutable
+from .ordinal import (
+    MAX_ORDINAL,
+    MIN_ORDINAL,
+    get_total_month_start_ordinal,
+    get_total_months,
+    get_year,
+    get_year_start_ordinal,
+)
+from ..exceptions import (
+    INVALID_DATA_TYPE_TEMPLATE,
+    PERIOD_OUT_OF_RANGE_TEMPLATE,
+)
+
+
+# =================================================================================================
+#
+#   Integer id of the period containing an ordinal, and the start ordinal of a period id
+#
+#   daily: ordinal of the day
+#   weekly: count of weeks starting from firstweekday, where the week of ordinal 1 is 1 on Monday
+#   monthly: 'year * 12 + month - 1'
+#   yearly: year
+#
+# =================================================================================================
+
+
+def get_daily_period_id(ordinal: int, firstweekday: int = 0) -> int:
+    return ordinal
+
+
+def get_weekly_period_id(ordinal: int, firstweekday: int = 0) -> int:
+    return (ordinal + 6 - firstweekday) // 7
+
+
+def get_monthly_period_id(ordinal: int, firstweekday: int = 0) -> int:
+    return get_total_months(ordinal)
+
+
+def get_yearly_period_id(ordinal: int, firstweekday: int = 0) -> int:
+    return get_year(ordinal)
+
+
+def get_daily_period_start(period_id: int, firstweekday: int = 0) -> int:
+    return period_id
+
+
+def get_weekly_period_start(period_id: int, firstweekday: int = 0) -> int:
+    return period_id * 7 - 6 + firstweekday
+
+
+def get_monthly_period_start(period_id: int, firstweekday: int = 0) -> int:
+    return get_total_month_start_ordinal(period_id)
+
+
+def get_yearly_period_start(period_id: int, firstweekday: int = 0) -> int:
+    return get_year_start_ordinal(period_id)
+
+
+PERIOD_ID_FUNCS: Dict[DateGranularity, Tuple[Callable[[int, int], int], Callable[[int, int], int]]] = {
+    DateGranularity.DAILY: (get_daily_period_id, get_daily_period_start),
+    DateGranularity.WEEKLY: (get_weekly_period_id, get_weekly_period_start),
+    DateGranularity.MONTHLY: (get_monthly_period_id, get_monthly_period_start),
+    DateGranularity.YEARLY: (get_yearly_period_id, get_yearly_period_start),
+}
+
+
+class Period(_Immutable):
+    """
+    immutable period of a date granularity, which is represented by an integer id,
+    so that offsetting is an integer addition and periods are ordered by their ids
+
+        Period.of(datetime.date(2024, 6, 10), DateGranularity.MONTHLY) - 12
+        >> Period(DateGranularity.MONTHLY, 24281, firstweekday=0), i.e. 2023-06
+
+    periods are equal, ordered and subtracted only with the ones of the same granularity and first weekday
+    """
+
+    __slots__ = ('_date_granularity', '_period_id', '_firstweekday', '_start_ordinal', '_end_ordinal')
+    _date_granularity: DateGranularity
+    _period_id: int
+    _firstweekday: int
+    _start_ordinal: int
+    _end_ordinal: int
+
+    def __init__(
+        self,
+        date_granularity: DateGranularity,
+        period_id: int,
+        firstweekday: int = 0,
+    ):
+        validate_date_granularity_type(date_granularity)
+        validate_firstweekday(firstweekday)
+        if not isinstance(period_id, int) or isinstance(period_id, bool):
+            raise TypeError(
+                INVALID_DATA_TYPE_TEMPLATE.format(
+                    input_args=period_id,
+                    input_dtype=type(period_id),
+                    dtype=int,
+                )
+            )
+        _, get_start = PERIOD_ID_FUNCS[date_granularity]
+        start_ordinal = get_start(period_id, firstweekday)
+        end_ordinal = get_start(period_id + 1, firstweekday) - 1
+        if start_ordinal < MIN_ORDINAL or end_ordinal > MAX_ORDINAL:
+            raise ValueError(
+                PERIOD_OUT_OF_RANGE_TEMPLATE.format(
+                    date_granularity_name=date_granularity.name.lower(),
+                    period_id=period_id,
+                )
+            )
+        object.__setattr__(self, '_date_granularity', date_granularity)
+        object.__setattr__(self, '_period_id', period_id)
+        object.__setattr__(self, '_firstweekday', firstweekday)
+        object.__setattr__(self, '_start_ordinal', start_ordinal)
+        object.__setattr__(self, '_end_ordinal', end_ordinal)
+
+    @classmethod
+    def of_ordinal(
+        cls,
+        ordinal: int,
+        date_granularity: DateGranularity,
+        firstweekday: int = 0,
+    ) -> 'Period':
+        """
+        period containing the date of given ordinal
+        """
+        validate_date_granularity_type(date_granularity)
+        get_id, _ = PERIOD_ID_FUNCS[date_granularity]
+        return cls(date_granularity, get_id(ordinal, firstweekday), firstweekday)
+
+    @classmethod
+    def of(
+        cls,
+        a_date: datetime.date,
+        date_granularity: DateGranularity,
+        firstweekday: int = 0,
+    ) -> 'Period':
+        """
+        period containing given date
+        """
+        validate_date_type(a_date)
+        return cls.of_ordinal(a_date.toordinal(), date_granularity, firstweekday)
+
+    @classmethod
+    def from_date_range(cls, date_range: DateRange) -> Tuple['Period', 'Period']:
+        """
+        first and last periods of given date range, which are the same one on single-period date range
+        """
+        return (
+            cls.of(date_range.start_date, date_range.date_granularity, date_range.firstweekday),
+            cls.of(date_range.end_date, date_range.date_granularity, date_range.firstweekday),
+        )
+
+    def to_date_range(self, last: Optional['Period'] = None) -> DateRange:
+        """
+        date range from this period to given last period, or of this period only
+
+        Args:
+            last (Period | None): last period of the date range, which is the same granularity and first weekday
+
+        Returns:
+            date_range (DateRange)
+        """
+        if last is None:
+            last = self
+        elif not isinstance(last, Period):
+            raise TypeError(
+                INVALID_DATA_TYPE_TEMPLATE.format(
+                    input_args=last,
+                    input_dtype=type(last),
+                    dtype=Period,
+                )
+            )
+        return DateRange(
+            self.start,
+            datetime.date.fromordinal(last._end_ordinal),
+            self._date_granularity,
+            self._firstweekday,
+        )
+
+    @property
+    def date_granularity(self) -> DateGranularity:
+        return self._date_granularity
+
+    @property
+    def id(self) -> int:
+        return self._period_id
+
+    @property
+    def firstweekday(self) -> int:
+        return self._firstweekday
+
+    @property
+    def start_ordinal(self) -> int:
+        return self._start_ordinal
+
+    @property
+    def end_ordinal(self) -> int:
+        return self._end_ordinal
+
+    @property
+    def start(self) -> datetime.date:
+        return datetime.date.fromordinal(self._start_ordinal)
+
+    @property
+    def end(self) -> datetime.date:
+        return datetime.date.fromordinal(self._end_ordinal)
+
+    def __contains__(self, a_date: Any) -> bool:
+        if not isinstance(a_date, datetime.date):
+            return False
+        return self._start_ordinal <= a_date.toordinal() <= self._end_ordinal
+
+    def __add__(self, offset: Any) -> 'Period':
+        if not isinstance(offset, int) or isinstance(offset, bool):
+            return NotImplemented
+        return self.__class__(self._date_granularity, self._period_id + offset, self._firstweekday)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> Any:
+        """
+        period of given offset before, or amount of periods since another period
+        """
+        if isinstance(other, Period):
+            if not self._is_comparable(other):
+                return NotImplemented
+            return self._period_id - other._period_id
+        if not isinstance(other, int) or isinstance(other, bool):
+            return NotImplemented
+        return self.__class__(self._date_granularity, self._period_id - other, self._firstweekday)
+
+    def _is_comparable(self, other: 'Period') -> bool:
+        return (
+            self._date_granularity is other._date_granularity
+            and self._firstweekday == other._firstweekday
+        )
+
+    def _key(self) -> Tuple[DateGranularity, int, int]:
+        return self._date_granularity, self._period_id, self._firstweekday
+
+    def __lt__(self, other: Any) -> bool:
+        if not isinstance(other, Period) or not self._is_comparable(other):
+            return NotImplemented
+        return self._period_id < other._period_id
+
+    def __le__(self, other: Any) -> bool:
+        if not isinstance(other, Period) or not self._is_comparable(other):
+            return NotImplemented
+        return self._period_id <= other._period_id
+
+    def __gt__(self, other: Any) -> bool:
+        if not isinstance(other, Period) or not self._is_comparable(other):
+            return NotImplemented
+        return self._period_id > other._period_id
+
+    def __ge__(self, other: Any) -> bool:
+        if not isinstance(other, Period) or not self._is_comparable(other):
+            return NotImplemented
+        return self._period_id >= other._period_id
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}({self._date_granularity}, {self._period_id}, '
+            f'firstweekday={self._firstweekday})'
+        )
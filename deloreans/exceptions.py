@@ -15,6 +15,21 @@ INVALID_DATE_RANGE_TEMPLATE = """
 """
 
 
+DATE_OUT_OF_RANGE_TEMPLATE = """
+    Day {day} since 1970-01-01 is out of the range of datetime.date
+"""
+
+
+ORDINAL_OUT_OF_RANGE_TEMPLATE = """
+    Ordinal {ordinal} is out of the range of datetime.date
+"""
+
+
+PERIOD_OUT_OF_RANGE_TEMPLATE = """
+    {date_granularity_name} period {period_id} is out of the range of datetime.date
+"""
+
+
 INVALID_WEEKDAY_ERROR_MSG = """
     weekday should be from 0 (Mon) to 6 (Sun)
 """
@@ -30,7 +45,83 @@ PARTIAL_DATE_RANGE_TEMPLATE = """
 """
 
 
+IMMUTABLE_ATTRIBUTE_TEMPLATE = """
+    {class_name} is immutable, attribute '{attribute}' can't be set or deleted
+"""
+
+
+INVALID_CACHE_SIZE_ERROR_MSG = """
+    maximum size of cache should be positive
+"""
+
+
+INVALID_BATCH_SIZE_ERROR_MSG = """
+    size of batch should be positive
+"""
+
+
+INVALID_OVERFLOW_POLICY_TEMPLATE = """
+    Unsupported overflow policy: {overflow}, should be one of {options}
+"""
+
+
+INVALID_ERRORS_TEMPLATE = """
+    Unsupported handling of invalid rows: {errors}, should be one of {options}
+"""
+
+
+INVALID_WORKERS_ERROR_MSG = """
+    amount of workers should be positive
+"""
+
+
+INCONSISTENT_COLUMN_LENGTH_TEMPLATE = """
+    Column of {length} rows is inconsistent with the other ones of {size} rows
+"""
+
+
+INVALID_BATCH_COLUMN_TEMPLATE = """
+    Received column {column_name}, should be one of {options}
+"""
+
+
+INVALID_COLUMN_FILE_TEMPLATE = """
+    Unsupported column file {path}, {reason}
+"""
+
+
+CHECKPOINT_MISMATCH_TEMPLATE = """
+    Checkpoint {checkpoint_path} is recorded by another job, remove it to start over
+"""
+
+
+INVALID_VALUE_TEMPLATE = "Received {value!r}, should be {expected}"
+MISSING_VALUE_TEMPLATE = "Missing value of {name}"
+INVALID_ROW_TEMPLATE = "Row {row} is invalid, {error}"
+
+
+INVALID_WORKLOAD_ROWS_ERROR_MSG = """
+    amount of rows should be positive
+"""
+
+
+WORKLOAD_ROWS_OVERFLOW_TEMPLATE = """
+    Only {max_rows} {date_granularity_name} date ranges are from {start_date} to {end_date}, fewer than {rows}
+"""
+
+
+INVALID_SLOW_CALL_LOG_ERROR_MSG = """
+    threshold of slow call should be non-negative, amount of records and period should be positive
+"""
+
+
 class IndexOverflowError(Exception):
 
     def __init__(self, *args, **kwargs):  # real signature unknown
         pass
+
+
+class StartDateOverflowError(ValueError):
+    """
+    no start date as same as the given one in compared date period, raised with 'START_DATE_OVERFLOW_ERROR_MSG'
+    """
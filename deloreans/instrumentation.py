@@ -0,0 +1,258 @@
+"""
+deloreans.instrumentation
+
+This module provides an opt-in tracing hook on 'deloreans.get' and 'DeLoreans.get',
+which receives the durations of each stage of core logic,
+and an opt-in log of slow calls with their arguments and stage breakdown,
+which covers 'deloreans.get', 'deloreans.get_many', 'ComparisonBatch.from_dates', 'ComparisonBatch.from_ordinals'
+and 'deloreans.vectorized.get'
+
+only a check of the registered hooks is added on each call when they are disabled
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Sized
+
+from .date_utils import DateGranularity, OffsetGranularity
+from .exceptions import INVALID_DATA_TYPE_TEMPLATE, INVALID_SLOW_CALL_LOG_ERROR_MSG
+
+
+# stages of core logic, in the order of being processed
+STAGE_VALIDATION = 'validation'
+STAGE_START_PERIOD_INDEX = 'start_period_index'
+STAGE_DATE_RANGE_LENGTH = 'date_range_length'
+STAGE_COMPARED_LOCATED_PERIOD_START_DATE = 'compared_located_period_start_date'
+STAGE_COMPARED_START_DATE = 'compared_start_date'
+STAGE_END_DATE = 'end_date'
+
+
+class Trace(NamedTuple):
+    """
+    durations of the stages of a call in nanoseconds by 'time.perf_counter_ns',
+    the validation stage is zero when 'DeLoreans.get' is called on an existing component
+    """
+    date_granularity: DateGranularity
+    offset_granularity: OffsetGranularity
+    durations: Dict[str, int]
+
+    @property
+    def total_ns(self) -> int:
+        return sum(self.durations.values())
+
+
+Tracer = Callable[[Trace], None]
+
+
+_tracer: Optional[Tracer] = None
+
+
+# logger of slow calls, each record has the structured fields in the attribute 'deloreans'
+SLOW_CALL_LOGGER = logging.getLogger('deloreans.slow_call')
+
+DEFAULT_MAX_RECORDS = 10
+DEFAULT_RATE_PERIOD = 1.0
+
+
+def set_tracer(tracer: Optional[Tracer]) -> Optional[Tracer]:
+    """
+    register the callback receiving the trace of each call, or disable tracing by None,
+    the callback is called in the calling thread after the result is computed,
+    calls raising errors are not traced, while the exception raised by the callback is propagated
+
+    Args:
+        tracer (Callable[[Trace], None] | None): callback on each trace
+
+    Returns:
+        previous_tracer (Callable[[Trace], None] | None): the tracer registered before
+    """
+    global _tracer
+    previous_tracer = _tracer
+    _tracer = tracer
+    return previous_tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+class SlowCallLog:
+    """
+    log calls slower than the threshold, at most given amount of records in each period,
+    the amount of records suppressed by the rate limit is reported on the next record
+
+    each record is logged at warning level with the attribute 'deloreans', which is a dict of
+        entry_point (str): API of the call, e.g. 'get', 'get_many', 'ComparisonBatch.from_dates', 'vectorized.get'
+        arguments (dict): arguments of the call, columns of batch are summarized by their lengths
+        date_granularity (str | None): name of date granularity, None when it varies among rows
+        offset_granularity (str | None): name of offset granularity, None when it varies among rows
+        duration_us (float): duration of the call in microseconds
+        rows (int): amount of rows, 1 for single call
+        stages_us (dict | None): duration of each stage in microseconds, refer to 'Trace'
+        suppressed (int): amount of slow calls not logged since the previous record
+
+    Args:
+        threshold_us (float): calls longer than this are slow, which is per row on batch entry points
+        max_records (int): maximum amount of records in each period
+        period (float): seconds of rate limiting period
+        logger (logging.Logger): logger of records
+    """
+
+    def __init__(
+        self,
+        threshold_us: float,
+        max_records: int = DEFAULT_MAX_RECORDS,
+        period: float = DEFAULT_RATE_PERIOD,
+        logger: logging.Logger = SLOW_CALL_LOGGER,
+    ) -> None:
+        for value, dtype in ((threshold_us, (int, float)), (max_records, int), (period, (int, float))):
+            if not isinstance(value, dtype) or isinstance(value, bool):
+                raise TypeError(
+                    INVALID_DATA_TYPE_TEMPLATE.format(
+                        input_args=value,
+                        input_dtype=type(value),
+                        dtype=dtype,
+                    )
+                )
+        if threshold_us < 0 or max_records < 1 or period <= 0:
+            raise ValueError(INVALID_SLOW_CALL_LOG_ERROR_MSG)
+        self.threshold_ns = threshold_us * 1000
+        self._max_records = max_records
+        self._period = period
+        self._logger = logger
+        self._lock = threading.Lock()
+        self._period_started = time.monotonic()
+        self._records = 0
+        self._suppressed = 0
+
+    def log(
+        self,
+        entry_point: str,
+        arguments: Mapping[str, Any],
+        date_granularity: Any,
+        offset_granularity: Any,
+        duration_ns: int,
+        rows: int = 1,
+        durations: Optional[Dict[str, int]] = None,
+    ) -> bool:
+        """
+        log a slow call unless it is rate limited
+
+        Returns:
+            is_logged (bool): whether the call is logged
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._period_started >= self._period:
+                self._period_started = now
+                self._records = 0
+            if self._records >= self._max_records:
+                self._suppressed += 1
+                return False
+            self._records += 1
+            suppressed = self._suppressed
+            self._suppressed = 0
+
+        fields = {
+            'entry_point': entry_point,
+            'arguments': dict(arguments),
+            'date_granularity': _get_granularity_name(date_granularity),
+            'offset_granularity': _get_granularity_name(offset_granularity),
+            'duration_us': duration_ns / 1000,
+            'rows': rows,
+            'stages_us': None if durations is None else {
+                stage: duration / 1000 for stage, duration in durations.items()
+            },
+            'suppressed': suppressed,
+        }
+        self._logger.warning(
+            'slow deloreans.%s on %s/%s took %.1f us: %r',
+            entry_point,
+            fields['date_granularity'],
+            fields['offset_granularity'],
+            fields['duration_us'],
+            fields['arguments'],
+            extra={'deloreans': fields},
+        )
+        return True
+
+
+_slow_call_log: Optional[SlowCallLog] = None
+
+
+def set_slow_call_log(
+    threshold_us: Optional[float],
+    max_records: int = DEFAULT_MAX_RECORDS,
+    period: float = DEFAULT_RATE_PERIOD,
+    logger: logging.Logger = SLOW_CALL_LOGGER,
+) -> Optional[SlowCallLog]:
+    """
+    log the calls slower than given threshold in microseconds, or disable it by None,
+    single calls are traced for the stage breakdown while it is enabled
+
+    the entry points are 'deloreans.get', 'deloreans.get_many', 'ComparisonBatch.from_dates',
+    'ComparisonBatch.from_ordinals' and 'deloreans.vectorized.get',
+    others are not logged, e.g. 'DeLoreans.get', 'ComparisonPlan', 'deloreans.parallel' and 'deloreans.aio'
+
+    Args:
+        threshold_us (float | None): calls longer than this are slow, which is per row on batch entry points
+        max_records (int): maximum amount of records in each period
+        period (float): seconds of rate limiting period
+        logger (logging.Logger): logger of records, 'deloreans.slow_call' by default
+
+    Returns:
+        slow_call_log (SlowCallLog | None): the enabled log
+    """
+    global _slow_call_log
+    _slow_call_log = None if threshold_us is None else SlowCallLog(threshold_us, max_records, period, logger)
+    return _slow_call_log
+
+
+def get_slow_call_log() -> Optional[SlowCallLog]:
+    return _slow_call_log
+
+
+def _log_slow_batch(
+    entry_point: str,
+    arguments: Mapping[str, Any],
+    date_granularity: Any,
+    offset_granularity: Any,
+    started: int,
+    rows: int,
+) -> None:
+    """
+    log a batch call started at given 'time.perf_counter_ns' when it is slower than the threshold per row,
+    columns of arguments are summarized by their lengths
+    """
+    slow_call_log = _slow_call_log
+    if slow_call_log is None:
+        return
+    duration_ns = time.perf_counter_ns() - started
+    if duration_ns > slow_call_log.threshold_ns * max(rows, 1):
+        slow_call_log.log(
+            entry_point,
+            {name: _describe_column(value) for name, value in arguments.items()},
+            date_granularity,
+            offset_granularity,
+            duration_ns,
+            rows=rows,
+        )
+
+
+def _describe_column(column: Any) -> Any:
+    """
+    single value as it is, and column by its length which is too large to be logged
+    """
+    if isinstance(column, str) or not isinstance(column, Sized):
+        return column
+    try:
+        return f'<{len(column)} rows>'
+    except TypeError:
+        # zero-dimensional array
+        return column
+
+
+def _get_granularity_name(granularity: Any) -> Optional[str]:
+    if isinstance(granularity, (DateGranularity, OffsetGranularity)):
+        return granularity.name.lower()
+    return None
@@ -0,0 +1,300 @@
+"""
+deloreans.metrics
+
+This module provides opt-in process-wide counters of the DeLoreans API,
+which are rendered in OpenMetrics text format for scraping, e.g.
+
+    deloreans.metrics.enable()
+    ...
+    body = deloreans.metrics.render()
+
+only a check of the enabled counters is added on each call when they are disabled
+"""
+import threading
+from bisect import bisect_left
+from collections import Counter
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .date_utils import DateGranularity, OffsetGranularity
+from .exceptions import StartDateOverflowError
+from .validation import ErrorCode
+
+
+# upper bounds of latency histogram buckets in seconds
+DEFAULT_LATENCY_BUCKETS = (
+    0.000005,
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.01,
+)
+
+# label of the granularity which is unknown or invalid
+UNKNOWN_LABEL = 'unknown'
+
+OPENMETRICS_CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+# reason of 'StartDateOverflowError'
+START_DATE_OVERFLOW_REASON = 'start_date_overflow'
+
+# errors which are counted as overflow instead of validation failure
+OVERFLOW_REASONS = (START_DATE_OVERFLOW_REASON, 'OverflowError')
+
+# reason of each error code of 'deloreans.validate_many', as same as the template of raised error
+ERROR_CODE_REASONS = {
+    ErrorCode.INVALID_TYPE: 'invalid_data_type',
+    ErrorCode.INVALID_FIRSTWEEKDAY: 'invalid_weekday',
+    ErrorCode.UNSUPPORTED_COMBO: 'unregistered_granularity_combo',
+    ErrorCode.INVALID_DATE_RANGE: 'invalid_date_range',
+    ErrorCode.PARTIAL_DATE_RANGE: 'partial_date_range',
+}
+
+
+Combination = Tuple[str, str]
+
+
+def get_error_reason(error: BaseException, error_code: int = ErrorCode.OK) -> str:
+    """
+    reason of a failed call by the error code of its arguments,
+    otherwise it is either an overflow or the name of error type since the arguments are valid
+    """
+    if error_code:
+        return ERROR_CODE_REASONS[ErrorCode(error_code)]
+    if isinstance(error, StartDateOverflowError):
+        return START_DATE_OVERFLOW_REASON
+    return type(error).__name__
+
+
+def get_granularity_label(granularity: Any) -> str:
+    if isinstance(granularity, (DateGranularity, OffsetGranularity)):
+        return granularity.name.lower()
+    return UNKNOWN_LABEL
+
+
+class Metrics:
+    """
+    counters of calls, errors, overflows and cache lookups,
+    and the latency histogram of calls, per granularity combination
+
+    Args:
+        latency_buckets (Sequence[float]): upper bounds of histogram buckets in seconds
+    """
+
+    def __init__(self, latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self._latency_buckets = tuple(sorted(latency_buckets))
+        # bucket bounds in nanoseconds, which are compared with 'time.perf_counter_ns' durations
+        self._latency_bucket_ns = tuple(bound * 1e9 for bound in self._latency_buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls: 'Counter[Combination]' = Counter()
+            self._errors: 'Counter[Tuple[str, str, str]]' = Counter()
+            self._overflows: 'Counter[Combination]' = Counter()
+            self._cache_hits = 0
+            self._cache_misses = 0
+            self._latency_counts: Dict[Combination, List[int]] = {}
+            self._latency_sums: 'Counter[Combination]' = Counter()
+
+    def record_call(
+        self,
+        date_granularity: Any,
+        offset_granularity: Any,
+        duration_ns: int,
+    ) -> None:
+        """
+        a successful call with its duration
+        """
+        combination = (get_granularity_label(date_granularity), get_granularity_label(offset_granularity))
+        index = bisect_left(self._latency_bucket_ns, duration_ns)
+        with self._lock:
+            self._calls[combination] += 1
+            counts = self._latency_counts.get(combination)
+            if counts is None:
+                counts = self._latency_counts[combination] = [0] * (len(self._latency_bucket_ns) + 1)
+            counts[index] += 1
+            self._latency_sums[combination] += duration_ns
+
+    def record_batch(
+        self,
+        date_granularities: Iterable[Any],
+        offset_granularities: Iterable[Any],
+        results: Iterable[Any],
+        error_codes: Optional[Iterable[int]] = None,
+    ) -> None:
+        """
+        rows of a batch, successful ones are counted as calls without latency,
+        and the rows without result are counted as errors of their error codes, or overflows
+        """
+        calls: 'Counter[Combination]' = Counter()
+        errors: 'Counter[Tuple[str, str, str]]' = Counter()
+        overflows: 'Counter[Combination]' = Counter()
+        for date_granularity, offset_granularity, result, error_code in zip(
+            date_granularities,
+            offset_granularities,
+            results,
+            repeat(ErrorCode.OK) if error_codes is None else error_codes,
+        ):
+            combination = (get_granularity_label(date_granularity), get_granularity_label(offset_granularity))
+            if result is not None:
+                calls[combination] += 1
+            elif error_code:
+                errors[combination + (ERROR_CODE_REASONS[ErrorCode(error_code)],)] += 1
+            else:
+                overflows[combination] += 1
+        with self._lock:
+            self._calls.update(calls)
+            self._errors.update(errors)
+            self._overflows.update(overflows)
+
+    def record_error(
+        self,
+        date_granularity: Any,
+        offset_granularity: Any,
+        error: BaseException,
+        error_code: int = ErrorCode.OK,
+    ) -> None:
+        """
+        a failed call, which is either an overflow or a validation failure,
+        by the error code of its arguments from 'deloreans.validate_many'
+        """
+        combination = (get_granularity_label(date_granularity), get_granularity_label(offset_granularity))
+        reason = get_error_reason(error, error_code)
+        with self._lock:
+            if reason in OVERFLOW_REASONS:
+                self._overflows[combination] += 1
+            else:
+                self._errors[combination + (reason,)] += 1
+
+    def record_overflow(self, date_granularity: Any, offset_granularity: Any) -> None:
+        """
+        a call without compared date range, which is provided as None by the null overflow policy
+        """
+        combination = (get_granularity_label(date_granularity), get_granularity_label(offset_granularity))
+        with self._lock:
+            self._overflows[combination] += 1
+
+    def record_cache(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+
+    def render(self) -> str:
+        """
+        counters in OpenMetrics text format
+        """
+        with self._lock:
+            calls = sorted(self._calls.items())
+            errors = sorted(self._errors.items())
+            overflows = sorted(self._overflows.items())
+            cache_hits = self._cache_hits
+            cache_misses = self._cache_misses
+            latency_counts = sorted((combination, list(counts)) for combination, counts in self._latency_counts.items())
+            latency_sums = dict(self._latency_sums)
+
+        lines = [
+            '# TYPE deloreans_calls counter',
+            '# HELP deloreans_calls Successful calls, or rows of batches, per granularity combination.',
+        ]
+        lines.extend(f'deloreans_calls_total{_format_labels(combination)} {count}' for combination, count in calls)
+        lines.extend([
+            '# TYPE deloreans_errors counter',
+            '# HELP deloreans_errors Validation failures per granularity combination and reason.',
+        ])
+        lines.extend(f'deloreans_errors_total{_format_labels(key[:2], key[2])} {count}' for key, count in errors)
+        lines.extend([
+            '# TYPE deloreans_overflows counter',
+            '# HELP deloreans_overflows Calls without compared date range per granularity combination.',
+        ])
+        lines.extend(
+            f'deloreans_overflows_total{_format_labels(combination)} {count}' for combination, count in overflows
+        )
+        lines.extend([
+            '# TYPE deloreans_cache_hits counter',
+            '# HELP deloreans_cache_hits Lookups of cached results which are found.',
+            f'deloreans_cache_hits_total {cache_hits}',
+            '# TYPE deloreans_cache_misses counter',
+            '# HELP deloreans_cache_misses Lookups of cached results which are computed.',
+            f'deloreans_cache_misses_total {cache_misses}',
+            '# TYPE deloreans_call_duration_seconds histogram',
+            '# HELP deloreans_call_duration_seconds Latency of successful calls per granularity combination.',
+        ])
+        for combination, counts in latency_counts:
+            cumulative = 0
+            for bound, count in zip(self._latency_buckets + (float('inf'),), counts):
+                cumulative += count
+                lines.append(
+                    f'deloreans_call_duration_seconds_bucket'
+                    f'{_format_labels(combination, le=_format_bound(bound))} {cumulative}'
+                )
+            lines.append(
+                f'deloreans_call_duration_seconds_sum{_format_labels(combination)} '
+                f'{latency_sums.get(combination, 0) / 1e9!r}'
+            )
+            lines.append(f'deloreans_call_duration_seconds_count{_format_labels(combination)} {cumulative}')
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+
+def _format_labels(combination: Sequence[str], reason: Optional[str] = None, le: Optional[str] = None) -> str:
+    labels = [f'date_granularity="{combination[0]}"', f'offset_granularity="{combination[1]}"']
+    if reason is not None:
+        labels.append(f'reason="{_escape_label_value(reason)}"')
+    if le is not None:
+        labels.append(f'le="{le}"')
+    return '{' + ','.join(labels) + '}'
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_bound(bound: float) -> str:
+    if bound == float('inf'):
+        return '+Inf'
+    return repr(float(bound))
+
+
+_metrics: Optional[Metrics] = None
+
+
+def enable(latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Metrics:
+    """
+    start counting on a new set of counters, which replaces the existing one
+
+    Args:
+        latency_buckets (Sequence[float]): upper bounds of histogram buckets in seconds
+
+    Returns:
+        metrics (Metrics): the enabled counters
+    """
+    global _metrics
+    _metrics = Metrics(latency_buckets)
+    return _metrics
+
+
+def disable() -> None:
+    global _metrics
+    _metrics = None
+
+
+def get_metrics() -> Optional[Metrics]:
+    return _metrics
+
+
+def render() -> str:
+    """
+    enabled counters in OpenMetrics text format, which is empty when they are disabled
+    """
+    if _metrics is None:
+        return '# EOF\n'
+    return _metrics.render()
@@ -0,0 +1,425 @@
+"""
+deloreans.out_of_core
+
+This module compares date columns larger than memory, which are read from memory-mapped files chunk by chunk,
+and compared columns are written into memory-mapped files, so that the memory is bounded by the chunk size,
+
+    python -m deloreans.out_of_core START END COMPARED_START COMPARED_END \\
+        --date-granularity monthly --offset -1 --offset-granularity yearly [--checkpoint job.checkpoint]
+
+dates are day numbers since 1970-01-01, as same as 'deloreans.vectorized',
+columns are NumPy '.npy' files of 'int32', 'int64' or 'datetime64[D]', or raw files of little-endian 'int32',
+and compared columns are in the format of start column, the '.npy' one when its path ends with '.npy'
+
+progress is recorded in the checkpoint file after each chunk is written,
+so that an interrupted run resumes from the last chunk instead of the first one,
+the checkpoint is removed once the job completes, and input files modified since it was recorded are rejected
+"""
+import argparse
+import ast
+import datetime
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from types import TracebackType
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+from .api import ERRORS_NULL, ERRORS_RAISE, validate_batch_size, validate_errors
+from .app import validate_grain_comb
+from .batch import ComparisonBatch
+from .columns import NULL_ORDINAL
+from .date_utils import DateGranularity, OffsetGranularity
+from .date_utils.calendar import Calendar, get_calendar
+from .date_utils.offset_granularity import validate_offset
+from .date_utils.overflow_policy import get_overflow_policy, OverflowPolicy
+from .exceptions import (
+    CHECKPOINT_MISMATCH_TEMPLATE,
+    INVALID_COLUMN_FILE_TEMPLATE,
+)
+from .validation import ERROR_CODE_TYPECODE
+
+
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+# amount of rows read, compared and written at once, which bounds the working memory
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+NPY_MAGIC = b'\x93NUMPY'
+NPY_SUFFIX = '.npy'
+# header of '.npy' file is padded so that the data is aligned by this amount of bytes
+NPY_ALIGNMENT = 64
+
+
+class ColumnFormat(NamedTuple):
+    """
+    element type of a column file, where 'null' is the value of the row without compared date range
+    """
+    descr: str
+    typecode: str
+    null: int
+
+
+COLUMN_FORMATS: Dict[str, ColumnFormat] = {
+    '<i4': ColumnFormat('<i4', 'i', -(1 << 31)),
+    '<i8': ColumnFormat('<i8', 'q', -(1 << 63)),
+    # integer view of 'NaT' is the null
+    '<M8[D]': ColumnFormat('<M8[D]', 'q', -(1 << 63)),
+}
+# raw files are little-endian 'int32'
+RAW_FORMAT = COLUMN_FORMATS['<i4']
+STATUS_FORMAT = ColumnFormat('|u1', ERROR_CODE_TYPECODE, 0)
+
+
+class MappedColumn:
+    """
+    1-D column of a memory-mapped file, which is a '.npy' file or a raw one without header,
+    rows are read and written by ranges as 'array.array'
+
+    Args:
+        path (str): path of the file
+        column_format (ColumnFormat): element type of the column
+        size (int): amount of rows
+        offset (int): bytes before the first row, which is the header of '.npy' file
+        writable (bool): the file is opened for writing when True
+    """
+
+    __slots__ = ('path', 'column_format', 'size', '_offset', '_itemsize', '_file', '_mmap')
+    path: str
+    column_format: ColumnFormat
+    size: int
+    _offset: int
+    _itemsize: int
+    _file: Any
+    _mmap: Optional[mmap.mmap]
+
+    def __init__(self, path: str, column_format: ColumnFormat, size: int, offset: int, writable: bool = False):
+        self.path = path
+        self.column_format = column_format
+        self.size = size
+        self._offset = offset
+        self._itemsize = array(column_format.typecode).itemsize
+        self._file = open(path, 'r+b' if writable else 'rb')
+        self._mmap = None
+        if size:
+            # empty file can't be mapped
+            self._mmap = mmap.mmap(
+                self._file.fileno(),
+                0,
+                access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ,
+            )
+
+    @classmethod
+    def open(cls, path: str) -> 'MappedColumn':
+        """
+        open an input column, whose format is read from the header of '.npy' file
+        """
+        with open(path, 'rb') as file:
+            is_npy = file.read(len(NPY_MAGIC)) == NPY_MAGIC
+        if is_npy:
+            column_format, size, offset = read_npy_header(path)
+            return cls(path, column_format, size, offset)
+        file_size = os.path.getsize(path)
+        itemsize = array(RAW_FORMAT.typecode).itemsize
+        if file_size % itemsize:
+            raise ValueError(
+                INVALID_COLUMN_FILE_TEMPLATE.format(path=path, reason=f'size is not a multiple of {itemsize} bytes')
+            )
+        return cls(path, RAW_FORMAT, file_size // itemsize, 0)
+
+    @classmethod
+    def create(cls, path: str, column_format: ColumnFormat, size: int, resume: bool = False) -> 'MappedColumn':
+        """
+        open an output column, which is '.npy' file when the path ends with '.npy'
+
+        the existing file is kept when resuming, otherwise the file is created with given size
+        """
+        header = get_npy_header(column_format, size) if path.endswith(NPY_SUFFIX) else b''
+        file_size = len(header) + size * array(column_format.typecode).itemsize
+        if resume:
+            if not os.path.exists(path) or os.path.getsize(path) != file_size:
+                raise ValueError(
+                    INVALID_COLUMN_FILE_TEMPLATE.format(path=path, reason='it is inconsistent with the checkpoint')
+                )
+        else:
+            with open(path, 'wb') as file:
+                file.write(header)
+                file.truncate(file_size)
+        return cls(path, column_format, size, len(header), writable=True)
+
+    def read(self, start: int, stop: int) -> 'array[int]':
+        column = array(self.column_format.typecode)
+        if self._mmap is not None:
+            column.frombytes(self._mmap[self._offset + start * self._itemsize:self._offset + stop * self._itemsize])
+            if sys.byteorder == 'big':
+                column.byteswap()
+        return column
+
+    def write(self, start: int, column: 'array[int]') -> None:
+        if self._mmap is None:
+            return
+        if sys.byteorder == 'big':
+            column = array(column.typecode, column)
+            column.byteswap()
+        position = self._offset + start * self._itemsize
+        self._mmap[position:position + len(column) * self._itemsize] = column.tobytes()
+
+    def flush(self) -> None:
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MappedColumn':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.path!r}, {self.column_format.descr!r}, size={self.size})'
+
+
+def read_npy_header(path: str) -> Tuple[ColumnFormat, int, int]:
+    """
+    format, amount of rows and header size of 1-D '.npy' file,
+    refer to: https://numpy.org/doc/stable/reference/generated/numpy.lib.format.html
+    """
+    with open(path, 'rb') as file:
+        prefix = file.read(len(NPY_MAGIC) + 2)
+        major_version = prefix[-2]
+        length_format = '<H' if major_version == 1 else '<I'
+        header_length, = struct.unpack(length_format, file.read(struct.calcsize(length_format)))
+        offset = file.tell() + header_length
+        try:
+            header = ast.literal_eval(file.read(header_length).decode('latin1'))
+        except (SyntaxError, ValueError):
+            header = None
+    if not isinstance(header, dict) or set(header) != {'descr', 'fortran_order', 'shape'}:
+        raise ValueError(INVALID_COLUMN_FILE_TEMPLATE.format(path=path, reason='header is malformed'))
+    column_format = COLUMN_FORMATS.get(header['descr'])
+    if column_format is None:
+        raise ValueError(
+            INVALID_COLUMN_FILE_TEMPLATE.format(
+                path=path,
+                reason=f"dtype {header['descr']} should be one of {tuple(COLUMN_FORMATS)}",
+            )
+        )
+    if len(header['shape']) != 1:
+        raise ValueError(INVALID_COLUMN_FILE_TEMPLATE.format(path=path, reason='it should be 1-D'))
+    return column_format, header['shape'][0], offset
+
+
+def get_npy_header(column_format: ColumnFormat, size: int) -> bytes:
+    """
+    header of 1-D '.npy' file in version 1.0
+    """
+    header = repr({'descr': column_format.descr, 'fortran_order': False, 'shape': (size,)}).encode('latin1')
+    prefix_length = len(NPY_MAGIC) + 2 + 2
+    padding = -(prefix_length + len(header) + 1) % NPY_ALIGNMENT
+    header += b' ' * padding + b'\n'
+    return NPY_MAGIC + b'\x01\x00' + struct.pack('<H', len(header)) + header
+
+
+def compare_files(
+    start_path: str,
+    end_path: str,
+    compared_start_path: str,
+    compared_end_path: str,
+    date_granularity: DateGranularity,
+    offset: int,
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar] = 0,
+    statuses_path: Optional[str] = None,
+    errors: str = ERRORS_RAISE,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checkpoint_path: Optional[str] = None,
+) -> int:
+    """
+    compare the date ranges of start and end columns, and write compared columns chunk by chunk,
+    the rows without compared date range are the null of the column format, e.g. 'NaT' of 'datetime64[D]'
+
+    Args:
+        start_path (str): column of start dates
+        end_path (str): column of end dates
+        compared_start_path (str): output column of compared start dates
+        compared_end_path (str): output column of compared end dates
+        date_granularity (DateGranularity): granularity of all date ranges
+        offset (int): offset away from all date ranges
+        offset_granularity (OffsetGranularity): granularity of offset periods
+        firstweekday (int | Calendar): start weekday of week, or calendar of it
+        statuses_path (str | None): output column of 'ErrorCode' of each row as 'uint8', not written when None
+        errors (str): 'raise' on the first invalid row, or 'null' to flag invalid rows in statuses
+        overflow (OverflowPolicy | str): handling of the start date without counterpart in compared date period
+        chunk_size (int): amount of rows in each chunk
+        checkpoint_path (str | None): file recording the progress, the run resumes from it when it exists
+
+    Returns:
+        size (int): amount of rows in the columns
+    """
+    validate_errors(errors)
+    validate_batch_size(chunk_size)
+    validate_offset(offset)
+    validate_grain_comb(date_granularity, offset_granularity)
+    calendar = get_calendar(firstweekday)
+    overflow = get_overflow_policy(overflow)
+
+    with MappedColumn.open(start_path) as start_column, MappedColumn.open(end_path) as end_column:
+        size = start_column.size
+        if end_column.size != size:
+            raise ValueError(
+                INVALID_COLUMN_FILE_TEMPLATE.format(path=end_path, reason=f'it should have {size} rows')
+            )
+        outputs = [(compared_start_path, start_column.column_format), (compared_end_path, start_column.column_format)]
+        if statuses_path is not None:
+            outputs.append((statuses_path, STATUS_FORMAT))
+        job = {
+            # modification times are involved, so that modified inputs are never resumed on the stale outputs
+            'inputs': [[os.path.abspath(path), os.stat(path).st_mtime_ns] for path in (start_path, end_path)],
+            'outputs': [os.path.abspath(path) for path, _ in outputs],
+            'size': size,
+            'date_granularity': date_granularity.name,
+            'offset': offset,
+            'offset_granularity': offset_granularity.name,
+            'firstweekday': calendar.firstweekday,
+            'errors': errors,
+            'overflow': overflow.value,
+        }
+        done = load_checkpoint(checkpoint_path, job)
+
+        output_columns = []
+        try:
+            for path, column_format in outputs:
+                output_columns.append(MappedColumn.create(path, column_format, size, resume=done > 0))
+            for start in range(done, size, chunk_size):
+                stop = min(start + chunk_size, size)
+                batch = ComparisonBatch.from_ordinals(
+                    [day + EPOCH_ORDINAL for day in start_column.read(start, stop)],
+                    [day + EPOCH_ORDINAL for day in end_column.read(start, stop)],
+                    date_granularity,
+                    offset,
+                    offset_granularity,
+                    calendar,
+                    errors,
+                    overflow,
+                )
+                compared_columns = [
+                    _to_days(batch.compared_start_ordinals, start_column.column_format),
+                    _to_days(batch.compared_end_ordinals, start_column.column_format),
+                    array(ERROR_CODE_TYPECODE, batch.statuses),
+                ]
+                for output_column, compared_column in zip(output_columns, compared_columns):
+                    output_column.write(start, compared_column)
+                    # written chunk should be persisted before it is recorded
+                    output_column.flush()
+                save_checkpoint(checkpoint_path, job, stop)
+        finally:
+            for output_column in output_columns:
+                output_column.close()
+    # completed, so that running the job again starts over instead of doing nothing
+    remove_checkpoint(checkpoint_path)
+    return size
+
+
+def _to_days(ordinals: Sequence[int], column_format: ColumnFormat) -> 'array[int]':
+    null = column_format.null
+    return array(
+        column_format.typecode,
+        [ordinal - EPOCH_ORDINAL if ordinal != NULL_ORDINAL else null for ordinal in ordinals],
+    )
+
+
+def load_checkpoint(checkpoint_path: Optional[str], job: Dict[str, Any]) -> int:
+    """
+    amount of rows already written by the same job, which is 0 without checkpoint
+    """
+    if checkpoint_path is None or not os.path.exists(checkpoint_path):
+        return 0
+    with open(checkpoint_path) as file:
+        checkpoint = json.load(file)
+    if checkpoint.get('job') != job:
+        raise ValueError(CHECKPOINT_MISMATCH_TEMPLATE.format(checkpoint_path=checkpoint_path))
+    return checkpoint['rows']
+
+
+def save_checkpoint(checkpoint_path: Optional[str], job: Dict[str, Any], rows: int) -> None:
+    """
+    record the amount of written rows, the file is replaced atomically so that it is never partial
+    """
+    if checkpoint_path is None:
+        return
+    temporary_path = f'{checkpoint_path}.tmp'
+    with open(temporary_path, 'w') as file:
+        json.dump({'job': job, 'rows': rows}, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, checkpoint_path)
+
+
+def remove_checkpoint(checkpoint_path: Optional[str]) -> None:
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m deloreans.out_of_core',
+        description='compare date columns of memory-mapped files chunk by chunk',
+    )
+    parser.add_argument('start_path', help='column of start dates')
+    parser.add_argument('end_path', help='column of end dates')
+    parser.add_argument('compared_start_path', help='output column of compared start dates')
+    parser.add_argument('compared_end_path', help='output column of compared end dates')
+    parser.add_argument(
+        '--date-granularity',
+        required=True,
+        choices=[item.name.lower() for item in DateGranularity],
+        help='granularity of date ranges',
+    )
+    parser.add_argument('--offset', type=int, required=True, help='offset away from date ranges')
+    parser.add_argument(
+        '--offset-granularity',
+        required=True,
+        choices=[item.name.lower() for item in OffsetGranularity],
+        help='granularity of offset periods',
+    )
+    parser.add_argument('--firstweekday', type=int, default=0, help='start weekday of week, 0 is Monday')
+    parser.add_argument('--statuses', dest='statuses_path', help='output column of error code of each row')
+    parser.add_argument('--errors', choices=(ERRORS_RAISE, ERRORS_NULL), default=ERRORS_RAISE)
+    parser.add_argument('--overflow', choices=[item.value for item in OverflowPolicy], default='raise')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='amount of rows in each chunk')
+    parser.add_argument('--checkpoint', dest='checkpoint_path', help='file to record progress and resume from')
+    args = parser.parse_args(argv)
+
+    size = compare_files(
+        args.start_path,
+        args.end_path,
+        args.compared_start_path,
+        args.compared_end_path,
+        DateGranularity[args.date_granularity.upper()],
+        args.offset,
+        OffsetGranularity[args.offset_granularity.upper()],
+        args.firstweekday,
+        args.statuses_path,
+        args.errors,
+        args.overflow,
+        args.chunk_size,
+        args.checkpoint_path,
+    )
+    print(f'{size} rows are compared into {args.compared_start_path} and {args.compared_end_path}')
+
+
+if __name__ == '__main__':
+    main()
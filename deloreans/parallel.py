@@ -0,0 +1,407 @@
+"""
+deloreans.parallel
+
+This module provides batch comparison on a process pool for very large batches,
+given rows are split into chunks which move among processes as columns of integer ordinals,
+and results are reassembled in the order of given rows
+"""
+import datetime
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .api import ERRORS_RAISE, validate_batch_size, validate_errors
+from .app import get_compared_ordinal_range, get_stage_funcs
+from .columns import NULL_ORDINAL, ORDINAL_TYPECODE, pack_column, pack_dates
+from .date_utils import _as_column, _strict_zip, ComparedRange, DateGranularity, OffsetGranularity
+from .date_utils.calendar import Calendar, get_calendar
+from .date_utils.date_range import validate_date_granularity_type
+from .date_utils.offset_granularity import validate_offset, validate_offset_granularity_type
+from .date_utils.overflow_policy import get_overflow_policy, OverflowPolicy
+from .date_utils.ordinal import (
+    validate_ordinal,
+    validate_ordinal_date_completion,
+    validate_ordinal_relativity,
+)
+from .exceptions import (
+    INCONSISTENT_COLUMN_LENGTH_TEMPLATE,
+    INVALID_DATA_TYPE_TEMPLATE,
+    INVALID_WORKERS_ERROR_MSG,
+)
+from .validation import get_ordinal_row_error_code
+
+
+# amount of rows in each chunk sent to a worker
+DEFAULT_CHUNK_SIZE = 65536
+
+
+# columns are packed as raw machine values by 'array.array'
+OFFSET_TYPECODE = 'q'
+# index of (date_granularity, offset_granularity, firstweekday) combination, which is less than 4 * 5 * 7
+COMBO_TYPECODE = 'B'
+# combination index of the row flagged as invalid while packing with errors='null', which is never a valid index
+INVALID_COMBO_INDEX = 255
+
+
+Combo = Tuple[DateGranularity, OffsetGranularity, int]
+
+
+def get_many(
+    start_dates: Sequence[datetime.date],
+    end_dates: Sequence[datetime.date],
+    date_granularities: Union[DateGranularity, Sequence[DateGranularity]],
+    offsets: Union[int, Sequence[int]],
+    offset_granularities: Union[OffsetGranularity, Sequence[OffsetGranularity]],
+    firstweekdays: Union[int, Calendar, Sequence[Union[int, Calendar]]] = 0,
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    errors: str = ERRORS_RAISE,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+) -> List[Optional[ComparedRange]]:
+    """
+    as same as 'deloreans.api.get_many' while chunks are processed by a process pool
+
+    Args:
+        start_dates (Sequence[datetime.date]): start dates of date ranges
+        end_dates (Sequence[datetime.date]): end dates of date ranges
+        date_granularities (DateGranularity | Sequence[DateGranularity]): granularities of date ranges,
+                                                                          single one is applied to all rows
+        offsets (int | Sequence[int]): offsets away from date ranges, single one is applied to all rows
+        offset_granularities (OffsetGranularity | Sequence[OffsetGranularity]): granularities of offset periods,
+                                                                                single one is applied to all rows
+        firstweekdays (int | Calendar | Sequence[int | Calendar]): start weekdays of week, or calendars of them,
+                                                                   single one is applied to all rows
+        max_workers (int | None): amount of worker processes, the amount of CPUs when None
+        chunk_size (int): amount of rows in each chunk
+        errors (str): handling of invalid rows, 'raise' on the first one, or 'null' to provide None for each
+        overflow (OverflowPolicy | str): handling of the start date without counterpart in compared date period
+
+    Returns:
+        compared_date_ranges (List[ComparedRange | None]): compared start and end dates of each row
+    """
+    validate_errors(errors)
+    is_raised = errors == ERRORS_RAISE
+    start_ordinals = pack_dates(start_dates, is_raised)
+    end_ordinals = pack_dates(end_dates, is_raised)
+    compared_start_ordinals, compared_end_ordinals = _run(
+        start_ordinals,
+        end_ordinals,
+        date_granularities,
+        offsets,
+        offset_granularities,
+        firstweekdays,
+        max_workers,
+        chunk_size,
+        is_raised,
+        overflow,
+    )
+    fromordinal = datetime.date.fromordinal
+    return [
+        ComparedRange(fromordinal(compared_start_ordinal), fromordinal(compared_end_ordinal))
+        if compared_start_ordinal != NULL_ORDINAL else None
+        for compared_start_ordinal, compared_end_ordinal in zip(compared_start_ordinals, compared_end_ordinals)
+    ]
+
+
+def get_many_ordinal(
+    start_ordinals: Sequence[int],
+    end_ordinals: Sequence[int],
+    date_granularities: Union[DateGranularity, Sequence[DateGranularity]],
+    offsets: Union[int, Sequence[int]],
+    offset_granularities: Union[OffsetGranularity, Sequence[OffsetGranularity]],
+    firstweekdays: Union[int, Calendar, Sequence[Union[int, Calendar]]] = 0,
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    errors: str = ERRORS_RAISE,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+) -> Tuple['array[int]', 'array[int]']:
+    """
+    as same as 'get_many' while dates are represented by proleptic Gregorian ordinals,
+    columns are provided as 'array.array' so that no 'datetime.date' is ever created,
+    the rows without compared date range are 'NULL_ORDINAL' when overflow policy is null,
+    as well as invalid rows when errors is null
+
+    Returns:
+        compared_start_ordinals (array[int]): start ordinals of compared date ranges
+        compared_end_ordinals (array[int]): end ordinals of compared date ranges
+    """
+    validate_errors(errors)
+    is_raised = errors == ERRORS_RAISE
+    # invalid ordinals are packed as 'NULL_ORDINAL', which is flagged as invalid date range in workers
+    return _run(
+        pack_column(ORDINAL_TYPECODE, start_ordinals, validate_ordinal, None if is_raised else []),
+        pack_column(ORDINAL_TYPECODE, end_ordinals, validate_ordinal, None if is_raised else []),
+        date_granularities,
+        offsets,
+        offset_granularities,
+        firstweekdays,
+        max_workers,
+        chunk_size,
+        is_raised,
+        overflow,
+    )
+
+
+def validate_max_workers(max_workers: Optional[int]) -> None:
+    if max_workers is None:
+        return
+    if not isinstance(max_workers, int):
+        raise TypeError(
+            INVALID_DATA_TYPE_TEMPLATE.format(
+                input_args=max_workers,
+                input_dtype=type(max_workers),
+                dtype=int,
+            )
+        )
+    if max_workers < 1:
+        raise ValueError(INVALID_WORKERS_ERROR_MSG)
+
+
+def _run(
+    start_ordinals: 'array[int]',
+    end_ordinals: 'array[int]',
+    date_granularities: Union[DateGranularity, Sequence[DateGranularity]],
+    offsets: Union[int, Sequence[int]],
+    offset_granularities: Union[OffsetGranularity, Sequence[OffsetGranularity]],
+    firstweekdays: Union[int, Calendar, Sequence[Union[int, Calendar]]],
+    max_workers: Optional[int],
+    chunk_size: int,
+    is_raised: bool,
+    overflow: Union[OverflowPolicy, str],
+) -> Tuple['array[int]', 'array[int]']:
+    """
+    compare packed columns by chunks,
+    invalid rows raise when 'is_raised' is True, otherwise they are compared as 'NULL_ORDINAL'
+    """
+    overflow = get_overflow_policy(overflow)
+    validate_max_workers(max_workers)
+    validate_batch_size(chunk_size)
+    size = len(start_ordinals)
+    combos, combo_indexes = _pack_combos(date_granularities, offset_granularities, firstweekdays, size, is_raised)
+    invalid_rows: Optional[List[int]] = None if is_raised else []
+    if isinstance(offsets, int):
+        validate_offset(offsets)
+        offset_column = array(OFFSET_TYPECODE, [offsets]) * size
+    else:
+        offset_column = pack_column(OFFSET_TYPECODE, _as_column(offsets, size), validate_offset, invalid_rows)
+    for column in (end_ordinals, offset_column):
+        if len(column) != size:
+            raise ValueError(INCONSISTENT_COLUMN_LENGTH_TEMPLATE.format(length=len(column), size=size))
+    for index in invalid_rows or ():
+        combo_indexes[index] = INVALID_COMBO_INDEX
+
+    chunks = (
+        (
+            combos,
+            is_raised,
+            overflow,
+            start_ordinals[index:index + chunk_size].tobytes(),
+            end_ordinals[index:index + chunk_size].tobytes(),
+            offset_column[index:index + chunk_size].tobytes(),
+            combo_indexes[index:index + chunk_size].tobytes(),
+        )
+        for index in range(0, size, chunk_size)
+    )
+    compared_start_ordinals = array(ORDINAL_TYPECODE)
+    compared_end_ordinals = array(ORDINAL_TYPECODE)
+    for compared_start_chunk, compared_end_chunk in _map_chunks(
+        _compare_chunk,
+        chunks,
+        max_workers,
+        size <= chunk_size,
+    ):
+        compared_start_ordinals.frombytes(compared_start_chunk)
+        compared_end_ordinals.frombytes(compared_end_chunk)
+    return compared_start_ordinals, compared_end_ordinals
+
+
+def _map_chunks(
+    func: Callable[..., Any],
+    chunks: Iterable[Tuple[Any, ...]],
+    max_workers: Optional[int],
+    is_sequential: bool = False,
+) -> Iterator[Any]:
+    """
+    apply function on the arguments of each chunk, and provide results in the given order,
+    at most two chunks per worker are in flight so that the memory is bounded whatever the size
+    """
+    if max_workers == 1 or is_sequential:
+        # not worth spawning processes
+        for chunk in chunks:
+            yield func(*chunk)
+        return
+
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending: Deque['Future[Any]'] = deque()
+        try:
+            for chunk in chunks:
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(func, *chunk))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _compare_chunk(
+    combos: List[Combo],
+    is_raised: bool,
+    overflow: OverflowPolicy,
+    start_ordinals: bytes,
+    end_ordinals: bytes,
+    offsets: bytes,
+    combo_indexes: bytes,
+) -> Tuple[bytes, bytes]:
+    """
+    compare the rows of a chunk in worker process, columns are packed in bytes of 'array.array',
+    invalid rows raise when 'is_raised' is True, otherwise they are compared as 'NULL_ORDINAL'
+    """
+    start_column = array(ORDINAL_TYPECODE)
+    start_column.frombytes(start_ordinals)
+    end_column = array(ORDINAL_TYPECODE)
+    end_column.frombytes(end_ordinals)
+    offset_column = array(OFFSET_TYPECODE)
+    offset_column.frombytes(offsets)
+    combo_index_column = array(COMBO_TYPECODE)
+    combo_index_column.frombytes(combo_indexes)
+    stage_funcs_of_combos = [
+        get_stage_funcs(date_granularity, offset_granularity)
+        for date_granularity, offset_granularity, _ in combos
+    ]
+    calendars_of_combos = [get_calendar(firstweekday) for _, _, firstweekday in combos]
+
+    compared_start_column = array(ORDINAL_TYPECODE)
+    compared_end_column = array(ORDINAL_TYPECODE)
+    for start_ordinal, end_ordinal, offset, combo_index in zip(
+        start_column,
+        end_column,
+        offset_column,
+        combo_index_column,
+    ):
+        compared_ordinal_range = None
+        if combo_index != INVALID_COMBO_INDEX:
+            date_granularity, offset_granularity, firstweekday = combos[combo_index]
+            if is_raised:
+                validate_ordinal(start_ordinal)
+                validate_ordinal(end_ordinal)
+                validate_ordinal_relativity(start_ordinal, end_ordinal)
+                validate_ordinal_date_completion(start_ordinal, end_ordinal, date_granularity, firstweekday)
+                is_valid = True
+            else:
+                is_valid = not get_ordinal_row_error_code(
+                    start_ordinal,
+                    end_ordinal,
+                    date_granularity,
+                    offset,
+                    firstweekday,
+                )
+            if is_valid:
+                try:
+                    compared_ordinal_range = get_compared_ordinal_range(
+                        start_ordinal,
+                        end_ordinal,
+                        date_granularity,
+                        offset,
+                        offset_granularity,
+                        calendars_of_combos[combo_index],
+                        stage_funcs_of_combos[combo_index],
+                        overflow,
+                    )
+                    if compared_ordinal_range is not None:
+                        validate_ordinal(compared_ordinal_range[0])
+                        validate_ordinal(compared_ordinal_range[1])
+                except ValueError:
+                    # no compared date range, or it is out of the range of 'datetime.date'
+                    if is_raised:
+                        raise
+                    compared_ordinal_range = None
+        if compared_ordinal_range is None:
+            compared_start_column.append(NULL_ORDINAL)
+            compared_end_column.append(NULL_ORDINAL)
+            continue
+        compared_start_ordinal, compared_end_ordinal = compared_ordinal_range
+        compared_start_column.append(compared_start_ordinal)
+        compared_end_column.append(compared_end_ordinal)
+    return compared_start_column.tobytes(), compared_end_column.tobytes()
+
+
+def _pack_combos(
+    date_granularities: Union[DateGranularity, Sequence[DateGranularity]],
+    offset_granularities: Union[OffsetGranularity, Sequence[OffsetGranularity]],
+    firstweekdays: Union[int, Calendar, Sequence[Union[int, Calendar]]],
+    size: int,
+    is_raised: bool = True,
+) -> Tuple[List[Combo], 'array[int]']:
+    """
+    distinct granularity combinations and the index of each row's combination,
+    each combination is validated once, and calendars are sent to workers by their first weekdays,
+    invalid combinations raise when 'is_raised' is True, otherwise their rows are 'INVALID_COMBO_INDEX'
+    """
+    if isinstance(date_granularities, DateGranularity) \
+            and isinstance(offset_granularities, OffsetGranularity) \
+            and isinstance(firstweekdays, (int, Calendar)):
+        # the most common case, a single combination is applied to all rows
+        try:
+            combo = _validate_combo(date_granularities, offset_granularities, firstweekdays)
+        except (TypeError, ValueError):
+            if is_raised:
+                raise
+            return [], array(COMBO_TYPECODE, [INVALID_COMBO_INDEX]) * size
+        return [combo], array(COMBO_TYPECODE, bytes(size))
+
+    combos: List[Combo] = []
+    # types are involved since invalid '0.0' is equal to valid '0'
+    indexes: Dict[Tuple[Any, ...], int] = {}
+    validated_indexes: Dict[Combo, int] = {}
+    combo_indexes = array(COMBO_TYPECODE)
+    for combo in _strict_zip(
+        _as_column(date_granularities, size),
+        _as_column(offset_granularities, size),
+        _as_column(firstweekdays, size),
+    ):
+        key = combo + (type(combo[2]),)
+        try:
+            index = indexes.get(key)
+            is_hashable = True
+        except TypeError:
+            # unhashable, which is never a valid combination
+            index = None
+            is_hashable = False
+        if index is None:
+            try:
+                validated_combo = _validate_combo(*combo)
+            except (TypeError, ValueError):
+                if is_raised:
+                    raise
+                index = INVALID_COMBO_INDEX
+            else:
+                index = validated_indexes.get(validated_combo)
+                if index is None:
+                    index = validated_indexes[validated_combo] = len(combos)
+                    combos.append(validated_combo)
+            if is_hashable:
+                indexes[key] = index
+        combo_indexes.append(index)
+    if len(combo_indexes) != size:
+        raise ValueError(INCONSISTENT_COLUMN_LENGTH_TEMPLATE.format(length=len(combo_indexes), size=size))
+    return combos, combo_indexes
+
+
+def _validate_combo(
+    date_granularity: DateGranularity,
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar],
+) -> Combo:
+    """
+    validated combination, with the first weekday of given calendar
+    """
+    calendar = get_calendar(firstweekday)
+    validate_date_granularity_type(date_granularity)
+    validate_offset_granularity_type(offset_granularity)
+    get_stage_funcs(date_granularity, offset_granularity)
+    return date_granularity, offset_granularity, calendar.firstweekday
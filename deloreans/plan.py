@@ -0,0 +1,198 @@
+"""
+deloreans.plan
+
+This module provides 'ComparisonPlan',
+which validates and binds everything except the given date range once,
+so that comparing each date range only costs the arithmetic
+"""
+import datetime
+from typing import Optional, Tuple, Union
+
+from .app import get_compared_ordinal_range, get_stage_funcs, StageFuncs
+from .date_utils import ComparedRange, DateGranularity, OffsetGranularity
+from .date_utils.calendar import Calendar, get_calendar
+from .date_utils.date_range import (
+    validate_date_granularity_type,
+    validate_date_relativity,
+    validate_date_type,
+)
+from .date_utils.immutable import _Immutable
+from .date_utils.overflow_policy import get_overflow_policy, OverflowPolicy
+from .date_utils.offset_granularity import (
+    validate_offset,
+    validate_offset_granularity_type,
+)
+from .date_utils.ordinal import (
+    validate_ordinal,
+    validate_ordinal_date_completion,
+    validate_ordinal_relativity,
+)
+
+
+class ComparisonPlan(_Immutable):
+    """
+    compiled comparison with fixed granularities, offset and first weekday,
+    calling it with a date range provides the compared one as same as 'deloreans.get'
+
+    plans are immutable and equal when their parameters are, so that they are hashable,
+    and pickled by their parameters which makes them portable among processes
+
+    Args:
+        date_granularity (DateGranularity): granularity of date range, e.g. daily, weekly
+        offset (int): away from given date range, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int | Calendar): define the start date's weekday of week, 0 is Monday, 6 is Sunday,
+                                       or the calendar of it, whose cached week boundaries are reused
+        overflow (OverflowPolicy | str): handling of the start date without counterpart in compared date period
+    """
+
+    __slots__ = (
+        '_date_granularity',
+        '_offset',
+        '_offset_granularity',
+        '_firstweekday',
+        '_calendar',
+        '_overflow',
+        '_stage_funcs',
+    )
+    _date_granularity: DateGranularity
+    _offset: int
+    _offset_granularity: OffsetGranularity
+    _firstweekday: int
+    _calendar: Calendar
+    _overflow: OverflowPolicy
+    _stage_funcs: StageFuncs
+
+    def __init__(
+        self,
+        date_granularity: DateGranularity,
+        offset: int,
+        offset_granularity: OffsetGranularity,
+        firstweekday: Union[int, Calendar] = 0,
+        overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+    ) -> None:
+        overflow = get_overflow_policy(overflow)
+        calendar = get_calendar(firstweekday)
+        validate_date_granularity_type(date_granularity)
+        validate_offset(offset)
+        validate_offset_granularity_type(offset_granularity)
+        stage_funcs = get_stage_funcs(date_granularity, offset_granularity)
+
+        object.__setattr__(self, '_date_granularity', date_granularity)
+        object.__setattr__(self, '_offset', offset)
+        object.__setattr__(self, '_offset_granularity', offset_granularity)
+        object.__setattr__(self, '_firstweekday', calendar.firstweekday)
+        object.__setattr__(self, '_calendar', calendar)
+        object.__setattr__(self, '_overflow', overflow)
+        object.__setattr__(self, '_stage_funcs', stage_funcs)
+
+    @property
+    def date_granularity(self) -> DateGranularity:
+        return self._date_granularity
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    @property
+    def offset_granularity(self) -> OffsetGranularity:
+        return self._offset_granularity
+
+    @property
+    def firstweekday(self) -> int:
+        return self._firstweekday
+
+    @property
+    def calendar(self) -> Calendar:
+        return self._calendar
+
+    @property
+    def overflow(self) -> OverflowPolicy:
+        return self._overflow
+
+    def _key(self) -> Tuple[DateGranularity, int, OffsetGranularity, int, OverflowPolicy]:
+        return self._date_granularity, self._offset, self._offset_granularity, self._firstweekday, self._overflow
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}({self._date_granularity}, {self._offset}, '
+            f'{self._offset_granularity}, firstweekday={self._firstweekday}, overflow={self._overflow})'
+        )
+
+    def __call__(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+    ) -> Optional[ComparedRange]:
+        """
+        provide compared date range of given one
+
+        Args:
+            start_date (datetime.date): start date of date range
+            end_date (datetime.date): end date of date range
+
+        Returns:
+            compared_start_date (datetime.date): start date of compared date range
+            compared_end_date (datetime.date): end date of compared date range
+            or None when it doesn't exist and overflow policy is null
+        """
+        validate_date_type(start_date)
+        validate_date_type(end_date)
+        validate_date_relativity(start_date, end_date)
+        start_ordinal = start_date.toordinal()
+        end_ordinal = end_date.toordinal()
+        validate_ordinal_date_completion(start_ordinal, end_ordinal, self._date_granularity, self._firstweekday)
+
+        compared_ordinal_range = get_compared_ordinal_range(
+            start_ordinal,
+            end_ordinal,
+            self._date_granularity,
+            self._offset,
+            self._offset_granularity,
+            self._calendar,
+            self._stage_funcs,
+            self._overflow,
+        )
+        if compared_ordinal_range is None:
+            return None
+        compared_start_ordinal, compared_end_ordinal = compared_ordinal_range
+        return ComparedRange(
+            datetime.date.fromordinal(compared_start_ordinal),
+            datetime.date.fromordinal(compared_end_ordinal),
+        )
+
+    def get_ordinal(
+        self,
+        start_ordinal: int,
+        end_ordinal: int,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        provide compared date range of given one,
+        dates are represented by proleptic Gregorian ordinals (see 'datetime.date.toordinal')
+        """
+        validate_ordinal(start_ordinal)
+        validate_ordinal(end_ordinal)
+        validate_ordinal_relativity(start_ordinal, end_ordinal)
+        validate_ordinal_date_completion(
+            start_ordinal,
+            end_ordinal,
+            self._date_granularity,
+            self._firstweekday,
+        )
+
+        compared_ordinal_range = get_compared_ordinal_range(
+            start_ordinal,
+            end_ordinal,
+            self._date_granularity,
+            self._offset,
+            self._offset_granularity,
+            self._calendar,
+            self._stage_funcs,
+            self._overflow,
+        )
+        if compared_ordinal_range is None:
+            return None
+        compared_start_ordinal, compared_end_ordinal = compared_ordinal_range
+        validate_ordinal(compared_start_ordinal)
+        validate_ordinal(compared_end_ordinal)
+        return compared_start_ordinal, compared_end_ordinal
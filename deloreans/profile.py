@@ -0,0 +1,199 @@
+"""
+deloreans.profile
+
+This module profiles a representative workload of each valid granularity combination by cProfile,
+
+    python -m deloreans.profile [--rows 2000] [--top 20] [--sort cumulative] [--output-dir profile_report]
+
+which writes '<date_granularity>_<offset_granularity>.pstats' of each combination,
+and 'summary.txt' of the top functions of each combination, into the output directory
+"""
+import argparse
+import cProfile
+import datetime
+import io
+import os
+import pstats
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .api import compile, get, get_many
+from .date_utils import DateGranularity, OffsetGranularity, VALID_GRAINS_COMB
+from .date_utils.ordinal import DATE_GRANULARITY_FUNCS
+from .date_utils.overflow_policy import OverflowPolicy
+from .exceptions import INVALID_WORKLOAD_ROWS_ERROR_MSG, WORKLOAD_ROWS_OVERFLOW_TEMPLATE
+
+
+DEFAULT_ROWS = 2000
+DEFAULT_TOP = 20
+DEFAULT_OUTPUT_DIR = 'profile_report'
+SORT_KEYS = ('cumulative', 'tottime', 'ncalls')
+
+# given date ranges start from this date, with 1 to 3 periods
+WORKLOAD_START_DATE = datetime.date(2000, 1, 1)
+WORKLOAD_MAX_LENGTH = 3
+OFFSETS = (-1, -2, 1)
+# given date ranges end by this date, so that compared date ranges,
+# which are at most 'max(OFFSETS) * WORKLOAD_MAX_LENGTH' years later, end by 'datetime.date.max'
+WORKLOAD_END_DATE = datetime.date(datetime.date.max.year - max(OFFSETS) * WORKLOAD_MAX_LENGTH, 12, 31)
+FIRSTWEEKDAYS = (0, 6)
+
+# rows of date ranges, offset and first weekday
+Workload = List[Tuple[datetime.date, datetime.date, int, int]]
+
+
+def make_workload(date_granularity: DateGranularity, rows: int) -> Workload:
+    """
+    complete date ranges of given granularity with varied length, offset and first weekday,
+    start dates are consecutive ones of the granularity since 'WORKLOAD_START_DATE',
+    where the next start date of each first weekday is right after the end of the period,
+    raise ValueError when given amount of rows is not positive, or the date ranges run past 'WORKLOAD_END_DATE'
+    """
+    if rows < 1:
+        raise ValueError(INVALID_WORKLOAD_ROWS_ERROR_MSG)
+    is_start_date, _, _, get_end_date = DATE_GRANULARITY_FUNCS[date_granularity]
+    # 'WORKLOAD_START_DATE' is the start of a year, which is followed by the start of every week within a week
+    start_ordinal = WORKLOAD_START_DATE.toordinal()
+    max_end_ordinal = WORKLOAD_END_DATE.toordinal()
+    next_start_ordinals = {
+        firstweekday: next(
+            ordinal for ordinal in range(start_ordinal, start_ordinal + 7) if is_start_date(ordinal, firstweekday)
+        )
+        for firstweekday in FIRSTWEEKDAYS
+    }
+    workload: Workload = []
+    while len(workload) < rows:
+        # the earliest start date, in the order of 'FIRSTWEEKDAYS' when they are the same
+        firstweekday = min(FIRSTWEEKDAYS, key=next_start_ordinals.__getitem__)
+        ordinal = next_start_ordinals[firstweekday]
+        length = len(workload) % WORKLOAD_MAX_LENGTH + 1
+        end_ordinal = get_end_date(ordinal, length)
+        if end_ordinal > max_end_ordinal:
+            raise ValueError(
+                WORKLOAD_ROWS_OVERFLOW_TEMPLATE.format(
+                    max_rows=len(workload),
+                    date_granularity_name=date_granularity.name.lower(),
+                    start_date=WORKLOAD_START_DATE,
+                    end_date=WORKLOAD_END_DATE,
+                    rows=rows,
+                )
+            )
+        workload.append((
+            datetime.date.fromordinal(ordinal),
+            datetime.date.fromordinal(end_ordinal),
+            OFFSETS[len(workload) % len(OFFSETS)],
+            firstweekday,
+        ))
+        next_start_ordinals[firstweekday] = get_end_date(ordinal, 1) + 1
+    return workload
+
+
+def get_entry_points(
+    date_granularity: DateGranularity,
+    offset_granularity: OffsetGranularity,
+    workload: Workload,
+) -> Dict[str, Callable[[], object]]:
+    """
+    callables running the workload on each entry point,
+    the start date without counterpart in compared date period is provided as None instead of raising
+    """
+    def run_get() -> object:
+        return [
+            get(
+                start_date,
+                end_date,
+                date_granularity,
+                offset,
+                offset_granularity,
+                firstweekday,
+                OverflowPolicy.NULL,
+            )
+            for start_date, end_date, offset, firstweekday in workload
+        ]
+
+    def run_get_many() -> object:
+        start_dates, end_dates, offsets, firstweekdays = zip(*workload)
+        return get_many(
+            start_dates,
+            end_dates,
+            date_granularity,
+            offsets,
+            offset_granularity,
+            firstweekdays,
+            overflow=OverflowPolicy.NULL,
+        )
+
+    def run_plan() -> object:
+        plans = {
+            (offset, firstweekday): compile(date_granularity, offset, offset_granularity, firstweekday, 'null')
+            for offset in OFFSETS
+            for firstweekday in FIRSTWEEKDAYS
+        }
+        return [
+            plans[(offset, firstweekday)](start_date, end_date)
+            for start_date, end_date, offset, firstweekday in workload
+        ]
+
+    return {'get': run_get, 'get_many': run_get_many, 'plan': run_plan}
+
+
+def profile_combination(
+    date_granularity: DateGranularity,
+    offset_granularity: OffsetGranularity,
+    rows: int = DEFAULT_ROWS,
+    entry_point: str = 'get',
+) -> cProfile.Profile:
+    workload = make_workload(date_granularity, rows)
+    run = get_entry_points(date_granularity, offset_granularity, workload)[entry_point]
+    profiler = cProfile.Profile()
+    profiler.runcall(run)
+    return profiler
+
+
+def get_summary(profiler: cProfile.Profile, sort: str = 'cumulative', top: int = DEFAULT_TOP) -> str:
+    """
+    top functions of given profile as text, with paths of files stripped
+    """
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).strip_dirs().sort_stats(sort).print_stats(top)
+    return stream.getvalue()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m deloreans.profile',
+        description='profile a representative workload of each granularity combination by cProfile',
+    )
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS, help='amount of date ranges per combination')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help='amount of functions in the summary')
+    parser.add_argument('--sort', choices=SORT_KEYS, default='cumulative', help='sort key of the summary')
+    parser.add_argument('--entry-point', choices=('get', 'get_many', 'plan'), default='get', help='API to profile')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='directory of pstats files and summary')
+    args = parser.parse_args(argv)
+    for date_granularity in DateGranularity:
+        try:
+            make_workload(date_granularity, args.rows)
+        except ValueError as err:
+            parser.error(f'argument --rows: {str(err).strip()}')
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    summaries: List[str] = []
+    for date_granularity in DateGranularity:
+        for offset_granularity in OffsetGranularity:
+            if offset_granularity not in VALID_GRAINS_COMB[date_granularity]:
+                continue
+            name = f'{date_granularity.name.lower()}_{offset_granularity.name.lower()}'
+            profiler = profile_combination(date_granularity, offset_granularity, args.rows, args.entry_point)
+            profiler.dump_stats(os.path.join(args.output_dir, f'{name}.pstats'))
+            summaries.append(
+                f'{"=" * 20} {name} ({args.entry_point}, {args.rows} rows) {"=" * 20}\n'
+                + get_summary(profiler, args.sort, args.top)
+            )
+
+    summary_path = os.path.join(args.output_dir, 'summary.txt')
+    with open(summary_path, 'w') as file:
+        file.writelines(summaries)
+    print(f'profiles of {len(summaries)} combinations are written into {args.output_dir}, summary: {summary_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""
+deloreans.validation
+
+This module provides exception-free validation on a batch,
+which flags each row with an error code instead of raising on the first invalid one
+"""
+import datetime
+from array import array
+from enum import IntEnum
+from typing import Any, Dict, Sequence, Tuple, Union
+
+from .date_utils import _as_column, _strict_zip, DateGranularity, OffsetGranularity, VALID_GRAINS_COMB
+from .date_utils.calendar import Calendar
+from .date_utils.ordinal import DATE_GRANULARITY_FUNCS, MAX_ORDINAL, MIN_ORDINAL
+
+
+# error codes are packed as unsigned char
+ERROR_CODE_TYPECODE = 'B'
+
+
+class ErrorCode(IntEnum):
+    """
+    reason why a row is invalid, in the order of being checked
+    """
+    OK = 0
+    INVALID_TYPE = 1
+    INVALID_FIRSTWEEKDAY = 2
+    UNSUPPORTED_COMBO = 3
+    INVALID_DATE_RANGE = 4
+    PARTIAL_DATE_RANGE = 5
+
+
+def validate_many(
+    start_dates: Sequence[datetime.date],
+    end_dates: Sequence[datetime.date],
+    date_granularities: Union[DateGranularity, Sequence[DateGranularity]],
+    offsets: Union[int, Sequence[int]],
+    offset_granularities: Union[OffsetGranularity, Sequence[OffsetGranularity]],
+    firstweekdays: Union[int, Calendar, Sequence[Union[int, Calendar]]] = 0,
+) -> 'array[int]':
+    """
+    error code of each row with the same arguments as 'deloreans.api.get_many',
+    the combination of granularities and first weekday is checked once,
+    and completion of date range is checked by closed-form predicates on ordinals
+
+    Returns:
+        error_codes (array[int]): 'ErrorCode' of each row, which is 'ErrorCode.OK' when valid
+    """
+    size = len(start_dates)
+    # error code of each combination, with the first weekday of calendar
+    combo_error_codes: Dict[Any, Tuple[ErrorCode, Any]] = {}
+    previous_combo: Any = None
+    combo_error_code = ErrorCode.OK
+    combo_firstweekday: Any = None
+    error_codes = array(ERROR_CODE_TYPECODE)
+    for start_date, end_date, date_granularity, offset, offset_granularity, firstweekday in _strict_zip(
+        start_dates,
+        end_dates,
+        _as_column(date_granularities, size),
+        _as_column(offsets, size),
+        _as_column(offset_granularities, size),
+        _as_column(firstweekdays, size),
+    ):
+        # types are involved since invalid '0.0' is equal to valid '0'
+        combo = (date_granularity, offset_granularity, type(firstweekday), firstweekday)
+        if combo != previous_combo:
+            # hashing enums is relatively expensive, consecutive rows commonly share the combination
+            try:
+                cached = combo_error_codes.get(combo)
+            except TypeError:
+                # unhashable, which is never a valid combination
+                cached = (ErrorCode.INVALID_TYPE, firstweekday)
+            if cached is None:
+                if isinstance(firstweekday, Calendar):
+                    firstweekday = firstweekday.firstweekday
+                cached = combo_error_codes[combo] = (
+                    get_combo_error_code(date_granularity, offset_granularity, firstweekday),
+                    firstweekday,
+                )
+            combo_error_code, combo_firstweekday = cached
+            previous_combo = combo
+        error_code = combo_error_code
+        if error_code is ErrorCode.OK:
+            error_code = get_row_error_code(start_date, end_date, date_granularity, offset, combo_firstweekday)
+        error_codes.append(error_code)
+    return error_codes
+
+
+def get_combo_error_code(
+    date_granularity: DateGranularity,
+    offset_granularity: OffsetGranularity,
+    firstweekday: int,
+) -> ErrorCode:
+    if not isinstance(firstweekday, int):
+        return ErrorCode.INVALID_TYPE
+    if not 0 <= firstweekday < 7:
+        return ErrorCode.INVALID_FIRSTWEEKDAY
+    if not isinstance(date_granularity, DateGranularity) or not isinstance(offset_granularity, OffsetGranularity):
+        return ErrorCode.INVALID_TYPE
+    if offset_granularity not in VALID_GRAINS_COMB.get(date_granularity, ()):
+        return ErrorCode.UNSUPPORTED_COMBO
+    return ErrorCode.OK
+
+
+def get_row_error_code(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    date_granularity: DateGranularity,
+    offset: int,
+    firstweekday: int,
+) -> ErrorCode:
+    """
+    error code of a row whose combination is valid
+    """
+    if not (isinstance(start_date, datetime.date) and isinstance(end_date, datetime.date)):
+        return ErrorCode.INVALID_TYPE
+    return get_ordinal_row_error_code(
+        start_date.toordinal(),
+        end_date.toordinal(),
+        date_granularity,
+        offset,
+        firstweekday,
+    )
+
+
+def get_ordinal_row_error_code(
+    start_ordinal: int,
+    end_ordinal: int,
+    date_granularity: DateGranularity,
+    offset: int,
+    firstweekday: int,
+) -> ErrorCode:
+    """
+    error code of a row whose combination is valid, where dates are represented by ordinals
+    """
+    if not (isinstance(start_ordinal, int) and isinstance(end_ordinal, int) and isinstance(offset, int)):
+        return ErrorCode.INVALID_TYPE
+    if not MIN_ORDINAL <= start_ordinal <= end_ordinal <= MAX_ORDINAL:
+        return ErrorCode.INVALID_DATE_RANGE
+    is_start_date, is_end_date, _, _ = DATE_GRANULARITY_FUNCS[date_granularity]
+    if not (is_start_date(start_ordinal, firstweekday) and is_end_date(end_ordinal, firstweekday)):
+        return ErrorCode.PARTIAL_DATE_RANGE
+    return ErrorCode.OK
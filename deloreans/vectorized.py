@@ -0,0 +1,714 @@
+"""
+deloreans.vectorized
+
+This module implements the DeLoreans API on NumPy arrays,
+which provides compared date ranges of all given date ranges at once
+
+Dates are represented by day numbers since 1970-01-01 (the integer view of 'datetime64[D]'),
+so that every stage is array arithmetic instead of a loop on 'datetime.date' objects
+
+NumPy is an optional dependency, install it with 'deloreans[numpy]'
+"""
+import datetime
+import sys
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "deloreans.vectorized requires NumPy, install it with 'pip install deloreans[numpy]'"
+    )
+
+from . import instrumentation
+from .app import register_stage_funcs, validate_grain_comb
+from .date_utils import DateGranularity, OffsetGranularity
+from .date_utils.calendar import Calendar, get_calendar
+from .date_utils.date_range import (
+    validate_date_granularity_type,
+)
+from .date_utils.offset_granularity import (
+    validate_offset,
+    validate_offset_granularity_type,
+)
+from .date_utils.overflow_policy import get_overflow_policy, OverflowPolicy
+from .exceptions import (
+    DATE_OUT_OF_RANGE_TEMPLATE,
+    INVALID_DATA_TYPE_TEMPLATE,
+    INVALID_DATE_RANGE_TEMPLATE,
+    PARTIAL_DATE_RANGE_TEMPLATE,
+    START_DATE_OVERFLOW_ERROR_MSG,
+    StartDateOverflowError,
+)
+
+
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+MIN_DAY = datetime.date.min.toordinal() - EPOCH_ORDINAL
+MAX_DAY = datetime.date.max.toordinal() - EPOCH_ORDINAL
+
+# 1970-01-01 is Thursday
+EPOCH_WEEKDAY = 3
+
+# integer view of 'NaT', which is the day number of the row without compared date range
+NAT_DAY = np.iinfo(np.int64).min
+
+
+def get_weekday(days: np.ndarray) -> np.ndarray:
+    """
+    weekday of given days, 0 is Monday, 6 is Sunday
+    """
+    return (days + EPOCH_WEEKDAY) % 7
+
+
+def get_weekly_start_date(
+    days: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    return days - (get_weekday(days) - firstweekday) % 7
+
+
+def get_week_anchor_date(
+    days: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    """
+    The fourth day of week determine the year and month that week located
+    """
+    return get_weekly_start_date(days, firstweekday) + 3
+
+
+def get_total_months(days: np.ndarray) -> np.ndarray:
+    """
+    count of months since 1970-01 of the month which given days located
+    """
+    return days.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+
+
+def get_total_years(days: np.ndarray) -> np.ndarray:
+    """
+    count of years since 1970 of the year which given days located
+    """
+    return days.astype('datetime64[D]').astype('datetime64[Y]').astype(np.int64)
+
+
+def get_month_start_date(total_months: np.ndarray) -> np.ndarray:
+    return total_months.astype('datetime64[M]').astype('datetime64[D]').astype(np.int64)
+
+
+def get_year_start_date(total_years: np.ndarray) -> np.ndarray:
+    return total_years.astype('datetime64[Y]').astype('datetime64[D]').astype(np.int64)
+
+
+def get_start_weekly_of_month(
+    total_months: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    """
+    get the start week of a month,
+    which is represented by week's start date
+    """
+    daily_start_date = get_month_start_date(total_months)
+    week_anchor_date = get_week_anchor_date(daily_start_date, firstweekday)
+
+    # the week represented by anchor date is in previous month
+    # so that the first week should be the next one
+    daily_start_date = np.where(
+        daily_start_date > week_anchor_date,
+        daily_start_date + 7,
+        daily_start_date,
+    )
+    return get_weekly_start_date(daily_start_date, firstweekday)
+
+
+# =================================================================================================
+#
+#   Series of functions which provide period's index of a unit date period
+#
+#   Vectorized version of the same name functions in 'deloreans.date_utils.common'
+#
+# =================================================================================================
+
+
+def get_daily_index_of_daily(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return np.zeros_like(days)
+
+
+def get_daily_index_of_weekly(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return days - get_weekly_start_date(days, firstweekday)
+
+
+def get_daily_index_of_monthly(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return days - get_month_start_date(get_total_months(days))
+
+
+def get_daily_index_of_yearly(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return days - get_year_start_date(get_total_years(days))
+
+
+def get_weekly_index_of_weekly(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return np.zeros_like(days)
+
+
+def get_weekly_index_of_monthly(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    week_anchor_date = get_week_anchor_date(days, firstweekday)
+    located_start_date = get_start_weekly_of_month(
+        get_total_months(week_anchor_date),
+        firstweekday,
+    )
+    return (get_weekly_start_date(days, firstweekday) - located_start_date) // 7
+
+
+def get_weekly_index_of_yearly(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    week_anchor_date = get_week_anchor_date(days, firstweekday)
+    located_start_date = get_start_weekly_of_month(
+        get_total_years(week_anchor_date) * 12,
+        firstweekday,
+    )
+    return (get_weekly_start_date(days, firstweekday) - located_start_date) // 7
+
+
+def get_monthly_index_of_monthly(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return np.zeros_like(days)
+
+
+def get_monthly_index_of_yearly(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return get_total_months(days) % 12
+
+
+def get_yearly_index_of_yearly(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return np.zeros_like(days)
+
+
+# =================================================================================================
+#
+#   Series of functions which provide unit date period which compared start period located
+#
+#   Vectorized version of the same name functions in 'deloreans.date_utils.common'
+#
+# =================================================================================================
+
+
+def get_compared_start_daily_located_daily(
+    days: np.ndarray,
+    offset: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    return days + offset
+
+
+def get_compared_start_daily_located_weekly(
+    days: np.ndarray,
+    offset: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    return get_weekly_start_date(days, firstweekday) + offset * 7
+
+
+def get_compared_start_daily_located_monthly(
+    days: np.ndarray,
+    offset: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    return get_month_start_date(get_total_months(days) + offset)
+
+
+def get_compared_start_daily_located_yearly(
+    days: np.ndarray,
+    offset: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    return get_year_start_date(get_total_years(days) + offset)
+
+
+def get_compared_start_weekly_located_weekly(
+    days: np.ndarray,
+    offset: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    return get_weekly_start_date(days, firstweekday) + offset * 7
+
+
+def get_compared_start_weekly_located_monthly(
+    days: np.ndarray,
+    offset: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    week_anchor_date = get_week_anchor_date(days, firstweekday)
+    return get_start_weekly_of_month(
+        get_total_months(week_anchor_date) + offset,
+        firstweekday,
+    )
+
+
+def get_compared_start_weekly_located_yearly(
+    days: np.ndarray,
+    offset: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    week_anchor_date = get_week_anchor_date(days, firstweekday)
+    return get_start_weekly_of_month(
+        (get_total_years(week_anchor_date) + offset) * 12,
+        firstweekday,
+    )
+
+
+def get_compared_start_monthly_located_monthly(
+    days: np.ndarray,
+    offset: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    return get_month_start_date(get_total_months(days) + offset)
+
+
+def get_compared_start_monthly_located_yearly(
+    days: np.ndarray,
+    offset: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    return get_year_start_date(get_total_years(days) + offset)
+
+
+def get_compared_start_yearly_located_yearly(
+    days: np.ndarray,
+    offset: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    return get_year_start_date(get_total_years(days) + offset)
+
+
+# =================================================================================================
+#
+#   Series of functions which provide date period with index in located unit date period
+#
+#   Vectorized version of the same name functions in 'deloreans.date_utils.common'
+#   instead of raising IndexOverflowError, they also return the mask of overflowed index,
+#   whose date period is clamped or rolls over according to overflow policy
+#
+# =================================================================================================
+
+
+def _resolve_overflow_index(
+    index: np.ndarray,
+    capacity: Union[int, np.ndarray],
+    overflow: OverflowPolicy,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    index of each located unit date period and the mask of overflowed one,
+    which is clamped to the last period when overflow policy is clamp, otherwise rolls over
+    """
+    is_overflow = (index < 0) | (index >= capacity)
+    if overflow is OverflowPolicy.CLAMP:
+        index = np.minimum(np.maximum(index, 0), capacity - 1)
+    return index, is_overflow
+
+
+def get_daily_with_index_in_daily(
+    days: np.ndarray,
+    index: np.ndarray,
+    firstweekday: int = 0,
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    index, is_overflow = _resolve_overflow_index(index, 1, overflow)
+    return days + index, is_overflow
+
+
+def get_daily_with_index_in_weekly(
+    days: np.ndarray,
+    index: np.ndarray,
+    firstweekday: int = 0,
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    # since one week only has 7 days
+    index, is_overflow = _resolve_overflow_index(index, 7, overflow)
+    return get_weekly_start_date(days, firstweekday) + index, is_overflow
+
+
+def get_daily_with_index_in_monthly(
+    days: np.ndarray,
+    index: np.ndarray,
+    firstweekday: int = 0,
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    total_months = get_total_months(days)
+    month_start_date = get_month_start_date(total_months)
+    capacity = get_month_start_date(total_months + 1) - month_start_date
+    index, is_overflow = _resolve_overflow_index(index, capacity, overflow)
+    return month_start_date + index, is_overflow
+
+
+def get_daily_with_index_in_yearly(
+    days: np.ndarray,
+    index: np.ndarray,
+    firstweekday: int = 0,
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    total_years = get_total_years(days)
+    year_start_date = get_year_start_date(total_years)
+    capacity = get_year_start_date(total_years + 1) - year_start_date
+    index, is_overflow = _resolve_overflow_index(index, capacity, overflow)
+    return year_start_date + index, is_overflow
+
+
+def get_weekly_with_index_in_weekly(
+    days: np.ndarray,
+    index: np.ndarray,
+    firstweekday: int = 0,
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    index, is_overflow = _resolve_overflow_index(index, 1, overflow)
+    return get_weekly_start_date(days, firstweekday) + index * 7, is_overflow
+
+
+def get_weekly_with_index_in_monthly(
+    days: np.ndarray,
+    index: np.ndarray,
+    firstweekday: int = 0,
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    total_months = get_total_months(get_week_anchor_date(days, firstweekday))
+    start_weekly = get_start_weekly_of_month(total_months, firstweekday)
+
+    # each month has different amount of weeks
+    capacity = (get_start_weekly_of_month(total_months + 1, firstweekday) - start_weekly) // 7
+    index, is_overflow = _resolve_overflow_index(index, capacity, overflow)
+    return start_weekly + index * 7, is_overflow
+
+
+def get_weekly_with_index_in_yearly(
+    days: np.ndarray,
+    index: np.ndarray,
+    firstweekday: int = 0,
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    total_years = get_total_years(get_week_anchor_date(days, firstweekday))
+    start_weekly = get_start_weekly_of_month(total_years * 12, firstweekday)
+
+    # each year has 52 or 53 weeks
+    capacity = (get_start_weekly_of_month((total_years + 1) * 12, firstweekday) - start_weekly) // 7
+    index, is_overflow = _resolve_overflow_index(index, capacity, overflow)
+    return start_weekly + index * 7, is_overflow
+
+
+def get_monthly_with_index_in_monthly(
+    days: np.ndarray,
+    index: np.ndarray,
+    firstweekday: int = 0,
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    index, is_overflow = _resolve_overflow_index(index, 1, overflow)
+    return get_month_start_date(get_total_months(days) + index), is_overflow
+
+
+def get_monthly_with_index_in_yearly(
+    days: np.ndarray,
+    index: np.ndarray,
+    firstweekday: int = 0,
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    index, is_overflow = _resolve_overflow_index(index, 12, overflow)
+    return get_month_start_date(get_total_years(days) * 12 + index), is_overflow
+
+
+def get_yearly_with_index_in_yearly(
+    days: np.ndarray,
+    index: np.ndarray,
+    firstweekday: int = 0,
+    overflow: OverflowPolicy = OverflowPolicy.RAISE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    index, is_overflow = _resolve_overflow_index(index, 1, overflow)
+    return get_year_start_date(get_total_years(days) + index), is_overflow
+
+
+# =================================================================================================
+#
+#   Date granularity related functions
+#
+#   Vectorized version of the methods of 'deloreans.date_utils.date_granularity.DateGranularity'
+#
+# =================================================================================================
+
+
+def _is_daily_start_date(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return np.ones_like(days, dtype=bool)
+
+
+def _is_daily_end_date(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return np.ones_like(days, dtype=bool)
+
+
+def _is_weekly_start_date(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return get_weekday(days) == firstweekday
+
+
+def _is_weekly_end_date(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return get_weekday(days + 1) == firstweekday
+
+
+def _is_monthly_start_date(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return get_month_start_date(get_total_months(days)) == days
+
+
+def _is_monthly_end_date(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return _is_monthly_start_date(days + 1)
+
+
+def _is_yearly_start_date(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return get_year_start_date(get_total_years(days)) == days
+
+
+def _is_yearly_end_date(days: np.ndarray, firstweekday: int = 0) -> np.ndarray:
+    return _is_yearly_start_date(days + 1)
+
+
+def _get_daily_date_range_length(
+    start_days: np.ndarray,
+    end_days: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    return end_days - start_days + 1
+
+
+def _get_weekly_date_range_length(
+    start_days: np.ndarray,
+    end_days: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    weeks_offset = (
+        get_week_anchor_date(end_days, firstweekday) - get_week_anchor_date(start_days, firstweekday) + 1
+    ) // 7
+    return weeks_offset + 1
+
+
+def _get_monthly_date_range_length(
+    start_days: np.ndarray,
+    end_days: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    return get_total_months(end_days) - get_total_months(start_days) + 1
+
+
+def _get_yearly_date_range_length(
+    start_days: np.ndarray,
+    end_days: np.ndarray,
+    firstweekday: int = 0,
+) -> np.ndarray:
+    return get_total_years(end_days) - get_total_years(start_days) + 1
+
+
+def _get_daily_end_date(start_days: np.ndarray, date_range_length: np.ndarray) -> np.ndarray:
+    return start_days + date_range_length - 1
+
+
+def _get_weekly_end_date(start_days: np.ndarray, date_range_length: np.ndarray) -> np.ndarray:
+    return start_days + date_range_length * 7 - 1
+
+
+def _get_monthly_end_date(start_days: np.ndarray, date_range_length: np.ndarray) -> np.ndarray:
+    return get_month_start_date(get_total_months(start_days) + date_range_length) - 1
+
+
+def _get_yearly_end_date(start_days: np.ndarray, date_range_length: np.ndarray) -> np.ndarray:
+    return get_year_start_date(get_total_years(start_days) + date_range_length) - 1
+
+
+DateGranularityFuncs = Tuple[
+    Callable[..., np.ndarray],
+    Callable[..., np.ndarray],
+    Callable[..., np.ndarray],
+    Callable[..., np.ndarray],
+]
+
+
+# (is start date, is end date, get date range length, get end date) of each date granularity
+DATE_GRANULARITY_FUNCS: Dict[DateGranularity, DateGranularityFuncs] = {
+    DateGranularity.DAILY: (
+        _is_daily_start_date,
+        _is_daily_end_date,
+        _get_daily_date_range_length,
+        _get_daily_end_date,
+    ),
+    DateGranularity.WEEKLY: (
+        _is_weekly_start_date,
+        _is_weekly_end_date,
+        _get_weekly_date_range_length,
+        _get_weekly_end_date,
+    ),
+    DateGranularity.MONTHLY: (
+        _is_monthly_start_date,
+        _is_monthly_end_date,
+        _get_monthly_date_range_length,
+        _get_monthly_end_date,
+    ),
+    DateGranularity.YEARLY: (
+        _is_yearly_start_date,
+        _is_yearly_end_date,
+        _get_yearly_date_range_length,
+        _get_yearly_end_date,
+    ),
+}
+
+
+# vectorized stage functions of each granularity combination, resolved at import time
+STAGE_FUNCS_REGISTRY = register_stage_funcs(sys.modules[__name__])
+
+
+def _to_days(dates: Any) -> Tuple[np.ndarray, bool]:
+    """
+    convert given dates to day numbers since 1970-01-01,
+    and whether they are dates rather than day numbers
+    """
+    array = np.asarray(dates)
+    if array.dtype.kind == 'O':
+        array = array.astype('datetime64[D]')
+    if array.dtype.kind == 'M':
+        return array.astype('datetime64[D]').astype(np.int64), True
+    if array.dtype.kind in 'iu':
+        return array.astype(np.int64), False
+    raise TypeError(
+        INVALID_DATA_TYPE_TEMPLATE.format(
+            input_args=dates,
+            input_dtype=array.dtype,
+            dtype=np.dtype('datetime64[D]'),
+        )
+    )
+
+
+def _to_date(day: Any) -> datetime.date:
+    return datetime.date.fromordinal(int(day) + EPOCH_ORDINAL)
+
+
+def _validate_days_range(days: np.ndarray, error_type: type) -> None:
+    out_of_range = (days < MIN_DAY) | (days > MAX_DAY)
+    if out_of_range.any():
+        raise error_type(
+            DATE_OUT_OF_RANGE_TEMPLATE.format(
+                day=days[out_of_range].flat[0],
+            )
+        )
+
+
+def get(
+    start_dates: Any,
+    end_dates: Any,
+    date_granularity: DateGranularity,
+    offset: Union[int, Any],
+    offset_granularity: OffsetGranularity,
+    firstweekday: Union[int, Calendar] = 0,
+    overflow: Union[OverflowPolicy, str] = OverflowPolicy.RAISE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    provide compared date ranges of all given date ranges,
+    the results are as same as 'deloreans.get' on each of them
+
+    Args:
+        start_dates (array_like): start dates of date ranges, as 'datetime64[D]' or day numbers since 1970-01-01
+        end_dates (array_like): end dates of date ranges, as 'datetime64[D]' or day numbers since 1970-01-01
+        date_granularity (DateGranularity): granularity of date ranges, e.g. daily, weekly
+        offset (int | array_like): away from given date ranges, to the future when positive
+        offset_granularity (OffsetGranularity): granularity of offset period, e.g. year-over-year
+        firstweekday (int | Calendar): define the start date's weekday of week, 0 is Monday, 6 is Sunday
+        overflow (OverflowPolicy | str): handling of the start date without counterpart in compared date period,
+                                         'raise', 'clamp' to the last period, 'rollover' or 'null'
+
+    Returns:
+        compared_start_dates (np.ndarray): start dates of compared date ranges
+        compared_end_dates (np.ndarray): end dates of compared date ranges
+        both are 'datetime64[D]' when given dates are, otherwise day numbers since 1970-01-01,
+        the rows without compared date range are 'NaT' (or 'NAT_DAY') when overflow policy is null
+    """
+    started = perf_counter_ns()
+    arguments = {
+        'start_dates': start_dates,
+        'end_dates': end_dates,
+        'date_granularity': date_granularity,
+        'offset': offset,
+        'offset_granularity': offset_granularity,
+        'firstweekday': firstweekday,
+        'overflow': overflow,
+    }
+    overflow = get_overflow_policy(overflow)
+    firstweekday = get_calendar(firstweekday).firstweekday
+    validate_date_granularity_type(date_granularity)
+    validate_offset_granularity_type(offset_granularity)
+    validate_grain_comb(date_granularity, offset_granularity)
+
+    offsets = np.asarray(offset)
+    if offsets.ndim == 0:
+        validate_offset(offset)
+    elif offsets.dtype.kind not in 'iu':
+        raise TypeError(
+            INVALID_DATA_TYPE_TEMPLATE.format(
+                input_args=offset,
+                input_dtype=offsets.dtype,
+                dtype=int,
+            )
+        )
+    offsets = offsets.astype(np.int64)
+
+    start_days, is_date = _to_days(start_dates)
+    end_days, _ = _to_days(end_dates)
+    start_days, end_days = np.broadcast_arrays(start_days, end_days)
+    _validate_days_range(start_days, ValueError)
+    _validate_days_range(end_days, ValueError)
+
+    is_reversed = end_days < start_days
+    if is_reversed.any():
+        position = np.flatnonzero(is_reversed)[0]
+        raise ValueError(
+            INVALID_DATE_RANGE_TEMPLATE.format(
+                end_date=_to_date(end_days.flat[position]),
+                start_date=_to_date(start_days.flat[position]),
+            )
+        )
+
+    is_start_date, is_end_date, get_date_range_length, get_end_date = DATE_GRANULARITY_FUNCS[date_granularity]
+    is_partial = ~(is_start_date(start_days, firstweekday) & is_end_date(end_days, firstweekday))
+    if is_partial.any():
+        position = np.flatnonzero(is_partial)[0]
+        raise ValueError(
+            PARTIAL_DATE_RANGE_TEMPLATE.format(
+                start_date=_to_date(start_days.flat[position]),
+                end_date=_to_date(end_days.flat[position]),
+                date_granularity_name=date_granularity.name.lower(),
+            )
+        )
+
+    get_start_period_index, get_located_period_start_date, get_date_with_index = \
+        STAGE_FUNCS_REGISTRY[(date_granularity, offset_granularity)]
+
+    start_period_index = get_start_period_index(start_days, firstweekday)
+    given_date_range_length = get_date_range_length(start_days, end_days, firstweekday)
+    if offset_granularity == OffsetGranularity.PERIODIC:
+        offsets = offsets * given_date_range_length
+    base_start_days = get_located_period_start_date(start_days, offsets, firstweekday)
+    compared_start_days, is_overflow = get_date_with_index(
+        base_start_days,
+        start_period_index,
+        firstweekday,
+        overflow,
+    )
+    if overflow is OverflowPolicy.RAISE and is_overflow.any():
+        raise StartDateOverflowError(START_DATE_OVERFLOW_ERROR_MSG)
+    compared_end_days = get_end_date(compared_start_days, given_date_range_length)
+    if overflow is OverflowPolicy.NULL:
+        compared_start_days = np.where(is_overflow, NAT_DAY, compared_start_days)
+        compared_end_days = np.where(is_overflow, NAT_DAY, compared_end_days)
+        _validate_days_range(compared_start_days[~is_overflow], OverflowError)
+        _validate_days_range(compared_end_days[~is_overflow], OverflowError)
+    else:
+        _validate_days_range(compared_start_days, OverflowError)
+        _validate_days_range(compared_end_days, OverflowError)
+
+    if is_date:
+        compared_start_days = compared_start_days.astype('datetime64[D]')
+        compared_end_days = compared_end_days.astype('datetime64[D]')
+    instrumentation._log_slow_batch(
+        'vectorized.get',
+        arguments,
+        date_granularity,
+        offset_granularity,
+        started,
+        compared_start_days.size,
+    )
+    return compared_start_days, compared_end_days
@@ -0,0 +1,57 @@
+import datetime
+import pickle
+from unittest import TestCase
+
+from deloreans.date_utils import Calendar
+from deloreans.date_utils.calendar import CALENDARS, get_calendar
+
+
+class CalendarTestCase(TestCase):
+
+    def test_get_calendar(self):
+        self.assertIs(get_calendar(6), CALENDARS[6])
+        calendar = Calendar(6)
+        self.assertIs(get_calendar(calendar), calendar)
+        with self.assertRaises(ValueError):
+            get_calendar(7)
+        with self.assertRaises(TypeError):
+            get_calendar('6')  # NOQA
+
+    def test_week_calendar_cache(self):
+        calendar = Calendar(6, cache_size=2)
+        week_calendar = calendar.get_week_calendar(2024)
+        self.assertEqual(week_calendar.month_start_weeks[1], datetime.date(2024, 2, 4).toordinal())
+        self.assertIs(calendar.get_week_calendar(2024), week_calendar)
+        calendar.get_week_calendar(2023)
+        calendar.get_week_calendar(2022)
+        cache_info = calendar.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses, cache_info.currsize), (1, 3, 2))
+        calendar.cache_clear()
+        self.assertEqual(calendar.cache_info().currsize, 0)
+
+    def test_caches_are_owned(self):
+        calendar = Calendar(0)
+        calendar.get_week_calendar(2024)
+        self.assertEqual(Calendar(0).cache_info().currsize, 0)
+
+    def test_equality(self):
+        self.assertEqual(Calendar(6), CALENDARS[6])
+        self.assertNotEqual(Calendar(6), Calendar(0))
+        self.assertEqual(len({Calendar(6), CALENDARS[6], Calendar(0)}), 2)
+        restored = pickle.loads(pickle.dumps(Calendar(6, cache_size=2)))
+        self.assertEqual(restored, Calendar(6))
+        self.assertEqual(restored.cache_info().maxsize, 2)
+        self.assertEqual(repr(restored), 'Calendar(firstweekday=6)')
+
+    def test_invalid_cache_size(self):
+        with self.assertRaises(ValueError):
+            Calendar(0, cache_size=0)
+        with self.assertRaises(TypeError):
+            Calendar(0, cache_size=None)  # NOQA
+
+    def test_immutable(self):
+        calendar = Calendar(0)
+        with self.assertRaises(AttributeError):
+            calendar.firstweekday = 6
+        with self.assertRaises(AttributeError):
+            del calendar.firstweekday
@@ -1,7 +1,9 @@
 import datetime
+import pickle
 from unittest import TestCase
 
 from deloreans.date_utils import (
+    ComparedRange,
     DateGranularity,
     DateRange,
 )
@@ -109,3 +111,38 @@ class DateRangeTestCase(TestCase):
                 date_granularity,
                 firstweekday,
             )
+
+    def test_immutable(self):
+        date_range = DateRange(datetime.date(2024, 6, 10), datetime.date(2024, 6, 10), DateGranularity.DAILY)
+        with self.assertRaises(AttributeError):
+            date_range._start_date = datetime.date(2024, 6, 11)
+        with self.assertRaises(AttributeError):
+            date_range.extra = 1
+        with self.assertRaises(AttributeError):
+            del date_range._end_date
+        self.assertFalse(hasattr(date_range, '__dict__'))
+
+    def test_equality_and_hash(self):
+        date_range = DateRange(datetime.date(2024, 6, 10), datetime.date(2024, 6, 16), DateGranularity.WEEKLY)
+        same_date_range = DateRange(datetime.date(2024, 6, 10), datetime.date(2024, 6, 16), DateGranularity.WEEKLY)
+        other_date_range = DateRange(datetime.date(2024, 6, 10), datetime.date(2024, 6, 16), DateGranularity.DAILY)
+
+        self.assertEqual(date_range, same_date_range)
+        self.assertEqual(hash(date_range), hash(same_date_range))
+        self.assertNotEqual(date_range, other_date_range)
+        self.assertEqual(len({date_range, same_date_range, other_date_range}), 2)
+
+    def test_pickle(self):
+        date_range = DateRange(datetime.date(2024, 6, 9), datetime.date(2024, 6, 15), DateGranularity.WEEKLY, 6)
+        self.assertEqual(pickle.loads(pickle.dumps(date_range)), date_range)
+
+
+class ComparedRangeTestCase(TestCase):
+
+    def test_compared_range(self):
+        compared_range = ComparedRange(datetime.date(2023, 6, 1), datetime.date(2023, 6, 30))
+        start_date, end_date = compared_range
+
+        self.assertEqual(start_date, compared_range.start)
+        self.assertEqual(end_date, compared_range.end)
+        self.assertEqual(compared_range, (datetime.date(2023, 6, 1), datetime.date(2023, 6, 30)))
@@ -0,0 +1,51 @@
+import pickle
+from unittest import TestCase
+
+from deloreans.date_utils.immutable import _Immutable
+
+
+class Pair(_Immutable):
+
+    __slots__ = ('_first', '_second')
+
+    def __init__(self, first, second):
+        object.__setattr__(self, '_first', first)
+        object.__setattr__(self, '_second', second)
+
+
+class Labelled(Pair):
+
+    __slots__ = ('_label',)
+
+    def __init__(self, first, second, label=''):
+        super().__init__(first, second)
+        object.__setattr__(self, '_label', label)
+
+    def _key(self):
+        return self._first, self._second
+
+
+class ImmutableTestCase(TestCase):
+
+    def test_immutable(self):
+        pair = Pair(1, 2)
+        with self.assertRaises(AttributeError):
+            pair._first = 3
+        with self.assertRaises(AttributeError):
+            pair.extra = 1
+        with self.assertRaises(AttributeError):
+            del pair._second
+        self.assertFalse(hasattr(pair, '__dict__'))
+
+    def test_key_of_slots(self):
+        self.assertEqual(Pair(1, 2)._key(), (1, 2))
+        self.assertEqual(Pair(1, 2), Pair(1, 2))
+        self.assertEqual(len({Pair(1, 2), Pair(1, 2), Pair(2, 1)}), 2)
+        self.assertEqual(pickle.loads(pickle.dumps(Pair(1, 2))), Pair(1, 2))
+
+    def test_overridden_key(self):
+        self.assertEqual(Labelled(1, 2, 'a'), Labelled(1, 2, 'b'))
+        self.assertEqual(hash(Labelled(1, 2, 'a')), hash(Labelled(1, 2, 'b')))
+        # instances of different classes are never equal
+        self.assertNotEqual(Labelled(1, 2), Pair(1, 2))
+        self.assertEqual(pickle.loads(pickle.dumps(Labelled(1, 2, 'a')))._label, '')
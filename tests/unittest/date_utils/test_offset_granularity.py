@@ -1,3 +1,4 @@
+import pickle
 from unittest import TestCase
 
 from deloreans.date_utils.offset_granularity import DatePeriodOffset, OffsetGranularity
@@ -32,3 +33,19 @@ class DatePeriodOffsetTestCase(TestCase):
 
         with self.assertRaises(TypeError):
             DatePeriodOffset(sample_offset, sample_offset_granularity)  # NOQA
+
+    def test_immutable(self):
+        date_period_offset = DatePeriodOffset(1, OffsetGranularity.DAILY)
+        with self.assertRaises(AttributeError):
+            date_period_offset._offset = 2
+        with self.assertRaises(AttributeError):
+            date_period_offset.extra = 1
+        self.assertFalse(hasattr(date_period_offset, '__dict__'))
+
+    def test_equality_and_hash(self):
+        date_period_offset = DatePeriodOffset(-1, OffsetGranularity.YEARLY)
+
+        self.assertEqual(date_period_offset, DatePeriodOffset(-1, OffsetGranularity.YEARLY))
+        self.assertEqual(hash(date_period_offset), hash(DatePeriodOffset(-1, OffsetGranularity.YEARLY)))
+        self.assertNotEqual(date_period_offset, DatePeriodOffset(-1, OffsetGranularity.MONTHLY))
+        self.assertEqual(pickle.loads(pickle.dumps(date_period_offset)), date_period_offset)
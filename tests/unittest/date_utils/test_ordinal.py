@@ -0,0 +1,248 @@
+import datetime
+from unittest import TestCase
+
+from deloreans.date_utils import common, ordinal
+from deloreans.date_utils import DateGranularity
+from deloreans.date_utils.calendar import get_calendar
+from deloreans.date_utils.overflow_policy import OverflowPolicy
+from deloreans.exceptions import IndexOverflowError
+
+
+SAMPLE_DATES = [
+    datetime.date(2019, 12, 1) + datetime.timedelta(days=i)
+    for i in range(0, 800, 3)
+] + [datetime.date.min, datetime.date.max]
+
+DATE_GRAINS = ('daily', 'weekly', 'monthly', 'yearly')
+
+
+def get_located_grains(date_grain):
+    return DATE_GRAINS[DATE_GRAINS.index(date_grain):]
+
+
+def call_common(func, *args, firstweekday):
+    try:
+        return func(*args, firstweekday=firstweekday)
+    except TypeError:
+        # functions without 'firstweekday'
+        return func(*args)
+
+
+class CalendarTestCase(TestCase):
+
+    def test_get_year_month_day(self):
+        for a_date in SAMPLE_DATES:
+            self.assertEqual(
+                ordinal.get_year_month_day(a_date.toordinal()),
+                (a_date.year, a_date.month, a_date.day),
+            )
+
+    def test_get_month_start_ordinal(self):
+        self.assertEqual(
+            ordinal.get_month_start_ordinal(2024, 3),
+            datetime.date(2024, 3, 1).toordinal(),
+        )
+        self.assertEqual(
+            ordinal.get_month_start_ordinal(2023, 3),
+            datetime.date(2023, 3, 1).toordinal(),
+        )
+
+    def test_get_days_in_month(self):
+        self.assertEqual(ordinal.get_days_in_month(2024, 2), 29)
+        self.assertEqual(ordinal.get_days_in_month(1900, 2), 28)
+        self.assertEqual(ordinal.get_days_in_month(2024, 12), 31)
+
+    def test_get_start_weekly_of_month(self):
+        for year, month in ((2024, 1), (2024, 6), (2015, 1), (2020, 2)):
+            for firstweekday in range(7):
+                self.assertEqual(
+                    ordinal.get_start_weekly_of_month(year, month, firstweekday),
+                    common.get_start_weekly_of_month(year, month, firstweekday).toordinal(),
+                )
+
+
+class StageFuncsTestCase(TestCase):
+    """
+    integer kernels should be consistent with the functions in 'common' module
+    """
+
+    def test_index_of_located_period(self):
+        for date_grain in DATE_GRAINS:
+            for located_grain in get_located_grains(date_grain):
+                name = f'get_{date_grain}_index_of_{located_grain}'
+                for firstweekday in (0, 6):
+                    for a_date in SAMPLE_DATES[:-2]:
+                        self.assertEqual(
+                            getattr(ordinal, name)(a_date.toordinal(), get_calendar(firstweekday)),
+                            call_common(getattr(common, name), a_date, firstweekday=firstweekday),
+                            msg=f'{name} {a_date} {firstweekday}',
+                        )
+
+    def test_compared_located_period(self):
+        for date_grain in DATE_GRAINS:
+            for located_grain in get_located_grains(date_grain):
+                name = f'get_compared_start_{date_grain}_located_{located_grain}'
+                for firstweekday in (0, 6):
+                    for offset in (-13, -1, 0, 2):
+                        for a_date in SAMPLE_DATES[:-2]:
+                            self.assertEqual(
+                                getattr(ordinal, name)(a_date.toordinal(), offset, get_calendar(firstweekday)),
+                                call_common(
+                                    getattr(common, name),
+                                    a_date,
+                                    offset,
+                                    firstweekday=firstweekday,
+                                ).toordinal(),
+                                msg=f'{name} {a_date} {offset} {firstweekday}',
+                            )
+
+    def test_with_index_in_located_period(self):
+        for date_grain in DATE_GRAINS:
+            for located_grain in get_located_grains(date_grain):
+                name = f'get_{date_grain}_with_index_in_{located_grain}'
+                for firstweekday in (0, 6):
+                    for index in (-1, 0, 3, 4, 6, 7, 11, 12, 27, 28, 29, 30, 31, 51, 52, 53, 364, 365, 366):
+                        for a_date in SAMPLE_DATES[:-2:5]:
+                            try:
+                                expected = call_common(
+                                    getattr(common, name),
+                                    a_date,
+                                    index,
+                                    firstweekday=firstweekday,
+                                ).toordinal()
+                            except IndexOverflowError:
+                                with self.assertRaises(IndexOverflowError):
+                                    getattr(ordinal, name)(a_date.toordinal(), index, get_calendar(firstweekday))
+                                continue
+                            self.assertEqual(
+                                getattr(ordinal, name)(a_date.toordinal(), index, get_calendar(firstweekday)),
+                                expected,
+                                msg=f'{name} {a_date} {index} {firstweekday}',
+                            )
+
+
+class OverflowPolicyTestCase(TestCase):
+
+    def test_resolve_overflow_index(self):
+        self.assertEqual(ordinal.resolve_overflow_index(30, 29, OverflowPolicy.CLAMP), 28)
+        self.assertEqual(ordinal.resolve_overflow_index(-1, 29, OverflowPolicy.CLAMP), 0)
+        self.assertEqual(ordinal.resolve_overflow_index(30, 29, OverflowPolicy.ROLLOVER), 30)
+        self.assertIsNone(ordinal.resolve_overflow_index(30, 29, OverflowPolicy.NULL))
+        with self.assertRaises(IndexOverflowError):
+            ordinal.resolve_overflow_index(30, 29, OverflowPolicy.RAISE)
+
+    def test_with_index_in_located_period(self):
+        for date_grain in DATE_GRAINS:
+            unit_days = 7 if date_grain == 'weekly' else 1
+            for located_grain in get_located_grains(date_grain):
+                name = f'get_{date_grain}_with_index_in_{located_grain}'
+                func = getattr(ordinal, name)
+                for calendar in (get_calendar(0), get_calendar(6)):
+                    for a_date in SAMPLE_DATES[:-2:25]:
+                        start_ordinal = func(a_date.toordinal(), 0, calendar)
+                        last_index = 0
+                        for index in range(0, 368):
+                            try:
+                                expected = func(a_date.toordinal(), index, calendar)
+                            except IndexOverflowError:
+                                break
+                            last_index = index
+                            for overflow in OverflowPolicy:
+                                self.assertEqual(func(a_date.toordinal(), index, calendar, overflow), expected)
+                        else:
+                            continue
+                        msg = f'{name} {a_date} {index} {calendar}'
+                        self.assertIsNone(func(a_date.toordinal(), index, calendar, OverflowPolicy.NULL))
+                        self.assertEqual(
+                            func(a_date.toordinal(), index, calendar, OverflowPolicy.CLAMP),
+                            func(a_date.toordinal(), last_index, calendar),
+                            msg=msg,
+                        )
+                        if date_grain != 'monthly' and date_grain != 'yearly':
+                            self.assertEqual(
+                                func(a_date.toordinal(), index, calendar, OverflowPolicy.ROLLOVER),
+                                start_ordinal + index * unit_days,
+                                msg=msg,
+                            )
+
+    def test_monthly_rollover_in_yearly(self):
+        self.assertEqual(
+            ordinal.get_monthly_with_index_in_yearly(
+                datetime.date(2023, 1, 1).toordinal(),
+                13,
+                get_calendar(0),
+                OverflowPolicy.ROLLOVER,
+            ),
+            datetime.date(2024, 2, 1).toordinal(),
+        )
+
+
+class DateGranularityFuncsTestCase(TestCase):
+
+    def test_consistent_with_date_granularity(self):
+        for date_granularity, funcs in ordinal.DATE_GRANULARITY_FUNCS.items():
+            is_start_date, is_end_date, get_date_range_length, get_end_date = funcs
+            for firstweekday in (0, 6):
+                for a_date in SAMPLE_DATES[:-2]:
+                    self.assertEqual(
+                        is_start_date(a_date.toordinal(), firstweekday),
+                        date_granularity.value._is_start_date(a_date, firstweekday),
+                    )
+                    self.assertEqual(
+                        is_end_date(a_date.toordinal(), firstweekday),
+                        date_granularity.value._is_end_date(a_date, firstweekday),
+                    )
+                    if not is_start_date(a_date.toordinal(), firstweekday):
+                        continue
+                    end_date = date_granularity.get_end_date(a_date, 3, firstweekday)
+                    self.assertEqual(get_end_date(a_date.toordinal(), 3), end_date.toordinal())
+                    self.assertEqual(
+                        get_date_range_length(a_date.toordinal(), end_date.toordinal(), firstweekday),
+                        date_granularity.get_date_range_length(a_date, end_date, firstweekday),
+                    )
+
+    def test_weekly_range_length(self):
+        _, _, get_date_range_length, _ = ordinal.DATE_GRANULARITY_FUNCS[DateGranularity.WEEKLY]
+        self.assertEqual(
+            get_date_range_length(
+                datetime.date(2023, 12, 31).toordinal(),
+                datetime.date(2024, 3, 30).toordinal(),
+                6,
+            ),
+            13,
+        )
+
+
+class WeekCalendarTestCase(TestCase):
+
+    def test_iso_week_calendar(self):
+        week_calendar = ordinal.build_week_calendar(0, 2015)
+        self.assertEqual(week_calendar.week_count, 53)
+        self.assertEqual(
+            week_calendar.month_start_weeks[0],
+            datetime.date(2014, 12, 29).toordinal(),
+        )
+        self.assertEqual(
+            week_calendar.month_start_weeks[12],
+            datetime.date(2016, 1, 4).toordinal(),
+        )
+        self.assertEqual(week_calendar.month_week_counts[0], 5)
+        self.assertEqual(sum(week_calendar.month_week_counts), week_calendar.week_count)
+
+    def test_week_calendar_start_from_sunday(self):
+        week_calendar = ordinal.build_week_calendar(6, 2024)
+        self.assertEqual(week_calendar.week_count, 52)
+        self.assertEqual(
+            week_calendar.month_start_weeks[1],
+            datetime.date(2024, 2, 4).toordinal(),
+        )
+
+    def test_consistent_with_start_weekly_of_month(self):
+        for firstweekday in range(7):
+            for year in range(2000, 2030):
+                week_calendar = get_calendar(firstweekday).get_week_calendar(year)
+                for month in range(1, 13):
+                    self.assertEqual(
+                        week_calendar.month_start_weeks[month - 1],
+                        common.get_start_weekly_of_month(year, month, firstweekday).toordinal(),
+                    )
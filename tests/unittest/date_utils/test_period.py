@@ -0,0 +1,111 @@
+import datetime
+import pickle
+from unittest import TestCase
+
+from deloreans.date_utils import (
+    DateGranularity,
+    DateRange,
+    Period,
+)
+
+
+class PeriodTestCase(TestCase):
+
+    def test_period_id(self):
+        a_date = datetime.date(2024, 6, 12)
+        self.assertEqual(Period.of(a_date, DateGranularity.DAILY).id, a_date.toordinal())
+        self.assertEqual(Period.of(a_date, DateGranularity.MONTHLY).id, 2024 * 12 + 5)
+        self.assertEqual(Period.of(a_date, DateGranularity.YEARLY).id, 2024)
+        self.assertEqual(
+            Period.of(a_date, DateGranularity.WEEKLY).id + 1,
+            Period.of(a_date + datetime.timedelta(days=7), DateGranularity.WEEKLY).id,
+        )
+
+    def test_start_and_end(self):
+        a_date = datetime.date(2024, 2, 14)
+        expectations = [
+            (DateGranularity.DAILY, 0, datetime.date(2024, 2, 14), datetime.date(2024, 2, 14)),
+            (DateGranularity.WEEKLY, 0, datetime.date(2024, 2, 12), datetime.date(2024, 2, 18)),
+            (DateGranularity.WEEKLY, 6, datetime.date(2024, 2, 11), datetime.date(2024, 2, 17)),
+            (DateGranularity.WEEKLY, 2, datetime.date(2024, 2, 14), datetime.date(2024, 2, 20)),
+            (DateGranularity.MONTHLY, 0, datetime.date(2024, 2, 1), datetime.date(2024, 2, 29)),
+            (DateGranularity.YEARLY, 0, datetime.date(2024, 1, 1), datetime.date(2024, 12, 31)),
+        ]
+        for date_granularity, firstweekday, start, end in expectations:
+            with self.subTest(date_granularity=date_granularity, firstweekday=firstweekday):
+                period = Period.of(a_date, date_granularity, firstweekday)
+                self.assertEqual(period.start, start)
+                self.assertEqual(period.end, end)
+                self.assertIn(a_date, period)
+                self.assertNotIn(end + datetime.timedelta(days=1), period)
+
+    def test_offset(self):
+        period = Period.of(datetime.date(2024, 1, 15), DateGranularity.MONTHLY)
+        self.assertEqual((period - 1).start, datetime.date(2023, 12, 1))
+        self.assertEqual((period + 13).start, datetime.date(2025, 2, 1))
+        self.assertEqual(1 + period, period + 1)
+        self.assertEqual((period + 5) - period, 5)
+
+        weekly = Period.of(datetime.date(2024, 6, 11), DateGranularity.WEEKLY, 6)
+        self.assertEqual((weekly - 52).start, datetime.date(2023, 6, 11))
+        self.assertEqual((weekly - 52).firstweekday, 6)
+
+        with self.assertRaises(TypeError):
+            period + 1.0  # NOQA
+        with self.assertRaises(TypeError):
+            period - weekly  # NOQA
+
+    def test_ordering(self):
+        periods = [Period(DateGranularity.YEARLY, year) for year in (2024, 2022, 2023)]
+        self.assertEqual([period.id for period in sorted(periods)], [2022, 2023, 2024])
+        self.assertLess(periods[1], periods[0])
+        self.assertGreaterEqual(periods[0], periods[0])
+        with self.assertRaises(TypeError):
+            periods[0] < Period(DateGranularity.MONTHLY, 2024 * 12)  # NOQA
+        with self.assertRaises(TypeError):
+            Period(DateGranularity.WEEKLY, 1000) < Period(DateGranularity.WEEKLY, 1001, 6)  # NOQA
+
+    def test_hashable(self):
+        period = Period.of(datetime.date(2024, 6, 12), DateGranularity.WEEKLY)
+        self.assertEqual(period, Period(DateGranularity.WEEKLY, period.id))
+        self.assertNotEqual(period, Period(DateGranularity.WEEKLY, period.id, 1))
+        self.assertEqual(len({period, Period(DateGranularity.WEEKLY, period.id), period + 1}), 2)
+        self.assertEqual(pickle.loads(pickle.dumps(period)), period)
+
+    def test_date_range(self):
+        date_range = DateRange(datetime.date(2024, 4, 1), datetime.date(2024, 6, 30), DateGranularity.MONTHLY)
+        first, last = Period.from_date_range(date_range)
+        self.assertEqual(last - first, 2)
+        self.assertEqual(first.to_date_range(last), date_range)
+        self.assertEqual(
+            last.to_date_range(),
+            DateRange(datetime.date(2024, 6, 1), datetime.date(2024, 6, 30), DateGranularity.MONTHLY),
+        )
+        with self.assertRaises(ValueError):
+            last.to_date_range(first)
+        with self.assertRaises(TypeError):
+            first.to_date_range(date_range)  # NOQA
+
+    def test_out_of_range(self):
+        self.assertEqual(Period.of(datetime.date.max, DateGranularity.YEARLY).end, datetime.date.max)
+        with self.assertRaises(ValueError):
+            Period.of(datetime.date.max, DateGranularity.YEARLY) + 1  # NOQA
+        with self.assertRaises(ValueError):
+            Period.of(datetime.date.min, DateGranularity.WEEKLY, 6)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            Period('monthly', 1)  # NOQA
+        with self.assertRaises(TypeError):
+            Period(DateGranularity.MONTHLY, 1.0)  # NOQA
+        with self.assertRaises(ValueError):
+            Period(DateGranularity.WEEKLY, 1000, 7)
+        with self.assertRaises(TypeError):
+            Period.of('2024-06-12', DateGranularity.MONTHLY)  # NOQA
+
+    def test_immutable(self):
+        period = Period(DateGranularity.YEARLY, 2024)
+        with self.assertRaises(AttributeError):
+            period._period_id = 2025
+        with self.assertRaises(AttributeError):
+            del period._period_id
@@ -0,0 +1,201 @@
+import asyncio
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import patch
+
+from deloreans import aio
+from deloreans.aio import aget, aget_many, astream
+from deloreans.api import get, get_many
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+)
+
+
+class AGetTestCase(TestCase):
+
+    def setUp(self) -> None:
+        self.args = (
+            datetime.date(2024, 6, 1),
+            datetime.date(2024, 6, 30),
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+
+    def test_aget(self):
+        self.assertEqual(asyncio.run(aget(*self.args)), get(*self.args))
+
+    def test_aget_in_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(asyncio.run(aget(*self.args, executor=executor)), get(*self.args))
+
+    def test_aget_coalesces_identical_requests(self):
+        async def gather(executor):
+            return await asyncio.gather(*(aget(*self.args, executor=executor) for _ in range(5)))
+
+        with patch.object(aio, 'get', wraps=get) as mocked_get, ThreadPoolExecutor(max_workers=2) as executor:
+            results = asyncio.run(gather(executor))
+        self.assertEqual(mocked_get.call_count, 1)
+        self.assertEqual(results, [get(*self.args)] * 5)
+        self.assertFalse(any(aio._IN_FLIGHT.values()))
+
+    def test_aget_coalesces_only_arguments_of_same_types(self):
+        async def gather(executor):
+            return await asyncio.gather(
+                *(aget(*self.args[:3], offset, *self.args[4:], executor=executor) for offset in (-1, -1.0, -1)),
+                return_exceptions=True,
+            )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = asyncio.run(gather(executor))
+        self.assertEqual(results[0], get(*self.args))
+        self.assertIsInstance(results[1], TypeError)
+        self.assertEqual(results[2], get(*self.args))
+
+    def test_aget_invalid_in_executor(self):
+        args = (datetime.date(2024, 6, 1), datetime.date(2024, 6, 29)) + self.args[2:]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with self.assertRaises(ValueError):
+                asyncio.run(aget(*args, executor=executor))
+
+
+class AGetManyTestCase(TestCase):
+
+    def setUp(self) -> None:
+        self.start_dates = [datetime.date(2024, month, 1) for month in range(1, 12)]
+        self.end_dates = [datetime.date(2024, month + 1, 1) - datetime.timedelta(days=1) for month in range(1, 12)]
+
+    def test_aget_many(self):
+        self.assertEqual(
+            asyncio.run(aget_many(
+                self.start_dates,
+                self.end_dates,
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+                batch_size=3,
+            )),
+            get_many(self.start_dates, self.end_dates, DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY),
+        )
+
+    def test_aget_many_in_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(
+                asyncio.run(aget_many(
+                    self.start_dates,
+                    self.end_dates,
+                    DateGranularity.MONTHLY,
+                    [-1, 1] * 5 + [-1],
+                    OffsetGranularity.PERIODIC,
+                    batch_size=4,
+                    executor=executor,
+                )),
+                get_many(
+                    self.start_dates,
+                    self.end_dates,
+                    DateGranularity.MONTHLY,
+                    [-1, 1] * 5 + [-1],
+                    OffsetGranularity.PERIODIC,
+                ),
+            )
+
+    def test_aget_many_coalesces_only_batches_of_same_types(self):
+        async def gather(executor):
+            return await asyncio.gather(*(
+                aget_many(
+                    self.start_dates,
+                    self.end_dates,
+                    DateGranularity.MONTHLY,
+                    offset,
+                    OffsetGranularity.YEARLY,
+                    firstweekdays=firstweekday,
+                    batch_size=4,
+                    executor=executor,
+                    errors='null',
+                )
+                for offset, firstweekday in ((-1, 0), (-1.0, 0), (-1, 0.0))
+            ))
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = asyncio.run(gather(executor))
+        self.assertEqual(
+            results[0],
+            get_many(self.start_dates, self.end_dates, DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY),
+        )
+        self.assertEqual(results[1:], [[None] * 11] * 2)
+
+    def test_aget_many_yields_to_event_loop(self):
+        ticks = []
+
+        async def tick():
+            for _ in range(3):
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        async def run():
+            ticker = asyncio.ensure_future(tick())
+            results = await aget_many(
+                self.start_dates,
+                self.end_dates,
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+                batch_size=2,
+            )
+            self.assertEqual(len(ticks), 3)
+            await ticker
+            return results
+
+        self.assertEqual(len(asyncio.run(run())), 11)
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(aget_many([], [], DateGranularity.DAILY, 1, OffsetGranularity.DAILY, batch_size=0))
+
+    def test_invalid_overflow(self):
+        # validated once before any batch, even without rows
+        with self.assertRaises(ValueError):
+            asyncio.run(aget_many([], [], DateGranularity.DAILY, 1, OffsetGranularity.DAILY, overflow='ignore'))
+
+
+class AStreamTestCase(TestCase):
+
+    def test_astream_on_async_iterable(self):
+        requests = [
+            (datetime.date(2024, 6, 1), datetime.date(2024, 6, 30), DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY),  # NOQA
+            {
+                'start_date': datetime.date(2024, 6, 9),
+                'end_date': datetime.date(2024, 6, 15),
+                'date_granularity': DateGranularity.WEEKLY,
+                'offset': 1,
+                'offset_granularity': OffsetGranularity.PERIODIC,
+                'firstweekday': 6,
+            },
+        ] * 3
+
+        async def produce():
+            for request in requests:
+                await asyncio.sleep(0)
+                yield request
+
+        async def collect():
+            return [compared_date_range async for compared_date_range in astream(produce(), batch_size=4)]
+
+        expected = [get(*request) if isinstance(request, tuple) else get(**request) for request in requests]
+        self.assertEqual(asyncio.run(collect()), expected)
+
+    def test_astream_on_iterable_in_executor(self):
+        requests = [
+            (datetime.date(2024, 6, 1), datetime.date(2024, 6, 30), DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY),  # NOQA
+        ] * 5
+
+        async def collect(executor):
+            return [
+                compared_date_range
+                async for compared_date_range in astream(requests, batch_size=2, executor=executor)
+            ]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(asyncio.run(collect(executor)), [get(*requests[0])] * 5)
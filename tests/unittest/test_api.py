@@ -0,0 +1,507 @@
+import datetime
+from unittest import TestCase
+
+from deloreans.api import compile, get, get_many, get_offsets, get_ordinal, stream
+from deloreans.date_utils import (
+    Calendar,
+    DateGranularity,
+    OffsetGranularity,
+)
+from deloreans.date_utils.overflow_policy import OverflowPolicy
+
+
+class GetManyTestCase(TestCase):
+
+    def test_get_many(self):
+        start_dates = [
+            datetime.date(2024, 6, 10),
+            datetime.date(2024, 6, 1),
+            datetime.date(2024, 2, 11),
+        ]
+        end_dates = [
+            datetime.date(2024, 6, 16),
+            datetime.date(2024, 6, 30),
+            datetime.date(2024, 2, 24),
+        ]
+        date_granularities = [
+            DateGranularity.DAILY,
+            DateGranularity.MONTHLY,
+            DateGranularity.WEEKLY,
+        ]
+        offsets = [3, -1, -2]
+        offset_granularities = [
+            OffsetGranularity.DAILY,
+            OffsetGranularity.YEARLY,
+            OffsetGranularity.MONTHLY,
+        ]
+        firstweekdays = [0, 0, 6]
+        self.assertEqual(
+            get_many(
+                start_dates,
+                end_dates,
+                date_granularities,
+                offsets,
+                offset_granularities,
+                firstweekdays,
+            ),
+            [
+                (datetime.date(2024, 6, 13), datetime.date(2024, 6, 19)),
+                (datetime.date(2023, 6, 1), datetime.date(2023, 6, 30)),
+                (datetime.date(2023, 12, 10), datetime.date(2023, 12, 23)),
+            ]
+        )
+
+    def test_get_many_consistent_with_get(self):
+        start_dates = [datetime.date(2024, 1, 1) + datetime.timedelta(days=i) for i in range(60)] * 2
+        end_dates = [a_date + datetime.timedelta(days=6) for a_date in start_dates]
+        expected = [
+            get(
+                start_date,
+                end_date,
+                DateGranularity.DAILY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+            for start_date, end_date in zip(start_dates, end_dates)
+        ]
+        self.assertEqual(
+            get_many(
+                start_dates,
+                end_dates,
+                DateGranularity.DAILY,
+                -1,
+                OffsetGranularity.YEARLY,
+            ),
+            expected,
+        )
+
+    def test_get_many_with_empty_columns(self):
+        self.assertEqual(
+            get_many([], [], DateGranularity.DAILY, -1, OffsetGranularity.YEARLY),
+            [],
+        )
+
+    def test_get_many_with_inconsistent_columns(self):
+        with self.assertRaises(ValueError):
+            get_many(
+                [datetime.date(2024, 6, 1)],
+                [datetime.date(2024, 6, 30), datetime.date(2024, 7, 31)],
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+
+    def test_get_many_with_invalid_row(self):
+        with self.assertRaises(ValueError):
+            get_many(
+                [datetime.date(2024, 6, 1), datetime.date(2024, 6, 2)],
+                [datetime.date(2024, 6, 30), datetime.date(2024, 6, 30)],
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+
+    def test_get_many_with_invalid_offset_type(self):
+        with self.assertRaises(TypeError):
+            get_many(
+                [datetime.date(2024, 6, 1)],
+                [datetime.date(2024, 6, 30)],
+                DateGranularity.MONTHLY,
+                '-1',  # NOQA
+                OffsetGranularity.YEARLY,
+            )
+
+    def test_get_many_with_equal_arguments_of_different_types(self):
+        start_dates = [datetime.date(2024, 6, 1)] * 2
+        end_dates = [datetime.date(2024, 6, 30)] * 2
+        with self.assertRaises(TypeError):
+            get_many(start_dates, end_dates, DateGranularity.MONTHLY, [-1, -1.0], OffsetGranularity.YEARLY)
+        with self.assertRaises(TypeError):
+            get_many(start_dates, end_dates, DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY, [0, 0.0])
+        self.assertEqual(
+            get_many(
+                start_dates,
+                end_dates,
+                DateGranularity.MONTHLY,
+                [-1, -1.0],
+                OffsetGranularity.YEARLY,
+                errors='null',
+            ),
+            [(datetime.date(2023, 6, 1), datetime.date(2023, 6, 30)), None],
+        )
+
+    def test_get_many_with_unsupported_combo(self):
+        with self.assertRaises(ValueError):
+            get_many(
+                [datetime.date(2024, 6, 1)],
+                [datetime.date(2024, 6, 30)],
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.DAILY,
+            )
+
+    def test_get_many_with_null_errors(self):
+        results = get_many(
+            [
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 2),
+                '2024-06-01',
+                datetime.date(2024, 3, 31),
+                datetime.date(2024, 6, 1),
+            ],
+            [
+                datetime.date(2024, 6, 30),
+                datetime.date(2024, 6, 30),
+                datetime.date(2024, 6, 30),
+                datetime.date(2024, 3, 31),
+                datetime.date(2024, 6, 30),
+            ],
+            [
+                DateGranularity.MONTHLY,
+                DateGranularity.MONTHLY,
+                DateGranularity.MONTHLY,
+                DateGranularity.DAILY,
+                DateGranularity.MONTHLY,
+            ],
+            -1,
+            [
+                OffsetGranularity.YEARLY,
+                OffsetGranularity.YEARLY,
+                OffsetGranularity.YEARLY,
+                OffsetGranularity.MONTHLY,
+                OffsetGranularity.DAILY,
+            ],
+            errors='null',
+        )
+        self.assertEqual(results, [(datetime.date(2023, 6, 1), datetime.date(2023, 6, 30)), None, None, None, None])
+
+    def test_get_many_with_unsupported_errors(self):
+        with self.assertRaises(ValueError):
+            get_many([], [], DateGranularity.DAILY, 1, OffsetGranularity.DAILY, errors='ignore')
+
+
+class OverflowTestCase(TestCase):
+
+    def test_get_with_overflow_policy(self):
+        # 2023 has no 366th day
+        args = (
+            datetime.date(2024, 12, 31),
+            datetime.date(2024, 12, 31),
+            DateGranularity.DAILY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        with self.assertRaises(ValueError):
+            get(*args)
+        self.assertEqual(get(*args, overflow='clamp'), (datetime.date(2023, 12, 31), datetime.date(2023, 12, 31)))
+        self.assertEqual(
+            get(*args, overflow=OverflowPolicy.ROLLOVER),
+            (datetime.date(2024, 1, 1), datetime.date(2024, 1, 1)),
+        )
+        self.assertIsNone(get(*args, overflow='null'))
+
+    def test_get_weekly_with_overflow_policy(self):
+        # 2020 has 53 ISO weeks while 2019 has 52
+        args = (
+            datetime.date(2020, 12, 28),
+            datetime.date(2021, 1, 3),
+            DateGranularity.WEEKLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(get(*args, overflow='clamp'), (datetime.date(2019, 12, 23), datetime.date(2019, 12, 29)))
+        self.assertEqual(get(*args, overflow='rollover'), (datetime.date(2019, 12, 30), datetime.date(2020, 1, 5)))
+        self.assertIsNone(get(*args, overflow='null'))
+
+    def test_get_ordinal_with_overflow_policy(self):
+        self.assertEqual(
+            get_ordinal(
+                datetime.date(2024, 3, 31).toordinal(),
+                datetime.date(2024, 3, 31).toordinal(),
+                DateGranularity.DAILY,
+                -1,
+                OffsetGranularity.MONTHLY,
+                overflow='clamp',
+            ),
+            (datetime.date(2024, 2, 29).toordinal(), datetime.date(2024, 2, 29).toordinal()),
+        )
+
+    def test_get_many_with_overflow_policy(self):
+        self.assertEqual(
+            get_many(
+                [datetime.date(2024, 3, 29), datetime.date(2024, 3, 31)],
+                [datetime.date(2024, 3, 29), datetime.date(2024, 3, 31)],
+                DateGranularity.DAILY,
+                -1,
+                OffsetGranularity.MONTHLY,
+                overflow='null',
+            ),
+            [(datetime.date(2024, 2, 29), datetime.date(2024, 2, 29)), None],
+        )
+        self.assertEqual(
+            list(stream(
+                [(datetime.date(2024, 3, 31), datetime.date(2024, 3, 31), DateGranularity.DAILY, -1,
+                  OffsetGranularity.MONTHLY)],
+                overflow='rollover',
+            )),
+            [(datetime.date(2024, 3, 2), datetime.date(2024, 3, 2))],
+        )
+
+    def test_unsupported_overflow_policy(self):
+        with self.assertRaises(ValueError):
+            get(
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+                overflow='ignore',
+            )
+
+
+class GetOrdinalTestCase(TestCase):
+
+    def test_get_ordinal(self):
+        self.assertEqual(
+            get_ordinal(
+                datetime.date(2024, 6, 1).toordinal(),
+                datetime.date(2024, 6, 30).toordinal(),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            ),
+            (datetime.date(2023, 6, 1).toordinal(), datetime.date(2023, 6, 30).toordinal()),
+        )
+
+    def test_get_ordinal_with_given_firstweekday(self):
+        self.assertEqual(
+            get_ordinal(
+                datetime.date(2023, 12, 31).toordinal(),
+                datetime.date(2024, 3, 30).toordinal(),
+                DateGranularity.WEEKLY,
+                -9,
+                OffsetGranularity.YEARLY,
+                6,
+            ),
+            (datetime.date(2015, 1, 4).toordinal(), datetime.date(2015, 4, 4).toordinal()),
+        )
+
+    def test_get_ordinal_with_invalid_type(self):
+        with self.assertRaises(TypeError):
+            get_ordinal(
+                datetime.date(2024, 6, 1),  # NOQA
+                datetime.date(2024, 6, 30),  # NOQA
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+
+    def test_get_ordinal_out_of_range(self):
+        with self.assertRaises(ValueError):
+            get_ordinal(0, 30, DateGranularity.DAILY, -1, OffsetGranularity.DAILY)
+        with self.assertRaises(ValueError):
+            get_ordinal(1, 1, DateGranularity.DAILY, -1, OffsetGranularity.DAILY)
+
+    def test_get_ordinal_with_reversed_date_range(self):
+        with self.assertRaises(ValueError):
+            get_ordinal(
+                datetime.date(2024, 6, 30).toordinal(),
+                datetime.date(2024, 6, 1).toordinal(),
+                DateGranularity.DAILY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+
+    def test_get_ordinal_with_partial_date_range(self):
+        with self.assertRaises(ValueError):
+            get_ordinal(
+                datetime.date(2024, 6, 2).toordinal(),
+                datetime.date(2024, 6, 30).toordinal(),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+
+
+class StreamTestCase(TestCase):
+
+    def test_stream(self):
+        requests = (
+            (
+                datetime.date(2024, 1, 1) + datetime.timedelta(days=i),
+                datetime.date(2024, 1, 1) + datetime.timedelta(days=i),
+                DateGranularity.DAILY,
+                -1,
+                OffsetGranularity.WEEKLY,
+            )
+            for i in range(10)
+        )
+        results = stream(requests, batch_size=3)
+        self.assertEqual(
+            next(results),
+            (datetime.date(2023, 12, 25), datetime.date(2023, 12, 25)),
+        )
+        self.assertEqual(len(list(results)), 9)
+
+    def test_stream_with_keyword_requests(self):
+        requests = [
+            {
+                'start_date': datetime.date(2023, 12, 31),
+                'end_date': datetime.date(2024, 3, 30),
+                'date_granularity': DateGranularity.WEEKLY,
+                'offset': -9,
+                'offset_granularity': OffsetGranularity.YEARLY,
+                'firstweekday': 6,
+            },
+            (
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            ),
+        ]
+        self.assertEqual(
+            list(stream(requests)),
+            [
+                (datetime.date(2015, 1, 4), datetime.date(2015, 4, 4)),
+                (datetime.date(2023, 6, 1), datetime.date(2023, 6, 30)),
+            ]
+        )
+
+    def test_stream_is_lazy(self):
+        consumed = []
+
+        def requests():
+            for i in range(100):
+                consumed.append(i)
+                yield (
+                    datetime.date(2024, 6, 1),
+                    datetime.date(2024, 6, 30),
+                    DateGranularity.MONTHLY,
+                    -i,
+                    OffsetGranularity.YEARLY,
+                )
+
+        results = stream(requests(), batch_size=4)
+        next(results)
+        self.assertEqual(len(consumed), 4)
+
+    def test_stream_with_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            list(stream([], batch_size=0))
+
+
+class GetOffsetsTestCase(TestCase):
+
+    def test_get_offsets(self):
+        self.assertEqual(
+            list(get_offsets(
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                range(-1, -4, -1),
+                OffsetGranularity.YEARLY,
+            )),
+            [
+                (datetime.date(2023, 6, 1), datetime.date(2023, 6, 30)),
+                (datetime.date(2022, 6, 1), datetime.date(2022, 6, 30)),
+                (datetime.date(2021, 6, 1), datetime.date(2021, 6, 30)),
+            ]
+        )
+
+    def test_get_periodic_offsets(self):
+        offsets = list(range(-12, 0))
+        self.assertEqual(
+            list(get_offsets(
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 7, 31),
+                DateGranularity.MONTHLY,
+                offsets,
+                OffsetGranularity.PERIODIC,
+            )),
+            [
+                get(
+                    datetime.date(2024, 6, 1),
+                    datetime.date(2024, 7, 31),
+                    DateGranularity.MONTHLY,
+                    offset,
+                    OffsetGranularity.PERIODIC,
+                )
+                for offset in offsets
+            ]
+        )
+
+    def test_get_offsets_with_overflow(self):
+        self.assertEqual(
+            list(get_offsets(
+                datetime.date(2024, 2, 29),
+                datetime.date(2024, 2, 29),
+                DateGranularity.DAILY,
+                [-12, -1, 4],
+                OffsetGranularity.MONTHLY,
+            )),
+            [
+                None,
+                (datetime.date(2024, 1, 29), datetime.date(2024, 1, 29)),
+                (datetime.date(2024, 6, 29), datetime.date(2024, 6, 29)),
+            ]
+        )
+
+    def test_get_offsets_with_invalid_date_range(self):
+        with self.assertRaises(ValueError):
+            get_offsets(
+                datetime.date(2024, 6, 2),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                [-1],
+                OffsetGranularity.YEARLY,
+            )
+
+
+class CalendarTestCase(TestCase):
+
+    args = (
+        datetime.date(2023, 12, 31),
+        datetime.date(2024, 3, 30),
+        DateGranularity.WEEKLY,
+        -1,
+        OffsetGranularity.YEARLY,
+    )
+
+    def test_get_with_calendar(self):
+        calendar = Calendar(6)
+        self.assertEqual(get(*self.args, calendar), get(*self.args, 6))
+        self.assertEqual(calendar.cache_info().currsize, 2)
+        self.assertEqual(
+            get_ordinal(
+                self.args[0].toordinal(),
+                self.args[1].toordinal(),
+                *self.args[2:],
+                calendar,
+            ),
+            tuple(a_date.toordinal() for a_date in get(*self.args, 6)),
+        )
+        self.assertEqual(
+            list(get_offsets(*self.args[:3], [-1], self.args[4], calendar)),
+            [get(*self.args, 6)],
+        )
+        self.assertEqual(compile(*self.args[2:], calendar)(*self.args[:2]), get(*self.args, 6))
+
+    def test_get_many_with_calendars(self):
+        calendar = Calendar(6)
+        results = get_many(
+            [self.args[0]] * 3,
+            [self.args[1]] * 3,
+            *self.args[2:],
+            [calendar, 6, Calendar(6)],
+        )
+        self.assertEqual(results, [get(*self.args, 6)] * 3)
+        self.assertEqual(
+            get_many([self.args[0]], [self.args[1]], *self.args[2:], calendar, errors='null'),
+            [get(*self.args, 6)],
+        )
+
+    def test_partial_date_range_of_calendar(self):
+        with self.assertRaises(ValueError):
+            get(*self.args, Calendar(0))
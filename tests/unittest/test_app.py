@@ -1,11 +1,25 @@
 
 import datetime
+import pickle
+from types import ModuleType
 from unittest import TestCase
 
-from deloreans.app import DeLoreans
+from deloreans.app import (
+    DeLoreans,
+    get_stage_funcs,
+    register_stage_funcs,
+    STAGE_FUNCS_REGISTRY,
+)
 from deloreans.date_utils import (
+    ComparedRange,
     DateGranularity,
     OffsetGranularity,
+    VALID_GRAINS_COMB,
+)
+from deloreans.date_utils.ordinal import (
+    get_daily_index_of_daily,
+    get_compared_start_daily_located_daily,
+    get_daily_with_index_in_daily,
 )
 
 
@@ -62,3 +76,102 @@ class DeLoreansTestCase(TestCase):
             executor.get(),
             (datetime.date(2023, 12, 10), datetime.date(2023, 12, 23))
         )
+
+    def test_get_periodic_compared_date_range_with_given_firstweekday(self):
+        start_date = datetime.date(2024, 6, 2)
+        end_date = datetime.date(2024, 6, 8)
+        date_granularity = DateGranularity.WEEKLY
+        offset = -1
+        offset_granularity = OffsetGranularity.PERIODIC
+        firstweekday = 6
+        executor = DeLoreans(
+            start_date,
+            end_date,
+            date_granularity,
+            offset,
+            offset_granularity,
+            firstweekday,
+        )
+        self.assertEqual(
+            executor.get(),
+            (datetime.date(2024, 5, 26), datetime.date(2024, 6, 1))
+        )
+
+    def test_get_compared_range(self):
+        compared_range = DeLoreans(
+            datetime.date(2024, 6, 1),
+            datetime.date(2024, 6, 30),
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        ).get()
+
+        self.assertIsInstance(compared_range, ComparedRange)
+        self.assertEqual(compared_range.start, datetime.date(2023, 6, 1))
+        self.assertEqual(compared_range.end, datetime.date(2023, 6, 30))
+
+    def test_immutable(self):
+        component = DeLoreans(
+            datetime.date(2024, 6, 10),
+            datetime.date(2024, 6, 16),
+            DateGranularity.WEEKLY,
+            1,
+            OffsetGranularity.MONTHLY,
+        )
+        with self.assertRaises(AttributeError):
+            component._stage_funcs = None
+        with self.assertRaises(AttributeError):
+            component.extra = 1
+        self.assertFalse(hasattr(component, '__dict__'))
+
+    def test_equality_hash_and_pickle(self):
+        args = (
+            datetime.date(2024, 6, 9),
+            datetime.date(2024, 6, 15),
+            DateGranularity.WEEKLY,
+            1,
+            OffsetGranularity.MONTHLY,
+            6,
+        )
+        component = DeLoreans(*args)
+
+        self.assertEqual(component, DeLoreans(*args))
+        self.assertEqual(hash(component), hash(DeLoreans(*args)))
+        self.assertNotEqual(component, DeLoreans(*args[:3], 2, *args[4:]))
+        self.assertEqual(component.date_range.firstweekday, 6)
+        self.assertEqual(component.date_period_offset.offset, 1)
+
+        restored = pickle.loads(pickle.dumps(component))
+        self.assertEqual(restored, component)
+        self.assertEqual(restored.get(), component.get())
+
+
+class StageFuncsRegistryTestCase(TestCase):
+
+    def test_registry_covers_valid_combinations(self):
+        self.assertEqual(
+            set(STAGE_FUNCS_REGISTRY),
+            {
+                (date_granularity, offset_granularity)
+                for date_granularity, offset_granularities in VALID_GRAINS_COMB.items()
+                for offset_granularity in offset_granularities
+            }
+        )
+
+    def test_periodic_uses_date_granularity_as_location(self):
+        self.assertEqual(
+            get_stage_funcs(DateGranularity.DAILY, OffsetGranularity.PERIODIC),
+            (
+                get_daily_index_of_daily,
+                get_compared_start_daily_located_daily,
+                get_daily_with_index_in_daily,
+            )
+        )
+
+    def test_get_stage_funcs_with_unsupported_combo(self):
+        with self.assertRaises(ValueError):
+            get_stage_funcs(DateGranularity.MONTHLY, OffsetGranularity.DAILY)
+
+    def test_register_unimplemented_stage_funcs(self):
+        with self.assertRaises(NotImplementedError):
+            register_stage_funcs(ModuleType('unimplemented'))
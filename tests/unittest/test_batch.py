@@ -0,0 +1,227 @@
+import datetime
+import pickle
+from array import array
+from unittest import TestCase
+
+from deloreans.api import get_many
+from deloreans.batch import ComparisonBatch
+from deloreans.columns import NULL_ORDINAL
+from deloreans.date_utils import (
+    Calendar,
+    ComparedRange,
+    DateGranularity,
+    OffsetGranularity,
+)
+from deloreans.validation import ErrorCode
+
+
+class ComparisonBatchTestCase(TestCase):
+
+    def setUp(self) -> None:
+        self.start_dates = [
+            datetime.date(2024, 6, 1),
+            datetime.date(2024, 3, 31),
+            datetime.date(2024, 2, 11),
+            datetime.date(2024, 4, 1),
+        ]
+        self.end_dates = [
+            datetime.date(2024, 6, 30),
+            datetime.date(2024, 3, 31),
+            datetime.date(2024, 2, 24),
+            datetime.date(2024, 6, 30),
+        ]
+        self.date_granularities = [
+            DateGranularity.MONTHLY,
+            DateGranularity.DAILY,
+            DateGranularity.WEEKLY,
+            DateGranularity.MONTHLY,
+        ]
+        self.offsets = [-1, -1, -2, -1]
+        self.offset_granularities = [
+            OffsetGranularity.YEARLY,
+            OffsetGranularity.MONTHLY,
+            OffsetGranularity.MONTHLY,
+            OffsetGranularity.PERIODIC,
+        ]
+        self.firstweekdays = [0, 0, Calendar(6), 0]
+        self.arguments = (
+            self.start_dates,
+            self.end_dates,
+            self.date_granularities,
+            self.offsets,
+            self.offset_granularities,
+            self.firstweekdays,
+        )
+
+    def test_consistent_with_get_many(self):
+        batch = ComparisonBatch.from_dates(*self.arguments, overflow='null')
+        expected = get_many(*self.arguments, overflow='null')
+        self.assertEqual(list(batch), expected)
+        self.assertEqual([batch[index] for index in range(len(batch))], expected)
+        self.assertIsNone(batch[1])
+        self.assertEqual(batch[-1], expected[-1])
+        self.assertEqual(list(batch.statuses), [ErrorCode.OK] * 4)
+
+        ordinal_batch = ComparisonBatch.from_ordinals(
+            [a_date.toordinal() for a_date in self.start_dates],
+            [a_date.toordinal() for a_date in self.end_dates],
+            *self.arguments[2:],
+            overflow='null',
+        )
+        self.assertEqual(ordinal_batch, batch)
+
+    def test_columns(self):
+        batch = ComparisonBatch.from_dates(*self.arguments, overflow='null')
+        self.assertEqual(list(batch.start_ordinals), [a_date.toordinal() for a_date in self.start_dates])
+        self.assertEqual(list(batch.end_ordinals), [a_date.toordinal() for a_date in self.end_dates])
+        self.assertEqual(batch.compared_start_ordinals[0], datetime.date(2023, 6, 1).toordinal())
+        self.assertEqual(batch.compared_end_ordinals[1], NULL_ORDINAL)
+        self.assertEqual(batch.start_ordinals.format, 'i')
+        self.assertEqual(batch.start_ordinals.itemsize, 4)
+        self.assertEqual(batch.nbytes, 4 * 17)
+        self.assertTrue(batch.statuses.readonly)
+        with self.assertRaises(TypeError):
+            batch.start_ordinals[0] = 1
+
+    def test_copied_columns(self):
+        start_ordinals = array('i', [1, 2])
+        batch = ComparisonBatch(start_ordinals, [1, 2], [3, 4], [3, 4])
+        start_ordinals[0] = 3
+        self.assertEqual(list(batch.start_ordinals), [1, 2])
+        self.assertEqual(list(batch.statuses), [ErrorCode.OK, ErrorCode.OK])
+        self.assertEqual(ComparisonBatch(*(getattr(batch, name) for name in (
+            'start_ordinals',
+            'end_ordinals',
+            'compared_start_ordinals',
+            'compared_end_ordinals',
+            'statuses',
+        ))), batch)
+
+    def test_invalid_columns(self):
+        self.assertEqual(list(ComparisonBatch([1], [1], [NULL_ORDINAL], [NULL_ORDINAL]).compared_start_ordinals), [0])
+        for columns in (
+            ([-5], [-5], [0], [0]),
+            (array('i', [-5]), [1], [1], [1]),
+            ([1], [1], [1], array('i', [3652060])),
+            ([1], [1], [1], [1], [200]),
+            ([1], [1], [1], [1], array('B', [200])),
+        ):
+            with self.subTest(columns=columns), self.assertRaises(ValueError):
+                ComparisonBatch(*columns)
+        with self.assertRaises(TypeError):
+            ComparisonBatch([1.0], [1], [1], [1])
+
+    def test_slice_sort_filter(self):
+        batch = ComparisonBatch.from_dates(*self.arguments, overflow='null')
+        expected = list(batch)
+
+        self.assertIsInstance(batch[1:3], ComparisonBatch)
+        self.assertEqual(list(batch[1:3]), expected[1:3])
+        self.assertEqual(list(batch[::-1]), expected[::-1])
+
+        sorted_batch = batch.sorted_by('start_ordinals')
+        self.assertEqual(list(sorted_batch.start_ordinals), sorted(batch.start_ordinals))
+        self.assertEqual(list(sorted_batch), [expected[2], expected[1], expected[3], expected[0]])
+        self.assertEqual(
+            list(batch.sorted_by('compared_start_ordinals', reverse=True).compared_start_ordinals),
+            sorted(batch.compared_start_ordinals, reverse=True),
+        )
+
+        filtered = batch.filter(ordinal != NULL_ORDINAL for ordinal in batch.compared_start_ordinals)
+        self.assertEqual(list(filtered), [expected[0], expected[2], expected[3]])
+        self.assertEqual(list(batch.take([3, 0])), [expected[3], expected[0]])
+
+        with self.assertRaises(ValueError):
+            batch.filter([True])
+        with self.assertRaises(ValueError):
+            batch.sorted_by('start_dates')
+
+    def test_errors_null(self):
+        start_dates = [datetime.date(2024, 6, 1), '2024-06-01', datetime.date(2024, 6, 2), datetime.date(2024, 6, 1)]
+        end_dates = [datetime.date(2024, 6, 30), datetime.date(2024, 6, 30), datetime.date(2024, 6, 30), None]
+        batch = ComparisonBatch.from_dates(
+            start_dates,
+            end_dates,
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+            errors='null',
+        )
+        self.assertEqual(
+            list(batch.statuses),
+            [ErrorCode.OK, ErrorCode.INVALID_TYPE, ErrorCode.PARTIAL_DATE_RANGE, ErrorCode.INVALID_TYPE],
+        )
+        self.assertEqual(
+            list(batch),
+            [ComparedRange(datetime.date(2023, 6, 1), datetime.date(2023, 6, 30)), None, None, None],
+        )
+
+        june_1 = datetime.date(2024, 6, 1).toordinal()
+        ordinal_batch = ComparisonBatch.from_ordinals(
+            [june_1, 0, 'a', june_1],
+            [june_1, june_1, june_1, june_1],
+            [DateGranularity.DAILY, DateGranularity.DAILY, DateGranularity.DAILY, 'daily'],
+            1,
+            OffsetGranularity.DAILY,
+            errors='null',
+        )
+        self.assertEqual(
+            list(ordinal_batch.statuses),
+            [ErrorCode.OK, ErrorCode.INVALID_DATE_RANGE, ErrorCode.INVALID_TYPE, ErrorCode.INVALID_TYPE],
+        )
+
+    def test_equal_firstweekdays_of_different_types(self):
+        batch = ComparisonBatch.from_dates(
+            [datetime.date(2024, 6, 1)] * 2,
+            [datetime.date(2024, 6, 30)] * 2,
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+            [0, 0.0],
+            errors='null',
+        )
+        self.assertEqual(list(batch.statuses), [ErrorCode.OK, ErrorCode.INVALID_TYPE])
+        with self.assertRaises(TypeError):
+            ComparisonBatch.from_dates(
+                [datetime.date(2024, 6, 1)] * 2,
+                [datetime.date(2024, 6, 30)] * 2,
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+                [0, 0.0],
+            )
+
+    def test_errors_raise(self):
+        with self.assertRaises(TypeError):
+            ComparisonBatch.from_dates(
+                ['2024-06-01'],
+                [datetime.date(2024, 6, 30)],
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+        with self.assertRaises(ValueError):
+            ComparisonBatch.from_ordinals([739039], [739067], DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)
+        with self.assertRaises(ValueError):
+            ComparisonBatch.from_dates(
+                [datetime.date(2024, 3, 31)],
+                [datetime.date(2024, 3, 31)],
+                DateGranularity.DAILY,
+                -1,
+                OffsetGranularity.MONTHLY,
+            )
+        with self.assertRaises(ValueError):
+            ComparisonBatch.from_dates(*self.arguments, errors='ignore')
+        with self.assertRaises(ValueError):
+            ComparisonBatch([1, 2], [1], [1, 2], [1, 2])
+
+    def test_immutable(self):
+        batch = ComparisonBatch([1], [1], [1], [1])
+        with self.assertRaises(AttributeError):
+            batch._statuses = array('B', [1])
+        with self.assertRaises(AttributeError):
+            del batch._statuses
+        with self.assertRaises(TypeError):
+            hash(batch)
+        self.assertEqual(pickle.loads(pickle.dumps(batch)), batch)
+        self.assertEqual(repr(batch), 'ComparisonBatch(<1 rows>)')
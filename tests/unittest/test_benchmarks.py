@@ -0,0 +1,80 @@
+import json
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+# benchmarks are scripts run from the repository root, which import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, 'benchmarks'))
+
+import batch  # NOQA: E402
+import compare  # NOQA: E402
+import latency  # NOQA: E402
+import memory  # NOQA: E402
+import parallel_scaling  # NOQA: E402
+
+
+class BenchmarksTestCase(TestCase):
+    """
+    smoke tests on the entry points of benchmarks with minimal sizes, which don't measure anything
+    """
+
+    def run_main(self, module, *argv):
+        with patch.object(sys, 'argv', [f'{module.__name__}.py', *argv]), redirect_stdout(StringIO()) as stdout:
+            try:
+                module.main()
+                code = 0
+            except SystemExit as exit:
+                code = exit.code
+        return code, stdout.getvalue()
+
+    def test_latency(self):
+        code, stdout = self.run_main(latency, '--repeat', '1', '--number', '1')
+        self.assertEqual(code, 0)
+        report = json.loads(stdout)['report']
+        self.assertEqual([result['case'] for result in report], [case.name for case in latency.iter_cases()])
+        self.assertTrue(all(result['ns_per_call'] > 0 for result in report))
+
+    def test_memory(self):
+        code, stdout = self.run_main(memory, '--amount', '10')
+        self.assertEqual(code, 0)
+        self.assertEqual(list(json.loads(stdout)), list(memory.FACTORIES))
+
+    def test_batch(self):
+        code, stdout = self.run_main(batch, '--batch-sizes', '1', '3', '--repeat', '1', '--number', '1')
+        self.assertEqual(code, 0)
+        report = json.loads(stdout)['report']
+        self.assertEqual({result['batch_size'] for result in report}, {1, 3})
+        self.assertIn('parallel.get_many_ordinal/3', [result['case'] for result in report])
+
+    def test_parallel_scaling(self):
+        code, stdout = self.run_main(
+            parallel_scaling,
+            '--rows', '100',
+            '--chunk-size', '40',
+            '--max-workers', '1',
+        )
+        self.assertEqual(code, 0)
+        self.assertEqual([result['workers'] for result in json.loads(stdout)['report']], [1])
+
+    def test_compare(self):
+        with tempfile.TemporaryDirectory() as directory:
+            baseline_path = os.path.join(directory, 'baseline.json')
+            code, _ = self.run_main(compare, 'save', '--baseline', baseline_path, '--repeat', '1', '--number', '1')
+            self.assertEqual(code, 0)
+            with open(baseline_path) as file:
+                self.assertEqual(len(json.load(file)['cases']), len(list(latency.iter_cases())))
+            code, stdout = self.run_main(
+                compare,
+                'check',
+                '--baseline', baseline_path,
+                '--repeat', '1',
+                '--number', '1',
+                '--threshold', '1000',
+                '--retries', '0',
+            )
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(stdout)['regressed'], [])
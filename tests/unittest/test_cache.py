@@ -0,0 +1,184 @@
+import datetime
+import threading
+import traceback
+from unittest import TestCase
+from unittest.mock import patch
+
+from deloreans.cache import CachedGet, CacheInfo
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+    OverflowPolicy,
+)
+
+
+class CachedGetTestCase(TestCase):
+
+    def test_cached_get(self):
+        cached_get = CachedGet(maxsize=8)
+        for _ in range(3):
+            self.assertEqual(
+                cached_get(
+                    datetime.date(2024, 6, 1),
+                    datetime.date(2024, 6, 30),
+                    DateGranularity.MONTHLY,
+                    -1,
+                    OffsetGranularity.YEARLY,
+                ),
+                (datetime.date(2023, 6, 1), datetime.date(2023, 6, 30)),
+            )
+        self.assertEqual(cached_get.cache_info(), CacheInfo(2, 1, 8, 1))
+
+    def test_normalized_arguments(self):
+        cached_get = CachedGet()
+        cached_get(
+            datetime.date(2024, 6, 1),
+            datetime.date(2024, 6, 30),
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        cached_get(
+            start_date=datetime.date(2024, 6, 1),
+            end_date=datetime.date(2024, 6, 30),
+            date_granularity=DateGranularity.MONTHLY,
+            offset=-1,
+            offset_granularity=OffsetGranularity.YEARLY,
+            firstweekday=0,
+        )
+        self.assertEqual(cached_get.cache_info().hits, 1)
+
+    def test_eviction(self):
+        cached_get = CachedGet(maxsize=2)
+        for offset in (-1, -2, -1, -3, -2):
+            cached_get(
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                offset,
+                OffsetGranularity.YEARLY,
+            )
+        # -2 is evicted by -3 since -1 is recently used
+        self.assertEqual(cached_get.cache_info(), CacheInfo(1, 4, 2, 2))
+
+    def test_cached_invalid_arguments(self):
+        cached_get = CachedGet()
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                cached_get(
+                    datetime.date(2024, 6, 2),
+                    datetime.date(2024, 6, 30),
+                    DateGranularity.MONTHLY,
+                    -1,
+                    OffsetGranularity.YEARLY,
+                )
+        self.assertEqual(cached_get.cache_info(), CacheInfo(1, 1, 1024, 1))
+
+    def test_raised_errors(self):
+        args = (datetime.date(2024, 6, 1), datetime.date(2024, 6, 30), DateGranularity.MONTHLY, -1)
+        cause = KeyError('cause')
+
+        class OptionError(ValueError):
+
+            def __init__(self, option):
+                super().__init__(f'invalid option {option}')
+
+        for error in (ValueError('invalid'), OptionError('a')):
+            error.__cause__ = cause
+            cached_get = CachedGet()
+            with patch('deloreans.cache.get', side_effect=error):
+                # the original error is raised on a miss
+                with self.assertRaises(ValueError) as context:
+                    cached_get(*args, OffsetGranularity.YEARLY)
+                self.assertIs(context.exception, error)
+                self.assertIs(context.exception.__cause__, cause)
+                raised = []
+                for _ in range(2):
+                    try:
+                        cached_get(*args, OffsetGranularity.YEARLY)
+                    except ValueError as err:
+                        raised.append(err)
+                self.assertEqual([type(err) for err in raised], [type(error)] * 2)
+                self.assertEqual([str(err) for err in raised], [str(error)] * 2)
+                # a new error of each hit, whose traceback doesn't keep growing
+                self.assertIsNot(raised[0], raised[1])
+                self.assertEqual(*(len(traceback.extract_tb(err.__traceback__)) for err in raised))
+
+    def test_equal_arguments_of_different_types(self):
+        args = (datetime.date(2024, 6, 1), datetime.date(2024, 6, 30), DateGranularity.MONTHLY)
+        expected = (datetime.date(2023, 6, 1), datetime.date(2023, 6, 30))
+        for offsets in ((-1.0, -1), (-1, -1.0)):
+            cached_get = CachedGet()
+            for offset in offsets:
+                if isinstance(offset, float):
+                    with self.assertRaises(TypeError):
+                        cached_get(*args, offset, OffsetGranularity.YEARLY)
+                else:
+                    self.assertEqual(cached_get(*args, offset, OffsetGranularity.YEARLY), expected)
+            self.assertEqual(cached_get.cache_info().misses, 2)
+
+        cached_get = CachedGet()
+        with self.assertRaises(TypeError):
+            cached_get(*args, -1, OffsetGranularity.YEARLY, 0.0)
+        self.assertEqual(cached_get(*args, -1, OffsetGranularity.YEARLY, 0), expected)
+
+    def test_normalized_overflow(self):
+        cached_get = CachedGet()
+        args = (datetime.date(2024, 6, 1), datetime.date(2024, 6, 30), DateGranularity.MONTHLY, -1)
+        cached_get(*args, OffsetGranularity.YEARLY, overflow='raise')
+        cached_get(*args, OffsetGranularity.YEARLY, overflow=OverflowPolicy.RAISE)
+        self.assertEqual(cached_get.cache_info().hits, 1)
+        with self.assertRaises(ValueError):
+            cached_get(*args, OffsetGranularity.YEARLY, overflow='ignore')
+
+    def test_unhashable_arguments(self):
+        cached_get = CachedGet()
+        with self.assertRaises(TypeError):
+            cached_get(
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                [-1],
+                OffsetGranularity.YEARLY,
+            )
+        self.assertEqual(cached_get.cache_info().currsize, 0)
+
+    def test_cache_clear(self):
+        cached_get = CachedGet()
+        cached_get(
+            datetime.date(2024, 6, 1),
+            datetime.date(2024, 6, 30),
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        cached_get.cache_clear()
+        self.assertEqual(cached_get.cache_info(), CacheInfo(0, 0, 1024, 0))
+
+    def test_thread_safety(self):
+        cached_get = CachedGet(maxsize=4)
+
+        def worker():
+            for i in range(200):
+                cached_get(
+                    datetime.date(2024, 6, 1),
+                    datetime.date(2024, 6, 30),
+                    DateGranularity.MONTHLY,
+                    -(i % 6) - 1,
+                    OffsetGranularity.YEARLY,
+                )
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        cache_info = cached_get.cache_info()
+        self.assertEqual(cache_info.hits + cache_info.misses, 800)
+        self.assertEqual(cache_info.currsize, 4)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            CachedGet(maxsize=0)
+        with self.assertRaises(TypeError):
+            CachedGet(maxsize='8')  # NOQA
@@ -0,0 +1,152 @@
+import json
+import os
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from unittest import TestCase
+
+from deloreans import cli
+
+
+CSV_INPUT = """id,start,end,offset
+1,2024-06-01,2024-06-30,-1
+2,2024-06-02,2024-06-30,-1
+3,2024-03-31,2024-03-31,-1
+4,2024-06-01,2024-06-30,
+"""
+
+
+class CliTestCase(TestCase):
+
+    def run_main(self, argv, stdin=''):
+        previous_stdin = sys.stdin
+        sys.stdin = StringIO(stdin)
+        try:
+            with redirect_stdout(StringIO()) as stdout, redirect_stderr(StringIO()) as stderr:
+                try:
+                    cli.main(argv)
+                    code = 0
+                except SystemExit as exit:
+                    code = exit.code
+        finally:
+            sys.stdin = previous_stdin
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def run_csv(self, *options):
+        return self.run_main(
+            [
+                '--start-date-column', 'start',
+                '--end-date-column', 'end',
+                '--date-granularity', 'monthly',
+                '--offset-granularity', 'yearly',
+                *options,
+            ],
+            CSV_INPUT,
+        )
+
+    def test_csv_errors_null(self):
+        code, stdout, _ = self.run_csv('--errors', 'null', '--batch-size', '3')
+        self.assertEqual(code, 0)
+        self.assertEqual(
+            stdout.splitlines(),
+            [
+                'id,start,end,offset,compared_start_date,compared_end_date',
+                '1,2024-06-01,2024-06-30,-1,2023-06-01,2023-06-30',
+                '2,2024-06-02,2024-06-30,-1,,',
+                '3,2024-03-31,2024-03-31,-1,,',
+                '4,2024-06-01,2024-06-30,,,',
+            ],
+        )
+
+    def test_csv_errors_skip(self):
+        code, stdout, _ = self.run_csv('--errors', 'skip', '--offset', '-2')
+        self.assertEqual(code, 0)
+        self.assertEqual(
+            stdout.splitlines()[1:],
+            [
+                '1,2024-06-01,2024-06-30,-1,2023-06-01,2023-06-30',
+                '4,2024-06-01,2024-06-30,,2022-06-01,2022-06-30',
+            ],
+        )
+
+    def test_csv_errors_fail(self):
+        code, stdout, stderr = self.run_csv('--batch-size', '1')
+        self.assertEqual(code, 1)
+        self.assertEqual(len(stdout.splitlines()), 2)
+        self.assertIn('Row 2 is invalid', stderr)
+        self.assertIn('is not a full monthly period', stderr)
+
+    def test_overflow(self):
+        code, stdout, _ = self.run_main(
+            ['--format', 'csv', '--offset-granularity', 'monthly', '--offset', '-1', '--overflow', 'clamp'],
+            'start_date,end_date,date_granularity\n2024-03-31,2024-03-31,daily\n',
+        )
+        self.assertEqual(code, 0)
+        self.assertEqual(stdout.splitlines()[1], '2024-03-31,2024-03-31,daily,2024-02-29,2024-02-29')
+
+    def test_jsonl(self):
+        requests = [
+            {'start_date': '2024-06-10', 'end_date': '2024-06-16', 'offset': -1, 'firstweekday': 0},
+            {'start_date': '2024-06-09', 'end_date': '2024-06-15', 'offset': -1, 'firstweekday': 6},
+            {'start_date': '2024-06-09', 'end_date': '2024-06-15', 'offset': 'a'},
+            {'start_date': '2024-06-10', 'end_date': '2024-06-16', 'offset': -1, 'firstweekday': 0.0},
+            [],
+        ]
+        code, stdout, _ = self.run_main(
+            ['--format', 'jsonl', '--date-granularity', 'weekly', '--offset-granularity', 'yearly', '--errors', 'null'],
+            '\n'.join(json.dumps(request) for request in requests) + '\n\nnot json\n',
+        )
+        self.assertEqual(code, 0)
+        lines = stdout.splitlines()
+        self.assertEqual(len(lines), 6)
+        # the lines which aren't JSON objects are passed through unchanged
+        self.assertEqual(lines[4:], ['[]', 'not json'])
+        rows = [json.loads(line) for line in lines[:4]]
+        self.assertEqual((rows[0]['compared_start_date'], rows[0]['compared_end_date']), ('2023-06-12', '2023-06-18'))
+        self.assertEqual(rows[1]['compared_start_date'], '2023-06-11')
+        self.assertEqual(rows[1]['firstweekday'], 6)
+        for row in rows[2:]:
+            self.assertIsNone(row['compared_start_date'])
+            self.assertIsNone(row['compared_end_date'])
+
+    def test_jsonl_row_numbers(self):
+        code, _, stderr = self.run_main(
+            ['--format', 'jsonl', '--date-granularity', 'daily', '--offset', '-1', '--offset-granularity', 'yearly'],
+            '{"start_date": "2024-06-01", "end_date": "2024-06-01"}\n\n\n{"start_date": "2024-06-01"}\n',
+        )
+        self.assertEqual(code, 1)
+        # blank lines are counted in the numbers of rows
+        self.assertIn('Row 4 is invalid', stderr)
+
+    def test_files_and_workers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, 'requests.jsonl')
+            output_path = os.path.join(directory, 'compared.jsonl')
+            with open(input_path, 'w') as file:
+                for day in range(1, 29):
+                    file.write(json.dumps({'start_date': f'2024-02-{day:02}', 'end_date': f'2024-02-{day:02}'}) + '\n')
+            code, stdout, _ = self.run_main([
+                input_path,
+                '--output', output_path,
+                '--date-granularity', 'daily',
+                '--offset', '-1',
+                '--offset-granularity', 'yearly',
+                '--workers', '2',
+                '--batch-size', '5',
+            ])
+            self.assertEqual((code, stdout), (0, ''))
+            with open(output_path) as file:
+                rows = [json.loads(line) for line in file]
+        self.assertEqual([row['compared_start_date'] for row in rows], [f'2023-02-{day:02}' for day in range(1, 29)])
+
+    def test_invalid_options(self):
+        code, _, stderr = self.run_main(['--date-granularity', 'hourly'])
+        self.assertEqual(code, 2)
+        self.assertIn('--date-granularity', stderr)
+        self.assertEqual(self.run_main(['--workers', '0'])[0], 2)
+        self.assertEqual(self.run_main(['--errors', 'raise'])[0], 2)
+
+    def test_empty_input(self):
+        self.assertEqual(self.run_main([]), (0, '', ''))
+        self.assertEqual(self.run_main(['--format', 'jsonl'], '\n'), (0, '', ''))
@@ -0,0 +1,230 @@
+import datetime
+from unittest import skipIf, TestCase
+
+import deloreans
+from deloreans import instrumentation
+from deloreans.app import DeLoreans
+from deloreans.batch import ComparisonBatch
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+)
+
+try:
+    import numpy as np
+    from deloreans import vectorized
+except ImportError:  # pragma: no cover
+    np = None
+
+
+STAGES = [
+    instrumentation.STAGE_VALIDATION,
+    instrumentation.STAGE_START_PERIOD_INDEX,
+    instrumentation.STAGE_DATE_RANGE_LENGTH,
+    instrumentation.STAGE_COMPARED_LOCATED_PERIOD_START_DATE,
+    instrumentation.STAGE_COMPARED_START_DATE,
+    instrumentation.STAGE_END_DATE,
+]
+
+
+class TracerTestCase(TestCase):
+
+    def setUp(self) -> None:
+        self.traces = []
+        self.previous_tracer = instrumentation.set_tracer(self.traces.append)
+
+    def tearDown(self) -> None:
+        instrumentation.set_tracer(self.previous_tracer)
+
+    def test_trace_get(self):
+        result = deloreans.get(
+            datetime.date(2024, 6, 1),
+            datetime.date(2024, 6, 30),
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(result, (datetime.date(2023, 6, 1), datetime.date(2023, 6, 30)))
+        self.assertEqual(len(self.traces), 1)
+        trace = self.traces[0]
+        self.assertIs(trace.date_granularity, DateGranularity.MONTHLY)
+        self.assertIs(trace.offset_granularity, OffsetGranularity.YEARLY)
+        self.assertEqual(list(trace.durations), STAGES)
+        self.assertTrue(all(duration >= 0 for duration in trace.durations.values()))
+        self.assertGreater(trace.durations[instrumentation.STAGE_VALIDATION], 0)
+        self.assertEqual(trace.total_ns, sum(trace.durations.values()))
+
+    def test_trace_component(self):
+        component = DeLoreans(
+            datetime.date(2024, 3, 31),
+            datetime.date(2024, 3, 31),
+            DateGranularity.DAILY,
+            -1,
+            OffsetGranularity.MONTHLY,
+        )
+        self.assertIsNone(component.get('null'))
+        self.assertEqual(len(self.traces), 1)
+        self.assertEqual(list(self.traces[0].durations), STAGES)
+
+    def test_consistent_with_untraced(self):
+        args = (
+            datetime.date(2023, 12, 31),
+            datetime.date(2024, 3, 30),
+            DateGranularity.WEEKLY,
+            -1,
+            OffsetGranularity.PERIODIC,
+            6,
+        )
+        traced = deloreans.get(*args)
+        instrumentation.set_tracer(None)
+        self.assertEqual(traced, deloreans.get(*args))
+        self.assertEqual(len(self.traces), 1)
+
+    def test_error_not_traced(self):
+        with self.assertRaises(ValueError):
+            deloreans.get(
+                datetime.date(2024, 12, 31),
+                datetime.date(2024, 12, 31),
+                DateGranularity.DAILY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+        self.assertEqual(self.traces, [])
+
+    def test_set_tracer(self):
+        self.assertEqual(instrumentation.get_tracer(), self.traces.append)
+        self.assertEqual(instrumentation.set_tracer(None), self.traces.append)
+        self.assertIsNone(instrumentation.get_tracer())
+
+
+class SlowCallLogTestCase(TestCase):
+
+    def setUp(self) -> None:
+        self.previous_slow_call_log = instrumentation.get_slow_call_log()
+
+    def tearDown(self) -> None:
+        instrumentation._slow_call_log = self.previous_slow_call_log
+
+    def get_monthly(self):
+        return deloreans.get(
+            datetime.date(2024, 6, 1),
+            datetime.date(2024, 6, 30),
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+
+    def test_slow_call(self):
+        instrumentation.set_slow_call_log(0)
+        with self.assertLogs(instrumentation.SLOW_CALL_LOGGER, 'WARNING') as logs:
+            self.assertEqual(self.get_monthly(), (datetime.date(2023, 6, 1), datetime.date(2023, 6, 30)))
+        fields = logs.records[0].deloreans
+        self.assertEqual(fields['entry_point'], 'get')
+        self.assertEqual(fields['arguments']['start_date'], datetime.date(2024, 6, 1))
+        self.assertEqual(fields['arguments']['offset'], -1)
+        self.assertEqual((fields['date_granularity'], fields['offset_granularity']), ('monthly', 'yearly'))
+        self.assertEqual(list(fields['stages_us']), STAGES)
+        self.assertGreater(fields['duration_us'], 0)
+
+    def test_fast_call(self):
+        instrumentation.set_slow_call_log(10 ** 9)
+        with self.assertRaises(AssertionError):
+            with self.assertLogs(instrumentation.SLOW_CALL_LOGGER, 'WARNING'):
+                self.get_monthly()
+
+    def test_rate_limit(self):
+        instrumentation.set_slow_call_log(0, max_records=2, period=3600)
+        with self.assertLogs(instrumentation.SLOW_CALL_LOGGER, 'WARNING') as logs:
+            for _ in range(5):
+                self.get_monthly()
+        self.assertEqual(len(logs.records), 2)
+
+        slow_call_log = instrumentation.get_slow_call_log()
+        slow_call_log._period_started -= 3600
+        with self.assertLogs(instrumentation.SLOW_CALL_LOGGER, 'WARNING') as logs:
+            self.get_monthly()
+        self.assertEqual(logs.records[0].deloreans['suppressed'], 3)
+
+    def test_slow_batch(self):
+        instrumentation.set_slow_call_log(0)
+        with self.assertLogs(instrumentation.SLOW_CALL_LOGGER, 'WARNING') as logs:
+            deloreans.get_many(
+                [datetime.date(2024, 6, 1), datetime.date(2024, 7, 1)],
+                [datetime.date(2024, 6, 30), datetime.date(2024, 7, 31)],
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+        fields = logs.records[0].deloreans
+        self.assertEqual(fields['entry_point'], 'get_many')
+        self.assertEqual(fields['rows'], 2)
+        self.assertEqual(fields['arguments']['start_dates'], '<2 rows>')
+        self.assertIsNone(fields['stages_us'])
+
+    def test_slow_comparison_batch(self):
+        instrumentation.set_slow_call_log(0)
+        with self.assertLogs(instrumentation.SLOW_CALL_LOGGER, 'WARNING') as logs:
+            ComparisonBatch.from_dates(
+                [datetime.date(2024, 6, 1), datetime.date(2024, 7, 1)],
+                [datetime.date(2024, 6, 30), datetime.date(2024, 7, 31)],
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+            ComparisonBatch.from_ordinals(
+                [datetime.date(2024, 6, 1).toordinal()],
+                [datetime.date(2024, 6, 30).toordinal()],
+                DateGranularity.MONTHLY,
+                [-1],
+                OffsetGranularity.YEARLY,
+                errors='null',
+            )
+        self.assertEqual(
+            [record.deloreans['entry_point'] for record in logs.records],
+            ['ComparisonBatch.from_dates', 'ComparisonBatch.from_ordinals'],
+        )
+        self.assertEqual([record.deloreans['rows'] for record in logs.records], [2, 1])
+        self.assertEqual(logs.records[0].deloreans['arguments']['start_dates'], '<2 rows>')
+        self.assertEqual(logs.records[1].deloreans['arguments']['offsets'], '<1 rows>')
+        self.assertEqual(logs.records[1].deloreans['arguments']['errors'], 'null')
+
+    @skipIf(np is None, 'NumPy is not installed')
+    def test_slow_vectorized(self):
+        instrumentation.set_slow_call_log(0)
+        with self.assertLogs(instrumentation.SLOW_CALL_LOGGER, 'WARNING') as logs:
+            vectorized.get(
+                np.array(['2024-06-01', '2024-07-01'], dtype='datetime64[D]'),
+                np.array(['2024-06-30', '2024-07-31'], dtype='datetime64[D]'),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+        fields = logs.records[0].deloreans
+        self.assertEqual(fields['entry_point'], 'vectorized.get')
+        self.assertEqual(fields['rows'], 2)
+        self.assertEqual(fields['arguments']['end_dates'], '<2 rows>')
+        self.assertEqual(fields['arguments']['offset'], -1)
+        self.assertEqual((fields['date_granularity'], fields['offset_granularity']), ('monthly', 'yearly'))
+
+        instrumentation.set_slow_call_log(10 ** 9)
+        with self.assertRaises(AssertionError):
+            with self.assertLogs(instrumentation.SLOW_CALL_LOGGER, 'WARNING'):
+                vectorized.get(np.array([0]), np.array([0]), DateGranularity.DAILY, -1, OffsetGranularity.DAILY)
+
+    def test_traced_while_logging(self):
+        traces = []
+        previous_tracer = instrumentation.set_tracer(traces.append)
+        try:
+            instrumentation.set_slow_call_log(10 ** 9)
+            self.get_monthly()
+        finally:
+            instrumentation.set_tracer(previous_tracer)
+        self.assertEqual(len(traces), 1)
+
+    def test_invalid_slow_call_log(self):
+        with self.assertRaises(ValueError):
+            instrumentation.set_slow_call_log(-1)
+        with self.assertRaises(ValueError):
+            instrumentation.set_slow_call_log(100, max_records=0)
+        with self.assertRaises(TypeError):
+            instrumentation.set_slow_call_log('100')
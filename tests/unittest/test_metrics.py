@@ -0,0 +1,177 @@
+import datetime
+from unittest import TestCase
+
+import deloreans
+from deloreans import metrics
+from deloreans.cache import CachedGet
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+)
+from deloreans.exceptions import (
+    PARTIAL_DATE_RANGE_TEMPLATE,
+    START_DATE_OVERFLOW_ERROR_MSG,
+    StartDateOverflowError,
+)
+from deloreans.validation import ErrorCode
+
+
+MONTHLY_YEARLY = 'date_granularity="monthly",offset_granularity="yearly"'
+
+
+class ErrorReasonTestCase(TestCase):
+
+    def test_get_error_reason(self):
+        error = ValueError(
+            PARTIAL_DATE_RANGE_TEMPLATE.format(
+                start_date='2024-06-02',
+                end_date='2024-06-30',
+                date_granularity_name='monthly',
+            )
+        )
+        self.assertEqual(metrics.get_error_reason(error, ErrorCode.PARTIAL_DATE_RANGE), 'partial_date_range')
+        self.assertEqual(
+            metrics.get_error_reason(StartDateOverflowError(START_DATE_OVERFLOW_ERROR_MSG)),
+            'start_date_overflow',
+        )
+        # the message is irrelevant to the reason
+        self.assertEqual(metrics.get_error_reason(error), 'ValueError')
+        self.assertEqual(metrics.get_error_reason(ValueError(START_DATE_OVERFLOW_ERROR_MSG)), 'ValueError')
+
+
+class MetricsTestCase(TestCase):
+
+    def setUp(self) -> None:
+        self.previous_metrics = metrics.get_metrics()
+        self.metrics = metrics.enable(latency_buckets=[0.001, 0.00001])
+
+    def tearDown(self) -> None:
+        metrics.disable()
+        if self.previous_metrics is not None:
+            metrics._metrics = self.previous_metrics
+
+    def get_samples(self):
+        return {
+            line.rsplit(' ', 1)[0]: float(line.rsplit(' ', 1)[1])
+            for line in metrics.render().splitlines()
+            if not line.startswith('#')
+        }
+
+    def test_calls_and_latency(self):
+        for _ in range(3):
+            deloreans.get(
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+        samples = self.get_samples()
+        self.assertEqual(samples[f'deloreans_calls_total{{{MONTHLY_YEARLY}}}'], 3)
+        self.assertEqual(samples[f'deloreans_call_duration_seconds_count{{{MONTHLY_YEARLY}}}'], 3)
+        self.assertEqual(samples[f'deloreans_call_duration_seconds_bucket{{{MONTHLY_YEARLY},le="+Inf"}}'], 3)
+        self.assertLessEqual(
+            samples[f'deloreans_call_duration_seconds_bucket{{{MONTHLY_YEARLY},le="1e-05"}}'],
+            samples[f'deloreans_call_duration_seconds_bucket{{{MONTHLY_YEARLY},le="0.001"}}'],
+        )
+        self.assertGreater(samples[f'deloreans_call_duration_seconds_sum{{{MONTHLY_YEARLY}}}'], 0)
+
+    def test_errors_and_overflows(self):
+        with self.assertRaises(ValueError):
+            deloreans.get(
+                datetime.date(2024, 6, 2),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+        with self.assertRaises(ValueError):
+            deloreans.get(
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.DAILY,
+            )
+        for overflow in ('raise', 'null'):
+            try:
+                deloreans.get(
+                    datetime.date(2024, 12, 31),
+                    datetime.date(2024, 12, 31),
+                    DateGranularity.DAILY,
+                    -1,
+                    OffsetGranularity.YEARLY,
+                    overflow=overflow,
+                )
+            except ValueError:
+                pass
+        samples = self.get_samples()
+        self.assertEqual(samples[f'deloreans_errors_total{{{MONTHLY_YEARLY},reason="partial_date_range"}}'], 1)
+        self.assertEqual(
+            samples[
+                'deloreans_errors_total{date_granularity="monthly",offset_granularity="daily",'
+                'reason="unregistered_granularity_combo"}'
+            ],
+            1,
+        )
+        self.assertEqual(
+            samples['deloreans_overflows_total{date_granularity="daily",offset_granularity="yearly"}'],
+            2,
+        )
+
+    def test_error_reasons_by_arguments(self):
+        for start_date, overflow in (('2024-06-01', 'raise'), (datetime.date(2024, 6, 1), 'ignore')):
+            with self.assertRaises((TypeError, ValueError)):
+                deloreans.get(
+                    start_date,  # type: ignore
+                    datetime.date(2024, 6, 30),
+                    DateGranularity.MONTHLY,
+                    -1,
+                    OffsetGranularity.YEARLY,
+                    overflow=overflow,
+                )
+        samples = self.get_samples()
+        self.assertEqual(samples[f'deloreans_errors_total{{{MONTHLY_YEARLY},reason="invalid_data_type"}}'], 1)
+        self.assertEqual(samples[f'deloreans_errors_total{{{MONTHLY_YEARLY},reason="ValueError"}}'], 1)
+
+    def test_batch(self):
+        deloreans.get_many(
+            [datetime.date(2024, 6, 1), datetime.date(2024, 6, 2), datetime.date(2024, 7, 1)],
+            [datetime.date(2024, 6, 30), datetime.date(2024, 6, 30), datetime.date(2024, 7, 31)],
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+            errors='null',
+        )
+        with self.assertRaises(ValueError):
+            deloreans.get_many(
+                [datetime.date(2024, 6, 2)],
+                [datetime.date(2024, 6, 30)],
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+        samples = self.get_samples()
+        self.assertEqual(samples[f'deloreans_calls_total{{{MONTHLY_YEARLY}}}'], 2)
+        self.assertEqual(samples[f'deloreans_errors_total{{{MONTHLY_YEARLY},reason="partial_date_range"}}'], 2)
+
+    def test_cache(self):
+        cached_get = CachedGet()
+        for _ in range(3):
+            cached_get(
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 30),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+        samples = self.get_samples()
+        self.assertEqual(samples['deloreans_cache_hits_total'], 2)
+        self.assertEqual(samples['deloreans_cache_misses_total'], 1)
+
+    def test_render_format(self):
+        self.assertTrue(metrics.render().endswith('# EOF\n'))
+        self.metrics.reset()
+        self.assertNotIn('deloreans_calls_total{', metrics.render())
+        metrics.disable()
+        self.assertEqual(metrics.render(), '# EOF\n')
@@ -0,0 +1,212 @@
+import datetime
+import json
+import os
+import tempfile
+from array import array
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import skipIf, TestCase
+from unittest.mock import patch
+
+from deloreans import out_of_core
+from deloreans.api import get_many
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+)
+from deloreans.validation import ErrorCode
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def get_day(a_date):
+    return a_date.toordinal() - out_of_core.EPOCH_ORDINAL
+
+
+def write_raw(path, values):
+    with open(path, 'wb') as file:
+        array('i', values).tofile(file)
+
+
+def read_column(path):
+    with out_of_core.MappedColumn.open(path) as column:
+        return list(column.read(0, column.size))
+
+
+class OutOfCoreTestCase(TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.start_dates = [datetime.date(2023, month, 1) for month in range(1, 13)]
+        self.end_dates = [
+            datetime.date(2023, month + 1, 1) - datetime.timedelta(days=1) for month in range(1, 12)
+        ] + [datetime.date(2023, 12, 31)]
+        write_raw(self.path('start.bin'), [get_day(a_date) for a_date in self.start_dates])
+        write_raw(self.path('end.bin'), [get_day(a_date) for a_date in self.end_dates])
+        self.expected = get_many(
+            self.start_dates,
+            self.end_dates,
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def compare(self, compared_start_name='compared_start.bin', compared_end_name='compared_end.bin', **kwargs):
+        return out_of_core.compare_files(
+            self.path('start.bin'),
+            self.path('end.bin'),
+            self.path(compared_start_name),
+            self.path(compared_end_name),
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+            **kwargs,
+        )
+
+    def assert_compared(self, compared_start_name='compared_start.bin', compared_end_name='compared_end.bin'):
+        self.assertEqual(
+            read_column(self.path(compared_start_name)),
+            [get_day(compared_date_range.start) for compared_date_range in self.expected],
+        )
+        self.assertEqual(
+            read_column(self.path(compared_end_name)),
+            [get_day(compared_date_range.end) for compared_date_range in self.expected],
+        )
+
+    def test_raw_columns(self):
+        self.assertEqual(self.compare(chunk_size=5), 12)
+        self.assert_compared()
+        self.assertEqual(os.path.getsize(self.path('compared_start.bin')), 12 * 4)
+
+    def test_npy_columns(self):
+        self.compare('compared_start.npy', 'compared_end.npy', chunk_size=5, statuses_path=self.path('statuses.npy'))
+        self.assert_compared('compared_start.npy', 'compared_end.npy')
+        column_format, size, offset = out_of_core.read_npy_header(self.path('compared_start.npy'))
+        self.assertEqual((column_format.descr, size, offset % out_of_core.NPY_ALIGNMENT), ('<i4', 12, 0))
+        with open(self.path('statuses.npy'), 'rb') as file:
+            header = file.read(offset)
+            self.assertIn(b"'descr': '|u1'", header)
+            self.assertEqual(file.read(), bytes([ErrorCode.OK] * 12))
+
+    def test_errors_null(self):
+        end_days = [get_day(a_date) for a_date in self.end_dates]
+        write_raw(self.path('end.bin'), [end_days[0] - 1] + end_days[1:])
+        self.compare(errors='null', statuses_path=self.path('statuses.bin'))
+        compared_start_days = read_column(self.path('compared_start.bin'))
+        self.assertEqual(compared_start_days[0], out_of_core.RAW_FORMAT.null)
+        self.assertEqual(compared_start_days[1], get_day(self.expected[1].start))
+        with open(self.path('statuses.bin'), 'rb') as file:
+            self.assertEqual(file.read(2), bytes([ErrorCode.PARTIAL_DATE_RANGE, ErrorCode.OK]))
+
+    def interrupt(self, chunks, **kwargs):
+        """
+        compare until given amount of chunks are written
+        """
+        from_ordinals = out_of_core.ComparisonBatch.from_ordinals
+        calls = []
+
+        def interrupted_from_ordinals(*args, **kwargs):
+            calls.append(args)
+            if len(calls) > chunks:
+                raise KeyboardInterrupt
+            return from_ordinals(*args, **kwargs)
+
+        with patch.object(out_of_core.ComparisonBatch, 'from_ordinals', interrupted_from_ordinals):
+            with self.assertRaises(KeyboardInterrupt):
+                self.compare(**kwargs)
+
+    def test_resume(self):
+        checkpoint_path = self.path('checkpoint.json')
+        self.interrupt(2, chunk_size=4, checkpoint_path=checkpoint_path)
+        with open(checkpoint_path) as file:
+            self.assertEqual(json.load(file)['rows'], 8)
+
+        # rows before the checkpoint aren't compared again
+        compared_start_path = self.path('compared_start.bin')
+        with out_of_core.MappedColumn.create(compared_start_path, out_of_core.RAW_FORMAT, 12, resume=True) as column:
+            column.write(0, array('i', [-1]))
+        self.compare(chunk_size=4, checkpoint_path=checkpoint_path)
+        compared_start_days = read_column(self.path('compared_start.bin'))
+        self.assertEqual(compared_start_days[0], -1)
+        self.assertEqual(compared_start_days[1:], [get_day(compared.start) for compared in self.expected[1:]])
+
+        # checkpoint of completed job is removed, so that running it again starts over
+        self.assertFalse(os.path.exists(checkpoint_path))
+        self.compare(chunk_size=4, checkpoint_path=checkpoint_path)
+        self.assert_compared()
+
+        self.interrupt(1, chunk_size=4, checkpoint_path=checkpoint_path)
+        with self.assertRaises(ValueError):
+            self.compare(chunk_size=4, checkpoint_path=checkpoint_path, errors='null')
+
+    def test_resume_with_modified_input(self):
+        checkpoint_path = self.path('checkpoint.json')
+        self.interrupt(1, chunk_size=4, checkpoint_path=checkpoint_path)
+        stat = os.stat(self.path('end.bin'))
+        os.utime(self.path('end.bin'), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        with self.assertRaises(ValueError):
+            self.compare(chunk_size=4, checkpoint_path=checkpoint_path)
+
+    def test_invalid_columns(self):
+        with open(self.path('odd.bin'), 'wb') as file:
+            file.write(b'\x00' * 6)
+        with self.assertRaises(ValueError):
+            out_of_core.MappedColumn.open(self.path('odd.bin'))
+        write_raw(self.path('end.bin'), [0])
+        with self.assertRaises(ValueError):
+            self.compare()
+        with open(self.path('float.npy'), 'wb') as file:
+            file.write(out_of_core.get_npy_header(out_of_core.ColumnFormat('<f8', 'd', 0), 0))
+        with self.assertRaises(ValueError):
+            out_of_core.MappedColumn.open(self.path('float.npy'))
+
+    def test_empty_columns(self):
+        write_raw(self.path('start.bin'), [])
+        write_raw(self.path('end.bin'), [])
+        self.assertEqual(self.compare('compared_start.npy', 'compared_end.npy'), 0)
+        self.assertEqual(read_column(self.path('compared_start.npy')), [])
+
+    def test_main(self):
+        with redirect_stdout(StringIO()) as stdout:
+            out_of_core.main([
+                self.path('start.bin'),
+                self.path('end.bin'),
+                self.path('compared_start.bin'),
+                self.path('compared_end.bin'),
+                '--date-granularity', 'monthly',
+                '--offset', '-1',
+                '--offset-granularity', 'yearly',
+                '--chunk-size', '5',
+                '--checkpoint', self.path('checkpoint.json'),
+            ])
+        self.assertIn('12 rows', stdout.getvalue())
+        self.assert_compared()
+
+    @skipIf(np is None, 'NumPy is not installed')
+    def test_numpy_interoperability(self):
+        np.save(self.path('start.npy'), np.array(self.start_dates, dtype='datetime64[D]'))
+        np.save(self.path('end.npy'), np.array(self.end_dates, dtype='datetime64[D]'))
+        out_of_core.compare_files(
+            self.path('start.npy'),
+            self.path('end.npy'),
+            self.path('compared_start.npy'),
+            self.path('compared_end.npy'),
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+            overflow='null',
+            chunk_size=5,
+        )
+        compared_start_dates = np.load(self.path('compared_start.npy'), mmap_mode='r')
+        self.assertEqual(compared_start_dates.dtype, np.dtype('datetime64[D]'))
+        self.assertEqual(compared_start_dates.tolist(), [compared.start for compared in self.expected])
+        self.assertEqual(np.load(self.path('compared_end.npy')).tolist(), [compared.end for compared in self.expected])
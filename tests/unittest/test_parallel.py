@@ -0,0 +1,295 @@
+import datetime
+from array import array
+from unittest import TestCase
+
+from deloreans.api import get_many as sequential_get_many
+from deloreans.date_utils import (
+    Calendar,
+    DateGranularity,
+    OffsetGranularity,
+)
+from deloreans.parallel import get_many, get_many_ordinal, NULL_ORDINAL
+
+
+class ParallelGetManyTestCase(TestCase):
+
+    def setUp(self) -> None:
+        self.start_dates = [
+            datetime.date(2024, 6, 10),
+            datetime.date(2024, 6, 1),
+            datetime.date(2024, 2, 11),
+            datetime.date(2024, 4, 1),
+        ] * 5
+        self.end_dates = [
+            datetime.date(2024, 6, 16),
+            datetime.date(2024, 6, 30),
+            datetime.date(2024, 2, 24),
+            datetime.date(2024, 6, 30),
+        ] * 5
+        self.date_granularities = [
+            DateGranularity.DAILY,
+            DateGranularity.MONTHLY,
+            DateGranularity.WEEKLY,
+            DateGranularity.MONTHLY,
+        ] * 5
+        self.offsets = [3, -1, -2, -1] * 5
+        self.offset_granularities = [
+            OffsetGranularity.DAILY,
+            OffsetGranularity.YEARLY,
+            OffsetGranularity.MONTHLY,
+            OffsetGranularity.PERIODIC,
+        ] * 5
+        self.firstweekdays = [0, 0, 6, 0] * 5
+
+    def test_get_many_in_process(self):
+        self.assertEqual(
+            get_many(
+                self.start_dates,
+                self.end_dates,
+                self.date_granularities,
+                self.offsets,
+                self.offset_granularities,
+                self.firstweekdays,
+                max_workers=1,
+                chunk_size=3,
+            ),
+            sequential_get_many(
+                self.start_dates,
+                self.end_dates,
+                self.date_granularities,
+                self.offsets,
+                self.offset_granularities,
+                self.firstweekdays,
+            ),
+        )
+
+    def test_get_many_with_calendars(self):
+        calendar = Calendar(6)
+        self.assertEqual(
+            get_many(
+                self.start_dates,
+                self.end_dates,
+                self.date_granularities,
+                self.offsets,
+                self.offset_granularities,
+                [calendar if firstweekday == 6 else firstweekday for firstweekday in self.firstweekdays],
+                max_workers=1,
+                chunk_size=3,
+            ),
+            sequential_get_many(
+                self.start_dates,
+                self.end_dates,
+                self.date_granularities,
+                self.offsets,
+                self.offset_granularities,
+                self.firstweekdays,
+            ),
+        )
+
+    def test_get_many_on_process_pool(self):
+        self.assertEqual(
+            get_many(
+                self.start_dates,
+                self.end_dates,
+                self.date_granularities,
+                self.offsets,
+                self.offset_granularities,
+                self.firstweekdays,
+                max_workers=2,
+                chunk_size=3,
+            ),
+            sequential_get_many(
+                self.start_dates,
+                self.end_dates,
+                self.date_granularities,
+                self.offsets,
+                self.offset_granularities,
+                self.firstweekdays,
+            ),
+        )
+
+    def test_get_many_with_single_combination(self):
+        start_dates = [datetime.date(2024, month, 1) for month in range(1, 13)]
+        end_dates = [datetime.date(2024, month + 1, 1) - datetime.timedelta(days=1) for month in range(1, 12)]
+        end_dates.append(datetime.date(2024, 12, 31))
+        self.assertEqual(
+            get_many(
+                start_dates,
+                end_dates,
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+                max_workers=2,
+                chunk_size=5,
+            ),
+            sequential_get_many(start_dates, end_dates, DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY),
+        )
+
+    def test_get_many_ordinal(self):
+        start_ordinals = [datetime.date(2024, 6, 1).toordinal(), datetime.date(2024, 7, 1).toordinal()]
+        end_ordinals = [datetime.date(2024, 6, 30).toordinal(), datetime.date(2024, 7, 31).toordinal()]
+        compared_start_ordinals, compared_end_ordinals = get_many_ordinal(
+            start_ordinals,
+            end_ordinals,
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(
+            compared_start_ordinals,
+            array('i', [datetime.date(2023, 6, 1).toordinal(), datetime.date(2023, 7, 1).toordinal()]),
+        )
+        self.assertEqual(
+            compared_end_ordinals,
+            array('i', [datetime.date(2023, 6, 30).toordinal(), datetime.date(2023, 7, 31).toordinal()]),
+        )
+
+    def test_get_many_with_overflow_policy(self):
+        start_dates = [datetime.date(2024, 3, 29), datetime.date(2024, 3, 31)] * 3
+        for overflow in ('clamp', 'rollover', 'null'):
+            self.assertEqual(
+                get_many(
+                    start_dates,
+                    start_dates,
+                    DateGranularity.DAILY,
+                    -1,
+                    OffsetGranularity.MONTHLY,
+                    max_workers=2,
+                    chunk_size=2,
+                    overflow=overflow,
+                ),
+                sequential_get_many(
+                    start_dates,
+                    start_dates,
+                    DateGranularity.DAILY,
+                    -1,
+                    OffsetGranularity.MONTHLY,
+                    overflow=overflow,
+                ),
+            )
+
+    def test_get_many_with_null_errors(self):
+        start_dates = [
+            datetime.date(2024, 6, 1),
+            datetime.date(2024, 6, 2),
+            '2024-06-01',
+            datetime.date(2024, 6, 1),
+            datetime.date(2024, 6, 1),
+            datetime.date(2024, 6, 1),
+            datetime.date(2024, 3, 31),
+            datetime.date(2024, 6, 1),
+        ]
+        end_dates = [
+            datetime.date(2024, 6, 30),
+            datetime.date(2024, 6, 30),
+            datetime.date(2024, 6, 30),
+            datetime.date(2024, 6, 30),
+            datetime.date(2024, 6, 30),
+            datetime.date(2024, 6, 30),
+            datetime.date(2024, 3, 31),
+            datetime.date(2024, 6, 30),
+        ]
+        date_granularities = [DateGranularity.MONTHLY] * 6 + [DateGranularity.DAILY, DateGranularity.MONTHLY]
+        offsets = [-1, -1, -1, -1.0, -1, -1, -1, -1]
+        offset_granularities = [OffsetGranularity.YEARLY] * 4 + [
+            OffsetGranularity.DAILY,
+            OffsetGranularity.YEARLY,
+            OffsetGranularity.MONTHLY,
+            OffsetGranularity.YEARLY,
+        ]
+        firstweekdays = [0, 0, 0, 0, 0, 0.0, 0, 0]
+        arguments = (start_dates, end_dates, date_granularities, offsets, offset_granularities, firstweekdays)
+        expected = [(datetime.date(2023, 6, 1), datetime.date(2023, 6, 30))] + [None] * 6 + [
+            (datetime.date(2023, 6, 1), datetime.date(2023, 6, 30)),
+        ]
+        for max_workers in (1, 2):
+            self.assertEqual(
+                get_many(*arguments, max_workers=max_workers, chunk_size=3, errors='null'),
+                expected,
+            )
+        self.assertEqual(sequential_get_many(*arguments, errors='null'), expected)
+        self.assertEqual(
+            get_many([datetime.date(2024, 6, 1)], [None], DateGranularity.MONTHLY, -1, OffsetGranularity.DAILY, errors='null'),  # NOQA
+            [None],
+        )
+        with self.assertRaises(ValueError):
+            get_many(*arguments, errors='ignore')
+
+    def test_get_many_ordinal_with_null_errors(self):
+        june_1 = datetime.date(2024, 6, 1).toordinal()
+        compared_start_ordinals, compared_end_ordinals = get_many_ordinal(
+            [june_1, 1.5, 0, june_1],
+            [june_1, june_1, june_1, june_1],
+            DateGranularity.DAILY,
+            [1, 1, 1, 2 ** 63],
+            OffsetGranularity.DAILY,
+            errors='null',
+        )
+        self.assertEqual(compared_start_ordinals, array('i', [june_1 + 1, NULL_ORDINAL, NULL_ORDINAL, NULL_ORDINAL]))
+        self.assertEqual(compared_end_ordinals, array('i', [june_1 + 1, NULL_ORDINAL, NULL_ORDINAL, NULL_ORDINAL]))
+
+    def test_get_many_with_equal_firstweekdays_of_different_types(self):
+        with self.assertRaises(TypeError):
+            get_many(
+                [datetime.date(2024, 6, 1)] * 2,
+                [datetime.date(2024, 6, 30)] * 2,
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+                [0, 0.0],
+            )
+
+    def test_get_many_empty(self):
+        self.assertEqual(get_many([], [], DateGranularity.DAILY, 1, OffsetGranularity.DAILY), [])
+
+    def test_invalid_row_on_process_pool(self):
+        end_dates = list(self.end_dates)
+        end_dates[-1] = datetime.date(2024, 6, 29)
+        with self.assertRaises(ValueError):
+            get_many(
+                self.start_dates,
+                end_dates,
+                self.date_granularities,
+                self.offsets,
+                self.offset_granularities,
+                self.firstweekdays,
+                max_workers=2,
+                chunk_size=3,
+            )
+
+    def test_invalid_types(self):
+        with self.assertRaises(TypeError):
+            get_many(['2024-06-01'], [datetime.date(2024, 6, 1)], DateGranularity.DAILY, 1, OffsetGranularity.DAILY)
+        with self.assertRaises(TypeError):
+            get_many([datetime.date(2024, 6, 1)], [datetime.date(2024, 6, 1)], DateGranularity.DAILY, ['1'], OffsetGranularity.DAILY)  # NOQA
+        with self.assertRaises(TypeError):
+            get_many_ordinal([1.5], [2], DateGranularity.DAILY, 1, OffsetGranularity.DAILY)
+        with self.assertRaises(ValueError):
+            get_many_ordinal([0], [2], DateGranularity.DAILY, 1, OffsetGranularity.DAILY)
+
+    def test_inconsistent_columns(self):
+        with self.assertRaises(ValueError):
+            get_many(
+                [datetime.date(2024, 6, 1), datetime.date(2024, 6, 2)],
+                [datetime.date(2024, 6, 1)],
+                DateGranularity.DAILY,
+                1,
+                OffsetGranularity.DAILY,
+            )
+        with self.assertRaises(ValueError):
+            get_many(
+                [datetime.date(2024, 6, 1)],
+                [datetime.date(2024, 6, 1)],
+                [DateGranularity.DAILY, DateGranularity.DAILY],
+                1,
+                OffsetGranularity.DAILY,
+            )
+
+    def test_invalid_workers_and_chunk_size(self):
+        args = ([datetime.date(2024, 6, 1)], [datetime.date(2024, 6, 1)], DateGranularity.DAILY, 1, OffsetGranularity.DAILY)  # NOQA
+        with self.assertRaises(ValueError):
+            get_many(*args, max_workers=0)
+        with self.assertRaises(TypeError):
+            get_many(*args, max_workers='2')
+        with self.assertRaises(ValueError):
+            get_many(*args, chunk_size=0)
@@ -0,0 +1,120 @@
+import datetime
+import pickle
+from unittest import TestCase
+
+from deloreans.api import compile, get
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+    VALID_GRAINS_COMB,
+)
+from deloreans.plan import ComparisonPlan
+
+
+class ComparisonPlanTestCase(TestCase):
+
+    def test_plan(self):
+        plan = compile(DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)
+        self.assertEqual(
+            plan(datetime.date(2024, 6, 1), datetime.date(2024, 6, 30)),
+            (datetime.date(2023, 6, 1), datetime.date(2023, 6, 30)),
+        )
+        self.assertEqual(
+            plan(datetime.date(2024, 2, 1), datetime.date(2024, 3, 31)),
+            (datetime.date(2023, 2, 1), datetime.date(2023, 3, 31)),
+        )
+
+    def test_consistent_with_get(self):
+        start_dates = [datetime.date(2023, 12, 1) + datetime.timedelta(days=i) for i in range(400)]
+        for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+            for offset_granularity in offset_granularities:
+                for firstweekday in (0, 6):
+                    plan = compile(date_granularity, -2, offset_granularity, firstweekday)
+                    for start_date in start_dates:
+                        try:
+                            end_date = date_granularity.get_end_date(start_date, 2, firstweekday)
+                            expected = get(
+                                start_date,
+                                end_date,
+                                date_granularity,
+                                -2,
+                                offset_granularity,
+                                firstweekday,
+                            )
+                        except ValueError:
+                            continue
+                        self.assertEqual(plan(start_date, end_date), expected)
+                        self.assertEqual(
+                            plan.get_ordinal(start_date.toordinal(), end_date.toordinal()),
+                            (expected[0].toordinal(), expected[1].toordinal()),
+                        )
+
+    def test_plan_with_partial_date_range(self):
+        plan = compile(DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)
+        with self.assertRaises(ValueError):
+            plan(datetime.date(2024, 6, 2), datetime.date(2024, 6, 30))
+        with self.assertRaises(ValueError):
+            plan.get_ordinal(
+                datetime.date(2024, 6, 2).toordinal(),
+                datetime.date(2024, 6, 30).toordinal(),
+            )
+
+    def test_plan_with_invalid_date_type(self):
+        plan = compile(DateGranularity.MONTHLY, -1, OffsetGranularity.YEARLY)
+        with self.assertRaises(TypeError):
+            plan('2024-06-01', '2024-06-30')  # NOQA
+
+    def test_plan_with_overflow(self):
+        plan = compile(DateGranularity.DAILY, -1, OffsetGranularity.YEARLY)
+        with self.assertRaises(ValueError):
+            plan(datetime.date(2024, 12, 31), datetime.date(2024, 12, 31))
+
+    def test_plan_with_overflow_policy(self):
+        plan = compile(DateGranularity.DAILY, -1, OffsetGranularity.YEARLY, overflow='clamp')
+        self.assertEqual(
+            plan(datetime.date(2024, 12, 31), datetime.date(2024, 12, 31)),
+            (datetime.date(2023, 12, 31), datetime.date(2023, 12, 31)),
+        )
+        self.assertNotEqual(plan, compile(DateGranularity.DAILY, -1, OffsetGranularity.YEARLY))
+        self.assertEqual(pickle.loads(pickle.dumps(plan)), plan)
+        self.assertIsNone(
+            compile(DateGranularity.DAILY, -1, OffsetGranularity.YEARLY, overflow='null').get_ordinal(
+                datetime.date(2024, 12, 31).toordinal(),
+                datetime.date(2024, 12, 31).toordinal(),
+            )
+        )
+
+    def test_compile_with_unsupported_combo(self):
+        with self.assertRaises(ValueError):
+            compile(DateGranularity.MONTHLY, -1, OffsetGranularity.DAILY)
+
+    def test_compile_with_invalid_offset(self):
+        with self.assertRaises(TypeError):
+            compile(DateGranularity.MONTHLY, '-1', OffsetGranularity.YEARLY)  # NOQA
+
+    def test_hashable(self):
+        plan = compile(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY, 6)
+        same_plan = ComparisonPlan(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY, 6)
+        another_plan = ComparisonPlan(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY)
+        self.assertEqual(plan, same_plan)
+        self.assertNotEqual(plan, another_plan)
+        self.assertEqual(len({plan, same_plan, another_plan}), 2)
+
+    def test_immutable(self):
+        plan = compile(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY, 6)
+        with self.assertRaises(AttributeError):
+            plan._offset = -2
+        with self.assertRaises(AttributeError):
+            plan.extra = 1
+        with self.assertRaises(AttributeError):
+            del plan._overflow
+        self.assertFalse(hasattr(plan, '__dict__'))
+
+    def test_picklable(self):
+        plan = compile(DateGranularity.WEEKLY, -1, OffsetGranularity.YEARLY, 6)
+        unpickled_plan = pickle.loads(pickle.dumps(plan))
+        self.assertEqual(unpickled_plan, plan)
+        self.assertEqual(
+            unpickled_plan(datetime.date(2023, 12, 31), datetime.date(2024, 3, 30)),
+            plan(datetime.date(2023, 12, 31), datetime.date(2024, 3, 30)),
+        )
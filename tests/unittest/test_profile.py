@@ -0,0 +1,57 @@
+import os
+import pstats
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from unittest import TestCase
+
+from deloreans import profile
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+    VALID_GRAINS_COMB,
+)
+
+
+class ProfileTestCase(TestCase):
+
+    def test_make_workload(self):
+        for date_granularity in DateGranularity:
+            workload = profile.make_workload(date_granularity, 30)
+            self.assertEqual(len(workload), 30)
+            for start_date, end_date, offset, firstweekday in workload:
+                # each row is a complete date range
+                date_granularity.get_end_date(start_date, 1, firstweekday)
+                self.assertLessEqual(start_date, end_date)
+
+    def test_make_workload_bounds(self):
+        workload = profile.make_workload(DateGranularity.YEARLY, 15992)
+        self.assertEqual(workload[-1][1], profile.WORKLOAD_END_DATE)
+        for rows in (0, 15993):
+            with self.assertRaises(ValueError):
+                profile.make_workload(DateGranularity.YEARLY, rows)
+
+    def test_profile_combination(self):
+        for entry_point in ('get', 'get_many', 'plan'):
+            profiler = profile.profile_combination(DateGranularity.WEEKLY, OffsetGranularity.YEARLY, 20, entry_point)
+            self.assertIn('Ordered by: cumulative time', profile.get_summary(profiler, top=5))
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with redirect_stdout(StringIO()):
+                profile.main(['--rows', '10', '--top', '5', '--sort', 'tottime', '--output-dir', output_dir])
+            amount = sum(len(offset_granularities) for offset_granularities in VALID_GRAINS_COMB.values())
+            pstats_files = [name for name in os.listdir(output_dir) if name.endswith('.pstats')]
+            self.assertEqual(len(pstats_files), amount)
+            self.assertIn('monthly_yearly.pstats', pstats_files)
+            pstats.Stats(os.path.join(output_dir, 'monthly_yearly.pstats'))
+            with open(os.path.join(output_dir, 'summary.txt')) as file:
+                summary = file.read()
+            self.assertEqual(summary.count('Ordered by: internal time'), amount)
+
+    def test_invalid_rows(self):
+        for rows in ('0', '60000'):
+            with redirect_stderr(StringIO()) as stderr, self.assertRaises(SystemExit) as context:
+                profile.main(['--rows', rows])
+            self.assertEqual(context.exception.code, 2)
+            self.assertIn('argument --rows', stderr.getvalue())
@@ -0,0 +1,118 @@
+import datetime
+from array import array
+from unittest import TestCase
+
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+)
+from deloreans.validation import ErrorCode, validate_many
+
+
+class ValidateManyTestCase(TestCase):
+
+    def test_validate_many(self):
+        error_codes = validate_many(
+            [
+                datetime.date(2024, 6, 1),
+                '2024-06-01',
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 30),
+                datetime.date(2024, 6, 2),
+                datetime.date(2024, 6, 9),
+                datetime.date(2024, 6, 1),
+            ],
+            [
+                datetime.date(2024, 6, 30),
+                datetime.date(2024, 6, 30),
+                datetime.date(2024, 6, 30),
+                datetime.date(2024, 6, 30),
+                datetime.date(2024, 6, 1),
+                datetime.date(2024, 6, 30),
+                datetime.date(2024, 6, 15),
+                datetime.date(2024, 6, 30),
+            ],
+            [
+                DateGranularity.MONTHLY,
+                DateGranularity.MONTHLY,
+                DateGranularity.MONTHLY,
+                DateGranularity.MONTHLY,
+                DateGranularity.DAILY,
+                DateGranularity.MONTHLY,
+                DateGranularity.WEEKLY,
+                'monthly',
+            ],
+            -1,
+            [
+                OffsetGranularity.YEARLY,
+                OffsetGranularity.YEARLY,
+                OffsetGranularity.DAILY,
+                OffsetGranularity.YEARLY,
+                OffsetGranularity.YEARLY,
+                OffsetGranularity.YEARLY,
+                OffsetGranularity.YEARLY,
+                OffsetGranularity.YEARLY,
+            ],
+            [0, 0, 0, 7, 0, 0, 6, 0],
+        )
+        self.assertEqual(
+            list(error_codes),
+            [
+                ErrorCode.OK,
+                ErrorCode.INVALID_TYPE,
+                ErrorCode.UNSUPPORTED_COMBO,
+                ErrorCode.INVALID_FIRSTWEEKDAY,
+                ErrorCode.INVALID_DATE_RANGE,
+                ErrorCode.PARTIAL_DATE_RANGE,
+                ErrorCode.OK,
+                ErrorCode.INVALID_TYPE,
+            ],
+        )
+
+    def test_validate_many_with_invalid_offset_type(self):
+        self.assertEqual(
+            validate_many(
+                [datetime.date(2024, 6, 1)],
+                [datetime.date(2024, 6, 30)],
+                DateGranularity.MONTHLY,
+                ['-1'],
+                OffsetGranularity.YEARLY,
+            ),
+            array('B', [ErrorCode.INVALID_TYPE]),
+        )
+
+    def test_validate_many_with_unhashable_combo(self):
+        self.assertEqual(
+            validate_many(
+                [datetime.date(2024, 6, 1)],
+                [datetime.date(2024, 6, 30)],
+                [[DateGranularity.MONTHLY]],
+                -1,
+                OffsetGranularity.YEARLY,
+            ),
+            array('B', [ErrorCode.INVALID_TYPE]),
+        )
+
+    def test_validate_many_with_equal_firstweekdays_of_different_types(self):
+        self.assertEqual(
+            validate_many(
+                [datetime.date(2024, 6, 1)] * 4,
+                [datetime.date(2024, 6, 30)] * 4,
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+                [0, 0.0, 0, 0.0],
+            ),
+            array('B', [ErrorCode.OK, ErrorCode.INVALID_TYPE, ErrorCode.OK, ErrorCode.INVALID_TYPE]),
+        )
+
+    def test_validate_many_with_inconsistent_columns(self):
+        with self.assertRaises(ValueError):
+            validate_many(
+                [datetime.date(2024, 6, 1)],
+                [],
+                DateGranularity.DAILY,
+                1,
+                OffsetGranularity.DAILY,
+            )
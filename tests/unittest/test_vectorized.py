@@ -0,0 +1,259 @@
+import datetime
+from unittest import skipIf, TestCase
+
+import deloreans
+from deloreans.date_utils import (
+    DateGranularity,
+    OffsetGranularity,
+    VALID_GRAINS_COMB,
+)
+
+try:
+    import numpy as np
+    from deloreans import vectorized
+except ImportError:  # pragma: no cover
+    np = None
+
+
+SAMPLE_START_DATE = datetime.date(2019, 12, 1)
+SAMPLE_DAYS = 800
+
+
+def get_sample_date_ranges(date_granularity, firstweekday):
+    """
+    complete date ranges of given granularity, with 1 and 3 periods
+    """
+    date_ranges = []
+    for i in range(SAMPLE_DAYS):
+        start_date = SAMPLE_START_DATE + datetime.timedelta(days=i)
+        try:
+            date_granularity.get_end_date(start_date, 1, firstweekday)
+        except ValueError:
+            continue
+        for length in (1, 3):
+            end_date = date_granularity.get_end_date(start_date, length, firstweekday)
+            date_ranges.append((start_date, end_date))
+    return date_ranges
+
+
+def get_expected(date_ranges, date_granularity, offset, offset_granularity, firstweekday):
+    expected = []
+    for start_date, end_date in date_ranges:
+        try:
+            expected.append(deloreans.get(
+                start_date,
+                end_date,
+                date_granularity,
+                offset,
+                offset_granularity,
+                firstweekday,
+            ))
+        except ValueError:
+            expected.append(None)
+    return expected
+
+
+@skipIf(np is None, 'NumPy is not installed')
+class VectorizedGetTestCase(TestCase):
+
+    def test_consistent_with_scalar_get(self):
+        for date_granularity, offset_granularities in VALID_GRAINS_COMB.items():
+            for offset_granularity in offset_granularities:
+                for firstweekday in (0, 3, 6):
+                    date_ranges = get_sample_date_ranges(date_granularity, firstweekday)
+                    for offset in (-1, 2):
+                        expected = get_expected(
+                            date_ranges,
+                            date_granularity,
+                            offset,
+                            offset_granularity,
+                            firstweekday,
+                        )
+                        valid_date_ranges = [
+                            date_range for date_range, result in zip(date_ranges, expected)
+                            if result is not None
+                        ]
+                        start_dates, end_dates = (
+                            np.array(list(dates), dtype='datetime64[D]')
+                            for dates in zip(*valid_date_ranges)
+                        )
+                        compared_start_dates, compared_end_dates = vectorized.get(
+                            start_dates,
+                            end_dates,
+                            date_granularity,
+                            offset,
+                            offset_granularity,
+                            firstweekday,
+                        )
+                        self.assertEqual(
+                            list(zip(compared_start_dates.tolist(), compared_end_dates.tolist())),
+                            [result for result in expected if result is not None],
+                            msg=f'{date_granularity} {offset_granularity} {offset} {firstweekday}',
+                        )
+
+    def test_get_with_day_numbers(self):
+        start_days = np.array([
+            datetime.date(2024, 6, 1).toordinal() - vectorized.EPOCH_ORDINAL,
+        ])
+        end_days = np.array([
+            datetime.date(2024, 6, 30).toordinal() - vectorized.EPOCH_ORDINAL,
+        ])
+        compared_start_days, compared_end_days = vectorized.get(
+            start_days,
+            end_days,
+            DateGranularity.MONTHLY,
+            -1,
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(
+            compared_start_days.tolist(),
+            [datetime.date(2023, 6, 1).toordinal() - vectorized.EPOCH_ORDINAL],
+        )
+        self.assertEqual(
+            compared_end_days.tolist(),
+            [datetime.date(2023, 6, 30).toordinal() - vectorized.EPOCH_ORDINAL],
+        )
+
+    def test_get_with_offsets_array(self):
+        compared_start_dates, compared_end_dates = vectorized.get(
+            np.array(['2024-06-01'] * 3, dtype='datetime64[D]'),
+            np.array(['2024-06-30'] * 3, dtype='datetime64[D]'),
+            DateGranularity.MONTHLY,
+            np.array([-1, -2, -3]),
+            OffsetGranularity.YEARLY,
+        )
+        self.assertEqual(
+            compared_start_dates.tolist(),
+            [datetime.date(2023, 6, 1), datetime.date(2022, 6, 1), datetime.date(2021, 6, 1)],
+        )
+
+    def test_get_periodic_with_given_firstweekday(self):
+        # the length of Sunday-started weeks is measured by the weeks starting on Sunday
+        compared_start_dates, compared_end_dates = vectorized.get(
+            np.array(['2024-06-02', '2024-06-02'], dtype='datetime64[D]'),
+            np.array(['2024-06-08', '2024-06-15'], dtype='datetime64[D]'),
+            DateGranularity.WEEKLY,
+            -1,
+            OffsetGranularity.PERIODIC,
+            6,
+        )
+        self.assertEqual(compared_start_dates.tolist(), [datetime.date(2024, 5, 26), datetime.date(2024, 5, 19)])
+        self.assertEqual(compared_end_dates.tolist(), [datetime.date(2024, 6, 1), datetime.date(2024, 6, 1)])
+
+    def test_get_with_partial_date_range(self):
+        with self.assertRaises(ValueError):
+            vectorized.get(
+                np.array(['2024-06-01', '2024-06-02'], dtype='datetime64[D]'),
+                np.array(['2024-06-30', '2024-06-30'], dtype='datetime64[D]'),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+
+    def test_get_with_reversed_date_range(self):
+        with self.assertRaises(ValueError):
+            vectorized.get(
+                np.array(['2024-06-30'], dtype='datetime64[D]'),
+                np.array(['2024-06-01'], dtype='datetime64[D]'),
+                DateGranularity.DAILY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+
+    def test_get_with_overflow_index(self):
+        with self.assertRaises(ValueError):
+            vectorized.get(
+                np.array(['2024-12-31'], dtype='datetime64[D]'),
+                np.array(['2024-12-31'], dtype='datetime64[D]'),
+                DateGranularity.DAILY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+
+    def test_get_with_overflow_policy(self):
+        start_dates = np.array(['2024-12-30', '2024-12-31'], dtype='datetime64[D]')
+        for overflow in ('clamp', 'rollover'):
+            compared_start_dates, compared_end_dates = vectorized.get(
+                start_dates,
+                start_dates,
+                DateGranularity.DAILY,
+                -1,
+                OffsetGranularity.YEARLY,
+                overflow=overflow,
+            )
+            expected = [
+                deloreans.get(start_date, start_date, DateGranularity.DAILY, -1, OffsetGranularity.YEARLY, 0, overflow)
+                for start_date in start_dates.astype(datetime.date)
+            ]
+            self.assertEqual(
+                list(zip(compared_start_dates.astype(datetime.date), compared_end_dates.astype(datetime.date))),
+                expected,
+            )
+
+        compared_start_dates, compared_end_dates = vectorized.get(
+            start_dates,
+            start_dates,
+            DateGranularity.DAILY,
+            -1,
+            OffsetGranularity.YEARLY,
+            overflow='null',
+        )
+        self.assertEqual(compared_start_dates[0], np.datetime64('2023-12-31'))
+        self.assertTrue(np.isnat(compared_start_dates[1]))
+        self.assertTrue(np.isnat(compared_end_dates[1]))
+
+    def test_get_weekly_with_overflow_policy(self):
+        for firstweekday in (0, 6):
+            for overflow in ('clamp', 'rollover', 'null'):
+                date_ranges = get_sample_date_ranges(DateGranularity.WEEKLY, firstweekday)
+                compared_start_dates, compared_end_dates = vectorized.get(
+                    np.array([start_date for start_date, _ in date_ranges], dtype='datetime64[D]'),
+                    np.array([end_date for _, end_date in date_ranges], dtype='datetime64[D]'),
+                    DateGranularity.WEEKLY,
+                    -1,
+                    OffsetGranularity.MONTHLY,
+                    firstweekday,
+                    overflow,
+                )
+                for (start_date, end_date), compared_start_date, compared_end_date in zip(
+                    date_ranges,
+                    compared_start_dates,
+                    compared_end_dates,
+                ):
+                    expected = deloreans.get(
+                        start_date,
+                        end_date,
+                        DateGranularity.WEEKLY,
+                        -1,
+                        OffsetGranularity.MONTHLY,
+                        firstweekday,
+                        overflow,
+                    )
+                    if expected is None:
+                        self.assertTrue(np.isnat(compared_start_date))
+                        continue
+                    self.assertEqual(
+                        (compared_start_date.astype(datetime.date), compared_end_date.astype(datetime.date)),
+                        expected,
+                        msg=f'{start_date} {end_date} {firstweekday} {overflow}',
+                    )
+
+    def test_get_with_invalid_date_type(self):
+        with self.assertRaises(TypeError):
+            vectorized.get(
+                np.array(['2024-06-01']),
+                np.array(['2024-06-30']),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.YEARLY,
+            )
+
+    def test_get_with_unsupported_combo(self):
+        with self.assertRaises(ValueError):
+            vectorized.get(
+                np.array(['2024-06-01'], dtype='datetime64[D]'),
+                np.array(['2024-06-30'], dtype='datetime64[D]'),
+                DateGranularity.MONTHLY,
+                -1,
+                OffsetGranularity.DAILY,
+            )